@@ -0,0 +1,269 @@
+"""
+Re-runs the benchmark cases of a stored baseline and flags the stages whose time or memory
+regressed, and the cases whose solver status or cost changed.
+
+Example:
+    python -m benchmarks.run --memory --repeat 5 --output baseline.json
+    python -m benchmarks.compare baseline.json --repeat 5 --time-tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+
+from benchmarks.run import run_repeated, to_environment
+from benchmarks.workloads import WORKLOADS
+
+
+# scales the median absolute deviation to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
+
+# fewer runs do not give a median and MAD robust against a single outlier
+MIN_REPEAT = 5
+
+
+def to_robust_statistics(samples: list[float]):
+    median = statistics.median(samples)
+
+    return {
+        'median': median,
+        'mad': MAD_SCALE * statistics.median(abs(sample - median) for sample in samples),
+        'n': len(samples),
+    }
+
+
+def compare_samples(
+    baseline: list[float],
+    current: list[float],
+    tolerance: float,
+    n_mad: float,
+    minimum: float,
+    noise_floor: float = 0.0,
+):
+    """
+    A measure regressed if its median increased by more than the relative tolerance, by more than
+    the noise, and by more than the minimum absolute change. The noise is n_mad scaled median
+    absolute deviations of the noisier of both runs, but at least the relative noise floor of the
+    baseline median, as the MAD of few runs underestimates the run-to-run variation.
+    """
+
+    baseline_statistics = to_robust_statistics(baseline)
+    current_statistics = to_robust_statistics(current)
+
+    change = current_statistics['median'] - baseline_statistics['median']
+    noise = max(
+        n_mad * max(baseline_statistics['mad'], current_statistics['mad']),
+        noise_floor * baseline_statistics['median'],
+    )
+
+    regressed = (
+        change > tolerance * baseline_statistics['median']
+        and change > noise
+        and change > minimum
+    )
+
+    if 0 < baseline_statistics['median']:
+        ratio = current_statistics['median'] / baseline_statistics['median']
+    else:
+        ratio = None
+
+    return {
+        'baseline': baseline_statistics,
+        'current': current_statistics,
+        'ratio': ratio,
+        'regressed': bool(regressed),
+    }
+
+
+def compare_solutions(baseline: dict, current: dict, cost_tolerance: float):
+    """
+    The solution of a case changed if the solver status or the optimality changed, or if the
+    cost differs by more than the relative cost tolerance.
+    """
+
+    status_changed = (
+        baseline['status'] != current['status']
+        or baseline.get('is_optimal') != current.get('is_optimal')
+    )
+
+    baseline_cost = baseline.get('cost')
+    current_cost = current.get('cost')
+
+    if baseline_cost is None or current_cost is None:
+        cost_changed = baseline_cost is not current_cost
+    else:
+        cost_changed = cost_tolerance * max(1.0, abs(baseline_cost)) < abs(current_cost - baseline_cost)
+
+    return {
+        'baseline': {'status': baseline['status'], 'is_optimal': baseline.get('is_optimal'), 'cost': baseline_cost},
+        'current': {'status': current['status'], 'is_optimal': current.get('is_optimal'), 'cost': current_cost},
+        'status_changed': status_changed,
+        'cost_changed': cost_changed,
+    }
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    time_tolerance: float = 0.1,
+    memory_tolerance: float = 0.1,
+    n_mad: float = 3.0,
+    time_noise_floor: float = 0.15,
+    min_time: float = 1e-2,
+    min_bytes: int = 64 * 1024,
+    cost_tolerance: float = 1e-4,
+):
+    """
+    Compares the stage samples of a baseline result with the ones of the re-run case, and the
+    solver status and cost of both. Stages that only exist in either of the results are reported
+    but not compared.
+    """
+
+    # the memory of a stage is deterministic up to the allocations of the interpreter
+    tolerances = {
+        'time': (time_tolerance, min_time, time_noise_floor),
+        'peak_bytes': (memory_tolerance, min_bytes, 0.0),
+        'retained_bytes': (memory_tolerance, min_bytes, 0.0),
+    }
+
+    baseline_samples = baseline['samples']
+    current_samples = current['samples']
+
+    stages = {}
+    for name in baseline_samples.keys() & current_samples.keys():
+        measures = {}
+        for measure in baseline_samples[name].keys() & current_samples[name].keys():
+            tolerance, minimum, noise_floor = tolerances[measure]
+
+            measures[measure] = compare_samples(
+                baseline=baseline_samples[name][measure],
+                current=current_samples[name][measure],
+                tolerance=tolerance,
+                n_mad=n_mad,
+                minimum=minimum,
+                noise_floor=noise_floor,
+            )
+
+        stages[name] = measures
+
+    solution = compare_solutions(baseline, current, cost_tolerance=cost_tolerance)
+
+    def gen_solution_regressions():
+        if solution['status_changed']:
+            yield 'status'
+
+        if solution['cost_changed']:
+            yield 'cost'
+
+    return {
+        'workload': baseline['workload'],
+        'params': baseline['params'],
+        'stages': stages,
+        'solution': solution,
+        'missing_stages': sorted(baseline_samples.keys() - current_samples.keys()),
+        'new_stages': sorted(current_samples.keys() - baseline_samples.keys()),
+        'regressions': sorted(
+            f'{name}.{measure}'
+            for name, measures in stages.items()
+            for measure, comparison in measures.items()
+            if comparison['regressed']
+        ) + list(gen_solution_regressions()),
+    }
+
+
+def compare_with_baseline(
+    baseline: dict,
+    repeat: int = 5,
+    **tolerances,
+):
+    """
+    Re-runs each case of the baseline with the solver and memory setting of the baseline, and
+    compares the samples of each stage. Both the baseline and the re-run need at least
+    `MIN_REPEAT` runs of each case.
+    """
+
+    if repeat < MIN_REPEAT:
+        raise ValueError(f'At least {MIN_REPEAT} runs of each case are required, got {repeat}.')
+
+    if short := tuple(result for result in baseline['results'] if result['repeat'] < MIN_REPEAT):
+        raise ValueError(
+            f'The baseline has fewer than {MIN_REPEAT} runs of the cases '
+            + ', '.join(f"{result['workload']} {result['params']}" for result in short)
+            + '.'
+        )
+
+    comparisons = []
+
+    for baseline_result in baseline['results']:
+        workload = WORKLOADS[baseline_result['workload']]
+
+        current_result = run_repeated(
+            workload,
+            baseline_result['params'],
+            repeat=repeat,
+            solver=baseline_result['solver'],
+            memory=baseline['memory'],
+        )
+
+        comparison = compare_results(baseline_result, current_result, **tolerances)
+        comparisons.append(comparison)
+
+        for regression in comparison['regressions']:
+            print(f"{comparison['workload']} {comparison['params']}: {regression} regressed", file=sys.stderr)
+
+    return {
+        'environment': to_environment(),
+        'baseline_environment': baseline['environment'],
+        'repeat': repeat,
+        'comparisons': comparisons,
+        'regressed': any(comparison['regressions'] for comparison in comparisons),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compares the sosopt benchmarks with a stored baseline.')
+    parser.add_argument('baseline', help='JSON file written by benchmarks.run')
+    parser.add_argument('--repeat', type=int, default=MIN_REPEAT, help=f'number of runs of each case, at least {MIN_REPEAT}')
+    parser.add_argument('--time-tolerance', type=float, default=0.1, help='relative increase of the median time')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1, help='relative increase of the median memory')
+    parser.add_argument('--n-mad', type=float, default=3.0, help='increase relative to the noise in scaled MADs')
+    parser.add_argument('--time-noise-floor', type=float, default=0.15, help='minimum relative noise of the time')
+    parser.add_argument('--min-time', type=float, default=1e-2, help='minimum absolute increase in seconds')
+    parser.add_argument('--min-bytes', type=int, default=64 * 1024, help='minimum absolute increase in bytes')
+    parser.add_argument('--cost-tolerance', type=float, default=1e-4, help='relative change of the cost')
+    parser.add_argument('--output', default=None, help='JSON file of the report, standard output if not given')
+    args = parser.parse_args(argv)
+
+    if args.repeat < MIN_REPEAT:
+        parser.error(f'--repeat must be at least {MIN_REPEAT}')
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    report = compare_with_baseline(
+        baseline,
+        repeat=args.repeat,
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+        n_mad=args.n_mad,
+        time_noise_floor=args.time_noise_floor,
+        min_time=args.min_time,
+        min_bytes=args.min_bytes,
+        cost_tolerance=args.cost_tolerance,
+    )
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    # a nonzero exit code fails the CI job
+    return 1 if report['regressed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Runs the benchmark workloads and writes the results as JSON.
+
+Example:
+    python -m benchmarks.run --workloads lyapunov motzkin --memory --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+
+import cvxopt
+import scipy.sparse
+
+import sosopt
+from sosopt.profiling import stage
+from sosopt.solvers.solveargs import SolverArgs
+from sosopt.utils.toquadraticsize import to_quadratic_size
+
+from benchmarks.workloads import WORKLOADS, Workload
+
+
+SOLVERS = {
+    'cvxopt': lambda: sosopt.cvxopt_solver,
+    'mosek': lambda: sosopt.mosek_solver,
+}
+
+
+def to_problem_size(solver_args: SolverArgs):
+    def to_nnz(array):
+        return int(scipy.sparse.csc_array(array[1]).nnz)
+
+    constraints = (
+        solver_args.nonneg_orthant
+        + solver_args.second_order_cone
+        + solver_args.semidef_cone
+        + solver_args.equality
+    )
+
+    return {
+        'n_var': solver_args.n_var,
+        'n_nonneg_orthant': sum(array.n_eq for array in solver_args.nonneg_orthant),
+        'second_order_cone_sizes': [array.n_eq for array in solver_args.second_order_cone],
+        'semidef_cone_sizes': [to_quadratic_size(array.n_eq) for array in solver_args.semidef_cone],
+        'n_equality': sum(array.n_eq for array in solver_args.equality),
+        'nnz': sum(to_nnz(array) for array in constraints),
+    }
+
+
+def run_case(
+    workload: Workload,
+    params: dict,
+    solver: str = 'cvxopt',
+    memory: bool = False,
+):
+    """
+    Defines, compiles and solves the SOS problem of a workload case on a fresh state, and
+    returns the stage summaries, the problem size and the solver status.
+    """
+
+    # the progress log of CVXOPT is written to standard output, where it would be mixed with the JSON results
+    cvxopt.solvers.options['show_progress'] = False
+
+    state = sosopt.init_state(sparse_smr=workload.sparse_smr)
+
+    start = time.perf_counter()
+
+    with sosopt.profile(memory=memory) as profiler:
+        with stage('define'):
+            state, problem = workload.define(state, **params)
+
+        problem = problem.copy(solver=SOLVERS[solver]())
+
+        state, conic_problem = problem.to_conic_problem().apply(state)
+        state, solver_args = conic_problem.to_solver_args().apply(state)
+        state, result = conic_problem.solve(solver_args=solver_args).apply(state)
+
+    duration = time.perf_counter() - start
+
+    profile = profiler.to_profile()
+    solver_data = result.solver_data
+
+    return {
+        'workload': workload.name,
+        'params': params,
+        'solver': solver,
+        'time': duration,
+        'size': to_problem_size(solver_args),
+        'status': str(solver_data.status),
+        'is_optimal': solver_data.is_optimal,
+        'cost': solver_data.cost if solver_data.is_successful else None,
+        'stages': profile.to_stage_summary(),
+        'constraints': profile.to_constraint_summary(),
+    }
+
+
+def run_repeated(
+    workload: Workload,
+    params: dict,
+    repeat: int = 1,
+    solver: str = 'cvxopt',
+    memory: bool = False,
+):
+    """
+    Runs a workload case repeatedly, and returns the result of the first run with the per-run
+    samples of each stage, and the stage summaries replaced by their medians over all runs.
+    """
+
+    results = tuple(run_case(workload, params, solver=solver, memory=memory) for _ in range(repeat))
+
+    stage_names = tuple(dict.fromkeys(name for result in results for name in result['stages']))
+    measures = ('time', 'peak_bytes', 'retained_bytes') if memory else ('time',)
+
+    # a stage not recorded in a run contributes zero
+    samples = {
+        name: {
+            measure: [result['stages'].get(name, {}).get(measure, 0) for result in results]
+            for measure in measures
+        }
+        for name in stage_names
+    }
+
+    stages = {
+        name: {'count': results[0]['stages'].get(name, {}).get('count', 0)} | {
+            measure: statistics.median(values) for measure, values in stage_samples.items()
+        }
+        for name, stage_samples in samples.items()
+    }
+
+    return results[0] | {
+        'time': statistics.median(result['time'] for result in results),
+        'repeat': repeat,
+        'stages': stages,
+        'samples': samples,
+    }
+
+
+def to_environment():
+    def to_version(package: str):
+        try:
+            return importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            return None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': sys.version,
+        'platform': platform.platform(),
+        'versions': {
+            package: to_version(package)
+            for package in ('sosopt', 'polymat', 'numpy', 'scipy', 'cvxopt', 'mosek')
+        },
+    }
+
+
+def run_benchmarks(
+    workloads: tuple[str, ...] | None = None,
+    solver: str = 'cvxopt',
+    memory: bool = False,
+    repeat: int = 1,
+):
+    """
+    Runs all default cases of the selected workloads (all workloads if None).
+    """
+
+    if workloads is None:
+        workloads = tuple(WORKLOADS)
+
+    results = []
+
+    for name in workloads:
+        workload = WORKLOADS[name]
+
+        for params in workload.cases:
+            result = run_repeated(workload, params, repeat=repeat, solver=solver, memory=memory)
+            print(f"{name} {params}: {result['time']:.3f}s, {result['status']}", file=sys.stderr)
+            results.append(result)
+
+    return {
+        'environment': to_environment(),
+        'solver': solver,
+        'memory': memory,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Runs the sosopt benchmark workloads.')
+    parser.add_argument('--workloads', nargs='+', choices=tuple(WORKLOADS), default=None)
+    parser.add_argument('--solver', choices=tuple(SOLVERS), default='cvxopt')
+    parser.add_argument('--memory', action='store_true', help='record the peak and retained memory of each stage')
+    parser.add_argument('--repeat', type=int, default=1, help='number of runs of each case')
+    parser.add_argument('--output', default=None, help='JSON file, standard output if not given')
+    args = parser.parse_args(argv)
+
+    benchmarks = run_benchmarks(
+        workloads=args.workloads,
+        solver=args.solver,
+        memory=args.memory,
+        repeat=args.repeat,
+    )
+
+    if args.output is None:
+        json.dump(benchmarks, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(benchmarks, file, indent=2)
+
+    # the timings of a problem that is not solved to optimality are not comparable
+    if failed := tuple(result for result in benchmarks['results'] if not result['is_optimal']):
+        sys.exit('Cases not solved to optimality: ' + ', '.join(
+            f"{result['workload']} {result['params']} ({result['status']})" for result in failed
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""
+Sweeps the number of variables, the degree and the number of domain polynomials of a quadratic
+module constraint, and fits the empirical complexity of each stage.
+
+Example:
+    python -m benchmarks.scaling --n-var 2 3 4 --degree 2 4 6 --n-domain 1 2 --output scaling.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+
+import numpy as np
+
+from benchmarks.run import SOLVERS, run_case, run_repeated, to_environment
+from benchmarks.workloads import Workload, define_quadratic_module
+
+
+SWEEP_PARAMETERS = ('n_var', 'degree', 'n_domain')
+
+QUADRATIC_MODULE = Workload(
+    name='quadratic_module',
+    define=define_quadratic_module,
+    cases=(),
+)
+
+
+def to_scaling_record(result: dict, memory_result: dict):
+    """
+    Reduces a benchmark result to the measures of the scaling study. The times are taken from
+    the result recorded without memory tracking, the memory from the result recorded with it.
+    """
+
+    stages = result['stages']
+
+    def to_time(*names):
+        return sum(stages[name]['time'] for name in names if name in stages)
+
+    peak_bytes = {
+        name: entry['peak_bytes']
+        for name, entry in memory_result['stages'].items()
+        if 'peak_bytes' in entry
+    }
+    semidef_cone_sizes = result['size']['semidef_cone_sizes']
+
+    return {
+        'params': result['params'],
+        'compile_time': to_time('to_conic_problem', 'to_solver_args'),
+        'solver_time': to_time('solve'),
+        'peak_bytes': max(peak_bytes.values()) if peak_bytes else None,
+        'gram_block_sizes': semidef_cone_sizes,
+        # number of rows of all Gram matrices, the size measure of the fits
+        'basis_size': sum(semidef_cone_sizes),
+        'status': result['status'],
+        'stages': stages,
+        'stage_peak_bytes': peak_bytes,
+    }
+
+
+def run_sweep(
+    n_vars: tuple[int, ...],
+    degrees: tuple[int, ...],
+    n_domains: tuple[int, ...],
+    solver: str = 'cvxopt',
+    repeat: int = 1,
+):
+    """
+    Runs all configurations of the sweep. The times are recorded without memory tracking, as
+    tracemalloc slows down the stages unevenly, and the memory is recorded in a separate run.
+    """
+
+    records = []
+
+    for n_var, degree, n_domain in itertools.product(n_vars, degrees, n_domains):
+        params = {'n_var': n_var, 'degree': degree, 'n_domain': n_domain}
+
+        result = run_repeated(QUADRATIC_MODULE, params, repeat=repeat, solver=solver, memory=False)
+        print(f"{params}: {result['time']:.3f}s, {result['status']}", file=sys.stderr)
+
+        memory_result = run_case(QUADRATIC_MODULE, params, solver=solver, memory=True)
+
+        records.append(to_scaling_record(result, memory_result))
+
+    return records
+
+
+def fit_power_law(sizes: dict[str, np.ndarray], values: np.ndarray):
+    """
+    Fits log(value) = log(coefficient) + sum_k exponent_k log(size_k) by least squares.
+
+    Sizes that do not vary over the records are not fitted. Returns None if there are too
+    few records with positive values.
+    """
+
+    mask = values > 0
+    varying = tuple(name for name, size in sizes.items() if len(np.unique(size[mask])) > 1)
+
+    if not varying or np.count_nonzero(mask) <= len(varying):
+        return None
+
+    A = np.column_stack((np.ones(np.count_nonzero(mask)),) + tuple(np.log(sizes[name][mask]) for name in varying))
+    b = np.log(values[mask])
+
+    solution, *_ = np.linalg.lstsq(A, b, rcond=None)
+
+    residual = b - A @ solution
+    total = b - b.mean()
+    r2 = 1.0 - (residual @ residual) / (total @ total) if total @ total > 0 else 1.0
+
+    return {
+        'coefficient': float(np.exp(solution[0])),
+        'exponents': dict(zip(varying, solution[1:].tolist())),
+        'r2': float(r2),
+        'n_records': int(np.count_nonzero(mask)),
+    }
+
+
+def fit_complexity(records: list[dict]):
+    """
+    Fits the time of each stage, the compile time, the solver time and the peak memory as
+    power laws of the Gram basis size, and of the sweep parameters.
+
+    A regression in a stage (e.g. `gram_matrix` or `sos_monomial_basis`) shows up as an
+    increased exponent.
+    """
+
+    def to_sizes(names):
+        return {
+            name: np.array(tuple(record['params'][name] for record in records), dtype=np.double)
+            for name in names
+        }
+
+    basis_size = {'basis_size': np.array(tuple(record['basis_size'] for record in records), dtype=np.double)}
+    parameters = to_sizes(SWEEP_PARAMETERS)
+
+    def gen_measures():
+        yield 'compile_time', tuple(record['compile_time'] for record in records)
+        yield 'solver_time', tuple(record['solver_time'] for record in records)
+        yield 'peak_bytes', tuple(record['peak_bytes'] or 0 for record in records)
+
+        stage_names = sorted(set(name for record in records for name in record['stages']))
+        for name in stage_names:
+            yield f'stage:{name}', tuple(record['stages'].get(name, {}).get('time', 0.0) for record in records)
+
+    def gen_fits():
+        for measure, values in gen_measures():
+            values = np.array(values, dtype=np.double)
+
+            yield measure, {
+                'basis_size': fit_power_law(basis_size, values),
+                'parameters': fit_power_law(parameters, values),
+            }
+
+    return dict(gen_fits())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Scaling study of the quadratic module constraint.')
+    parser.add_argument('--n-var', type=int, nargs='+', default=(2, 3, 4))
+    parser.add_argument('--degree', type=int, nargs='+', default=(2, 4))
+    parser.add_argument('--n-domain', type=int, nargs='+', default=(1, 2, 4))
+    parser.add_argument('--solver', choices=tuple(SOLVERS), default='cvxopt')
+    parser.add_argument('--repeat', type=int, default=1, help='number of timing runs of each configuration')
+    parser.add_argument('--output', default=None, help='JSON file, standard output if not given')
+    args = parser.parse_args(argv)
+
+    records = run_sweep(
+        n_vars=tuple(args.n_var),
+        degrees=tuple(args.degree),
+        n_domains=tuple(args.n_domain),
+        solver=args.solver,
+        repeat=args.repeat,
+    )
+
+    scaling = {
+        'environment': to_environment(),
+        'records': records,
+        'fits': fit_complexity(records),
+    }
+
+    if args.output is None:
+        json.dump(scaling, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(scaling, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
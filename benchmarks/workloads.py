@@ -0,0 +1,270 @@
+"""
+Parametrized SOS workloads used by the benchmark runner.
+
+Each workload defines an SOS problem on a fresh state for the given parameters, and lists the
+parameters of the cases run by default.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import polymat
+from polymat.typing import State
+
+import sosopt
+from sosopt.sosproblem import SOSProblem
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+
+    # defines the SOS problem given the state and the parameters of a case
+    define: Callable[..., tuple[State, SOSProblem]]
+
+    # parameters of the cases run by default
+    cases: tuple[dict, ...]
+
+    # sparse SMR of the state the SOS problem is defined on (see `sosopt.init_state`)
+    sparse_smr: bool = True
+
+
+def define_motzkin(state: State, multiplier_degree: int):
+    """
+    Lower bound of the Motzkin polynomial M(x, y), which is nonnegative but not SOS.
+    The bound gamma is certified by (1 + x^2 + y^2)^k (M(x, y) - gamma) being SOS.
+
+    The sparse SMR does not find the certificate, hence the workload is run with sparse_smr=False.
+    """
+
+    x, y = tuple(polymat.define_variable(name) for name in ('x', 'y'))
+
+    motzkin = x**4 * y**2 + x**2 * y**4 - 3 * x**2 * y**2 + 1
+
+    gamma = sosopt.define_variable('gamma')
+
+    state, constraint = sosopt.sos_constraint(
+        name='motzkin',
+        greater_than_zero=(1 + x**2 + y**2) ** multiplier_degree * (motzkin - gamma),
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=-gamma,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def define_lyapunov(state: State, n_var: int, degree: int):
+    """
+    Lyapunov function V(x) of the given degree for the n-dimensional system
+    dx_i/dt = -x_i + 0.5 x_{i+1} - x_i^3 with cyclic coupling.
+    """
+
+    variables = tuple(polymat.define_variable(f'x{index}') for index in range(n_var))
+    x = polymat.v_stack(variables)
+
+    f = polymat.v_stack(tuple(
+        -variables[index] + 0.5 * variables[(index + 1) % n_var] - variables[index] ** 3
+        for index in range(n_var)
+    ))
+
+    state, V = sosopt.define_polynomial(
+        name='V',
+        monomials=x.combinations(degrees=range(2, degree + 1)),
+    ).apply(state)
+
+    state, v_pos = sosopt.sos_constraint(
+        name='V_pos',
+        greater_than_zero=V - 0.01 * x.T @ x,
+    ).apply(state)
+
+    state, v_dec = sosopt.sos_constraint(
+        name='V_dec',
+        smaller_than_zero=V.diff(x) @ f + 0.01 * x.T @ x,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=sosopt.gram_matrix(V, x).trace(),
+        constraints=(v_pos, v_dec),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def define_box_containment(state: State, n_var: int, degree: int):
+    """
+    Smallest zero-sublevel set of r(x) containing a box-like set, certified by
+    Putinar's Positivstellensatz (see `examples/readmeexample.py`).
+    """
+
+    variables = tuple(polymat.define_variable(f'x{index}') for index in range(n_var))
+    x = polymat.v_stack(variables)
+    x1, others = variables[0], variables[1:]
+
+    w1 = ((x1 + 0.3) / 0.5) ** 2 - 1
+    w2 = ((x1 + 0.3) / 20) ** 2 - 1
+    for variable in others:
+        w1 = w1 + (variable / 20) ** 2
+        w2 = w2 + (variable / 1.3) ** 2
+
+    state, r_var = sosopt.define_polynomial(
+        name='r',
+        monomials=x.combinations(degrees=range(1, degree + 1)),
+    ).apply(state)
+    r = r_var - 1
+
+    state, constraint = sosopt.quadratic_module_constraint(
+        name='rpos',
+        smaller_than_zero=r,
+        domain=sosopt.set_(
+            smaller_than_zero={
+                'w1': w1,
+                'w2': w2,
+            },
+        ),
+    ).apply(state)
+
+    Qr_diag = sosopt.gram_matrix(r, x).diag()
+
+    problem = sosopt.sos_problem(
+        lin_cost=-Qr_diag.sum(),
+        quad_cost=Qr_diag,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def define_quadratic_module(state: State, n_var: int, degree: int, n_domain: int):
+    """
+    Smallest zero-sublevel set of r(x) of the given degree containing the intersection of
+    n_domain ellipsoids, certified by a single quadratic module constraint.
+    The k-th ellipsoid is narrow along the axis k mod n_var and wide along all other axes.
+    """
+
+    variables = tuple(polymat.define_variable(f'x{index}') for index in range(n_var))
+    x = polymat.v_stack(variables)
+
+    def to_ellipsoid(k: int):
+        axis = k % n_var
+        # shift the ellipsoids of the same axis against each other
+        shift = 0.3 * (1 + k // n_var)
+
+        terms = tuple(
+            ((variable + shift) / 0.5) ** 2 if index == axis else (variable / 20) ** 2
+            for index, variable in enumerate(variables)
+        )
+
+        w = terms[0]
+        for term in terms[1:]:
+            w = w + term
+        return w - 1
+
+    state, r_var = sosopt.define_polynomial(
+        name='r',
+        monomials=x.combinations(degrees=range(1, degree + 1)),
+    ).apply(state)
+    r = r_var - 1
+
+    state, constraint = sosopt.quadratic_module_constraint(
+        name='rpos',
+        smaller_than_zero=r,
+        domain=sosopt.set_(
+            smaller_than_zero={f'w{k}': to_ellipsoid(k) for k in range(n_domain)},
+        ),
+    ).apply(state)
+
+    Qr_diag = sosopt.gram_matrix(r, x).diag()
+
+    problem = sosopt.sos_problem(
+        lin_cost=-Qr_diag.sum(),
+        quad_cost=Qr_diag,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def define_control_lyapunov(state: State, degree: int):
+    """
+    Control Lyapunov function V(x) of the given degree for the system of
+    `examples/bilinearproblem.py`, where the controller u(x) is fixed to its initial guess.
+    This is the subproblem of V(x) in the first sweep of `sosopt.solve_with_alternation`, not
+    the bilinear synthesis of V(x) and u(x).
+    """
+
+    variables = tuple(polymat.define_variable(name) for name in ('x1', 'x2'))
+    x1, x2 = variables
+    x = polymat.v_stack(variables)
+
+    f = polymat.from_(((x2 + x1**2 - x1**3,), (0,)))
+    G = polymat.from_(((0,), (1,)))
+
+    state, V = sosopt.define_polynomial(
+        name='V',
+        monomials=x.combinations(degrees=range(2, degree + 1)),
+    ).apply(state)
+
+    state, u = sosopt.define_polynomial(
+        name='u',
+        monomials=x.combinations(degrees=range(2)),
+    ).apply(state)
+
+    state, v_pos = sosopt.sos_constraint(
+        name='V_pos',
+        greater_than_zero=V - 0.1 * x.T @ x,
+    ).apply(state)
+
+    state, clf = sosopt.quadratic_module_constraint(
+        name='clf',
+        greater_than_zero=-(V.diff(x) @ (f + G @ u)) - 0.1 * x.T @ x,
+        domain=sosopt.set_(
+            smaller_than_zero={'w': x.T @ x - 4},
+        ),
+    ).apply(state)
+
+    state, symbol_values = sosopt.to_symbol_values(u, -x1 - x2).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=sosopt.gram_matrix(V, x).trace(),
+        constraints=(v_pos, clf),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem.eval(symbol_values)
+
+
+WORKLOADS = {
+    workload.name: workload
+    for workload in (
+        Workload(
+            name='motzkin',
+            define=define_motzkin,
+            cases=tuple({'multiplier_degree': k} for k in (1, 2)),
+            sparse_smr=False,
+        ),
+        Workload(
+            name='lyapunov',
+            define=define_lyapunov,
+            cases=tuple({'n_var': n, 'degree': d} for n in (2, 3, 4) for d in (2, 4)),
+        ),
+        Workload(
+            name='box_containment',
+            define=define_box_containment,
+            cases=tuple({'n_var': 3, 'degree': d} for d in (2, 4, 6)),
+        ),
+        Workload(
+            name='control_lyapunov',
+            define=define_control_lyapunov,
+            cases=tuple({'degree': d} for d in (2, 4)),
+        ),
+    )
+}
@@ -83,14 +83,23 @@ for expr, value_expr in init_values:
 # Define and solve SOS problem
 sos_problem = sosopt.sos_problem(
     lin_cost=sosopt.gram_matrix(V, x).trace(),
+    # penalize the control effort, otherwise the subproblem of u(x) has no cost and returns an
+    # arbitrary feasible controller
+    quad_cost=0.1 * u.to_coefficient_vector(),
     constraints=tuple(constraints),
     solver=sosopt.cvxopt_solver,
 )
 
-sos_problem_eval = sos_problem.eval(symbol_values)
-state, sos_result = sos_problem_eval.solve().apply(context)
+# alternate between the Lyapunov function V(x) and the controller u(x)
+context, alternation_result = sosopt.solve_with_alternation(
+    problem=sos_problem,
+    groups=((V,), (u,)),
+    symbol_values=symbol_values,
+).apply(context)
+
+print(f'{alternation_result.costs=}, {alternation_result.termination=}')
 
-symbol_values = symbol_values | sos_result.symbol_values
+symbol_values = symbol_values | alternation_result.symbol_values
 
 
 # Plotting setup
@@ -5,6 +5,7 @@ from sosopt.state.init import (
 )
 from sosopt.solvers.cvxoptsolver import CVXOPTSolver
 from sosopt.solvers.moseksolver import MosekSolver
+from sosopt.solvers.moseksession import MosekSession as _MosekSession
 from sosopt.solvers.solveargs import to_solver_args as _get_solver_args
 from sosopt.semialgebraicset import set_ as _set_
 from sosopt.polymat.from_ import (
@@ -18,6 +19,8 @@ from sosopt.polymat.from_ import (
 from sosopt.polymat.to import to_symbol_values as _to_symbol_values
 from sosopt.coneconstraints.from_ import(
     equality_constraint as _equality_constraint,
+    linear_inequality_constraint as _linear_inequality_constraint,
+    second_order_cone_constraint as _second_order_cone_constraint,
     semi_definite_constraint as _semidefinite_constraint,
 )
 from sosopt.polynomialconstraints.from_ import (
@@ -27,6 +30,13 @@ from sosopt.polynomialconstraints.from_ import (
     quadratic_module_constraint as _psatz_putinar_constraint,
 )
 from sosopt.sosproblem import init_sos_problem as _init_sos_problem
+from sosopt.parametricsosproblem import init_parametric_sos_problem as _init_parametric_sos_problem
+from sosopt.changeofbasis import solve_with_change_of_basis as _solve_with_change_of_basis
+from sosopt.alternation import solve_with_alternation as _solve_with_alternation
+from sosopt.linearization import solve_with_linearization as _solve_with_linearization
+from sosopt.batchsolve import solve_batch as _solve_batch
+from sosopt.solvers.sharedsolverargs import share_solver_args as _share_solver_args
+from sosopt.profiling import profile as _profile
 
 init_state = _init_state
 
@@ -35,6 +45,9 @@ to_symbol_values = _to_symbol_values
 cvxopt_solver = CVXOPTSolver()
 mosek_solver = MosekSolver()
 
+# creates a Mosek solver keeping its task alive between solves of the same problem structure
+mosek_session = _MosekSession
+
 gram_matrix = _gram_matrix
 sos_monomial_basis = _sos_monomial_basis
 
@@ -49,6 +62,8 @@ set_ = _set_
 
 # Defining Cone Constraints
 equality_constraint = _equality_constraint
+linear_inequality_constraint = _linear_inequality_constraint
+second_order_cone_constraint = _second_order_cone_constraint
 semidefinite_constraint = _semidefinite_constraint
 
 # Defining Polynomial Constraints
@@ -63,3 +78,12 @@ quadratic_module_constraint = _psatz_putinar_constraint
 # Defining the SOS Optimization Problem
 solver_args = _get_solver_args
 sos_problem = _init_sos_problem
+parametric_sos_problem = _init_parametric_sos_problem
+solve_with_change_of_basis = _solve_with_change_of_basis
+solve_with_alternation = _solve_with_alternation
+solve_with_linearization = _solve_with_linearization
+solve_batch = _solve_batch
+share_solver_args = _share_solver_args
+
+# Instrumentation
+profile = _profile
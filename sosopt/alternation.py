@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import statemonad
+
+from polymat.typing import State, VariableExpression
+
+from sosopt.conicproblem import ConicProblemResult
+from sosopt.parametricsosproblem import (
+    ParametricSOSProblem,
+    init_parametric_sos_problem,
+    to_parameter_symbols,
+)
+from sosopt.polymat.sources.polynomialvariable import PolynomialVariable
+from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.sosproblem import SOSProblem
+
+
+@dataclass(frozen=True)
+class AlternationResult:
+    # values of the decision variables of all groups after the last successful sweep
+    symbol_values: dict[DecisionVariableSymbol, tuple[float, ...]]
+
+    # result of the last successful subproblem of each group
+    results: tuple[ConicProblemResult, ...]
+
+    # cost of the SOS problem evaluated at the values of the decision variables after each
+    # successful sweep
+    costs: tuple[float, ...]
+
+    # reason the iteration stopped: 'converged' if the cost improvement stalled, 'max_iterations',
+    # or 'solver_failed' if a subproblem was not solved to optimality
+    termination: str
+
+    # result of the subproblem that failed if termination is 'solver_failed', None otherwise
+    failed_result: ConicProblemResult | None
+
+    @property
+    def converged(self) -> bool:
+        return self.termination == 'converged'
+
+
+def solve_with_alternation(
+    problem: SOSProblem,
+    groups: Iterable[Iterable[DecisionVariableSymbol | VariableExpression | PolynomialVariable]],
+    symbol_values: dict[DecisionVariableSymbol, Iterable[float]],
+    max_iterations: int = 10,
+    tolerance: float = 1e-4,
+    warm_start: bool = True,
+):
+    """
+    Solves an SOS problem that is bilinear in groups of decision variables by alternation.
+
+    In each sweep, the subproblem of each group is solved in turn, where the decision variables of
+    all other groups are fixed to their latest values. The subproblems are compiled once as
+    parametric SOS problems, such that each solve only recomputes the coefficients depending on the
+    fixed decision variables. If `warm_start` is True, each subproblem is started from its result
+    of the previous sweep.
+
+    After each sweep, the cost of the SOS problem is evaluated at the values of the decision
+    variables of all groups. The iteration stops if the relative change of the cost over a sweep
+    is smaller than the tolerance, or if a subproblem is not solved to optimality.
+
+    Args:
+        problem: SOS problem that is affine in the decision variables of each group.
+        groups: Groups of decision variables, or polynomial variables, optimized together.
+            Decision variables not contained in any group are part of every subproblem.
+        symbol_values: Initial values of the decision variables of all groups except the first one.
+        max_iterations: Maximum number of sweeps.
+        tolerance: Minimum relative change of the cost required to continue the iteration.
+        warm_start: If True, each subproblem is warm-started from its previous result. Disable it
+            if the solver needs more iterations from the previous solution, which lies on the
+            boundary of the feasible set, than from its default starting point. MOSEK ignores
+            warm starts.
+
+    Returns:
+        (StateMonad[AlternationResult]): The result of the last successful sweep.
+
+    Example:
+        ``` python
+        # initial guess for the controller u(x)
+        state, symbol_values = sosopt.to_symbol_values(u, -x1 - x2).apply(state)
+
+        state, result = sosopt.solve_with_alternation(
+            problem=sos_problem,
+            groups=((V,), (u,)),
+            symbol_values=symbol_values,
+        ).apply(state)
+        ```
+    """
+
+    group_symbols = tuple(to_parameter_symbols(group) for group in groups)
+
+    if len(group_symbols) < 2:
+        raise ValueError('The alternation requires at least two groups of decision variables.')
+
+    def _solve_with_alternation(state: State):
+        # compile the subproblem of each group with the decision variables of all other groups as parameters
+        subproblems: list[ParametricSOSProblem] = []
+
+        for index in range(len(group_symbols)):
+            parameters = tuple(
+                symbol
+                for other_index, symbols in enumerate(group_symbols)
+                if other_index != index
+                for symbol in symbols
+            )
+
+            state, subproblem = init_parametric_sos_problem(
+                problem=problem,
+                parameters=parameters,
+            ).apply(state)
+
+            subproblems.append(subproblem)
+
+        def solve_sweep(values, results):
+            values = dict(values)
+            results = list(results)
+
+            for index, subproblem in enumerate(subproblems):
+                result = subproblem.solve(
+                    substitutions=values,
+                    tuple_symbol_values=True,
+                    warm_start=results[index] if warm_start else None,
+                )
+
+                if not result.solver_data.is_optimal:
+                    return None, result
+
+                values |= result.symbol_values
+                results[index] = result
+
+            return (values, results), None
+
+        values = dict(symbol_values)
+        results: list[ConicProblemResult | None] = [None] * len(subproblems)
+        costs = []
+        termination = 'max_iterations'
+        failed_result = None
+
+        for _ in range(max_iterations):
+            match solve_sweep(values, results):
+                case None, failed_result:
+                    termination = 'solver_failed'
+                    break
+
+                case (values, results), _:
+                    # the cost of the last subproblem omits constant terms of the fixed groups
+                    state, cost = problem.to_cost(values).apply(state)
+                    costs.append(cost)
+
+            if 1 < len(costs) and abs(costs[-2] - costs[-1]) <= tolerance * max(1.0, abs(costs[-2])):
+                termination = 'converged'
+                break
+
+        if not costs:
+            raise Exception(
+                f'The first sweep of the alternation could not be solved: {failed_result.solver_data.status}.'
+            )
+
+        return state, AlternationResult(
+            symbol_values=values,
+            results=tuple(results),
+            costs=tuple(costs),
+            termination=termination,
+            failed_result=failed_result,
+        )
+
+    return statemonad.get_map_put(_solve_with_alternation)
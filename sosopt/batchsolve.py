@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+import itertools
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from dataclassabc import dataclassabc
+
+import statemonad
+
+from polymat.typing import State, VariableExpression
+
+from sosopt.conicproblem import ConicProblemResult
+from sosopt.parametricsosproblem import (
+    ParametricSOSProblem,
+    init_parametric_sos_problem,
+    to_parameter_symbols,
+)
+from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
+from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.solvers.sharedsolverargs import SharedParametricSolverArgs, share_parametric_solver_args
+from sosopt.solvers.solverdata import SolutionFound, SolutionNotFound
+from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.solvers.warmstart import WarmStart
+from sosopt.sosproblem import SOSProblem
+
+
+@dataclassabc(frozen=True, slots=True)
+class BatchSolutionNotFound(SolutionNotFound):
+    status: str
+
+
+@dataclassabc(frozen=True, slots=True)
+class BatchSolutionFound(SolutionFound):
+    status: str
+    cost: float
+    iterations: int
+    solution: np.ndarray
+    dual_solution: tuple[np.ndarray, np.ndarray] | None
+    is_optimal: bool
+
+
+@dataclass(frozen=True)
+class _WorkerResult:
+    """
+    Result of a solve in a worker process, consisting of plain data only such that it can be
+    pickled. The solver data of the solvers cannot be pickled.
+    """
+
+    index: int
+    status: str
+    is_successful: bool
+    is_optimal: bool
+
+    # None if no solution was found
+    cost: float | None
+    iterations: int | None
+    solution: np.ndarray | None
+    dual_solution: tuple[np.ndarray, np.ndarray] | None
+
+    symbol_values: dict[ConeDecisionVariableSymbol, np.ndarray | tuple[float, ...]]
+    warm_start: WarmStart | None
+
+    def to_conic_problem_result(self) -> ConicProblemResult:
+        if self.is_successful:
+            solver_data = BatchSolutionFound(
+                status=self.status,
+                cost=self.cost,
+                iterations=self.iterations,
+                solution=self.solution,
+                dual_solution=self.dual_solution,
+                is_optimal=self.is_optimal,
+            )
+        else:
+            solver_data = BatchSolutionNotFound(status=self.status)
+
+        return ConicProblemResult(
+            solver_data=solver_data,
+            symbol_values=self.symbol_values,
+            warm_start=self.warm_start,
+        )
+
+
+# compiled problem of the worker process, set once by the pool initializer
+_worker_problem: ParametricSOSProblem | None = None
+
+
+def _init_worker(
+    solver_args: SharedParametricSolverArgs,
+    solver: SolverMixin,
+    variable_index_ranges: dict[ConeDecisionVariableSymbol, tuple[int, int]],
+    parameter_ranges: dict[DecisionVariableSymbol, tuple[int, int]],
+):
+    global _worker_problem
+
+    # the arrays of the solver arguments are attached without copying
+    _worker_problem = ParametricSOSProblem(
+        solver_args=solver_args.to_parametric_solver_args(),
+        solver=solver,
+        variable_index_ranges=variable_index_ranges,
+        parameter_ranges=parameter_ranges,
+    )
+
+
+def _solve_in_worker(index: int, parameter_values: np.ndarray, tuple_symbol_values: bool):
+    result = _worker_problem.solve_parameter_values(
+        parameter_values=parameter_values,
+        tuple_symbol_values=tuple_symbol_values,
+    )
+
+    solver_data = result.solver_data
+
+    match solver_data:
+        case SolutionFound():
+            return _WorkerResult(
+                index=index,
+                status=solver_data.status,
+                is_successful=solver_data.is_successful,
+                is_optimal=solver_data.is_optimal,
+                cost=solver_data.cost,
+                iterations=solver_data.iterations,
+                solution=solver_data.solution,
+                dual_solution=solver_data.dual_solution,
+                symbol_values=result.symbol_values,
+                warm_start=result.warm_start,
+            )
+
+        case _:
+            return _WorkerResult(
+                index=index,
+                status=solver_data.status,
+                is_successful=False,
+                is_optimal=False,
+                cost=None,
+                iterations=None,
+                solution=None,
+                dual_solution=None,
+                symbol_values=result.symbol_values,
+                warm_start=None,
+            )
+
+
+def solve_batch(
+    problem: SOSProblem,
+    substitutions: Iterable[dict[DecisionVariableSymbol | VariableExpression, Iterable[float]]],
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+    tuple_symbol_values: bool = False,
+):
+    """
+    Solves an SOS problem for many substitutions across a process pool.
+
+    The problem is compiled once as a parametric SOS problem with the substituted decision
+    variables as parameters, which are given by the keys of the first substitution. The arrays
+    of the compiled problem are written once to a memory-mapped file, which each worker process
+    attaches to without copying (see `share_parametric_solver_args`). Each solve only sends the parameter
+    vector. Neither the state nor the polynomial expressions are sent to the workers.
+
+    The substitutions are consumed lazily, such that at most `max_pending` solves are submitted
+    to the pool at any time. Closing the returned iterator cancels the pending solves. The
+    solver data of the results is rebuilt from plain data returned by the workers, and provides
+    the status, the cost, the number of iterations, and the primal and dual solution.
+
+    Args:
+        problem: SOS problem that is affine in the substituted decision variables.
+        substitutions: Values of the substituted decision variables, one dictionary per solve.
+        max_workers: Maximum number of worker processes.
+        max_pending: Maximum number of submitted solves not yet returned, by default twice the
+            number of worker processes.
+        tuple_symbol_values: If True, the symbol values are returned as tuples of floats.
+
+    Returns:
+        (StateMonad[Iterator[tuple[int, ConicProblemResult]]]): An iterator yielding the index of
+        the substitution and the result as soon as a solve finishes.
+
+    Example:
+        ``` python
+        state, results = sosopt.solve_batch(
+            problem=sos_problem,
+            substitutions=({a.symbol: (a_value,)} for a_value in a_values),
+        ).apply(state)
+
+        for index, result in results:
+            print(index, result.solver_data.cost)
+        ```
+    """
+
+    def _solve_batch(state: State):
+        # a new iterator for each application of the state monad
+        remaining = iter(substitutions)
+
+        try:
+            first = next(remaining)
+        except StopIteration:
+            return state, iter(())
+
+        state, parametric_problem = init_parametric_sos_problem(
+            problem=problem,
+            parameters=to_parameter_symbols(first.keys()),
+        ).apply(state)
+
+        n_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        n_pending = max_pending if max_pending is not None else 2 * n_workers
+
+        def gen_results() -> Iterator[tuple[int, ConicProblemResult]]:
+            with share_parametric_solver_args(parametric_problem.solver_args) as shared_solver_args:
+                yield from gen_shared_results(shared_solver_args)
+
+        def gen_shared_results(shared_solver_args: SharedParametricSolverArgs):
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(
+                    shared_solver_args,
+                    parametric_problem.solver,
+                    parametric_problem.variable_index_ranges,
+                    parametric_problem.parameter_ranges,
+                ),
+            )
+
+            indexed_substitutions = enumerate(itertools.chain((first,), remaining))
+            pending: set[Future] = set()
+
+            def submit(n: int):
+                for index, substitution in itertools.islice(indexed_substitutions, n):
+                    pending.add(executor.submit(
+                        _solve_in_worker,
+                        index,
+                        parametric_problem.to_parameter_values(substitution),
+                        tuple_symbol_values,
+                    ))
+
+            try:
+                submit(n_pending)
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    pending.difference_update(done)
+
+                    # keep the workers busy while the results are consumed
+                    submit(len(done))
+
+                    for future in done:
+                        worker_result = future.result()
+                        yield worker_result.index, worker_result.to_conic_problem_result()
+
+            finally:
+                # called as well if the iterator is closed before all results are consumed
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return state, gen_results()
+
+    return statemonad.get_map_put(_solve_batch)
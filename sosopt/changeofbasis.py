@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.linalg
+
+import statemonad
+
+import polymat
+from polymat.typing import State
+
+from sosopt.conicproblem import ConicProblemResult, init_conic_problem
+from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
+from sosopt.polynomialconstraints.constraintprimitives.sumofsquaresprimitive import SumOfSquaresPrimitive
+from sosopt.polynomialconstraints.polynomialconstraint import PolynomialConstraint
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
+from sosopt.solvers.solveargs import SolverArgs, to_solver_args
+from sosopt.sosproblem import SOSProblem
+
+
+@dataclass(frozen=True)
+class ChangeOfBasisResult:
+    # SOS problem with the change of basis used in the last successful iteration
+    problem: SOSProblem
+
+    # result of the last successful iteration
+    result: ConicProblemResult
+
+    # cost of each successful iteration
+    costs: tuple[float, ...]
+
+    # reason the iteration stopped: 'converged' if the cost improvement stalled, 'max_iterations',
+    # or 'solver_failed' if the solver did not find a solution after a change of basis
+    termination: str
+
+    # result of the iteration that failed if termination is 'solver_failed', None otherwise
+    failed_result: ConicProblemResult | None
+
+    @property
+    def converged(self) -> bool:
+        return self.termination == 'converged'
+
+
+def to_change_of_basis(
+    primitive: SumOfSquaresPrimitive,
+    symbol_values: dict[ConeDecisionVariableSymbol, tuple[float, ...]],
+    regularization: float = 1e-6,
+):
+    """
+    Computes the change of basis B = U^{-1} for each block Q of the Gram matrix of the SOS
+    primitive evaluated at the solution, where Q = U^T U is the Cholesky factorization of Q.
+
+    The previous Gram matrix then corresponds to B^T Q B = I, which is diagonally dominant, and
+    remains feasible in the next iteration. A small multiple of the identity is added to Q to
+    ensure the existence of the Cholesky factor.
+    """
+
+    def _to_change_of_basis(state: State):
+        state, blocks = primitive.to_gram_matrix_blocks().apply(state)
+
+        change_of_basis = []
+
+        for block in blocks:
+            state, data = polymat.to_tuple(
+                primitive.gram_matrix[block, block].eval(symbol_values)
+            ).apply(state)
+
+            gram = np.array(data, dtype=np.double)
+            scale = max(1.0, np.abs(np.diag(gram)).max())
+            lower = np.linalg.cholesky(gram + regularization * scale * np.eye(len(block)))
+
+            # B = U^{-1} = L^{-T}
+            change_of_basis.append(
+                scipy.linalg.solve_triangular(lower, np.eye(len(block)), lower=True).T
+            )
+
+        return state, tuple(change_of_basis)
+
+    return statemonad.get_map_put(_to_change_of_basis)
+
+
+def solve_with_change_of_basis(
+    problem: SOSProblem,
+    max_iterations: int = 10,
+    tolerance: float = 1e-4,
+    regularization: float = 1e-6,
+):
+    """
+    Iteratively improves the DSOS and SDSOS relaxations of an SOS problem by a change of basis
+    of the Gram matrices (Ahmadi and Hall).
+
+    In each iteration, the relaxation of each DSOS or SDSOS primitive is applied to B^T Q B, where
+    B is computed from the Cholesky factorization of its Gram matrix Q found in the previous iteration.
+    As the previous solution remains feasible, the cost is non-increasing (up to the regularization
+    of the Cholesky factorization). The iteration stops if the relative improvement of the cost is
+    smaller than the tolerance. Only linear and second-order cone problems are solved, while the
+    Gram matrices and monomial bases cached in the state are reused between the iterations.
+
+    The problem is converted to solver arguments once. In each iteration, only the cone
+    constraints of the DSOS and SDSOS primitives are converted again and replaced by name.
+    The reason for stopping the iteration is reported by `termination` of the result.
+
+    Args:
+        problem: SOS problem containing SOS constraints with relaxation 'dsos' or 'sdsos'.
+        max_iterations: Maximum number of solved problems.
+        tolerance: Minimum relative improvement of the cost required to continue the iteration.
+        regularization: Relative regularization of the Gram matrices before the Cholesky factorization.
+
+    Returns:
+        (StateMonad[ChangeOfBasisResult]): The result of the last successful iteration.
+
+    Example:
+        ``` python
+        state, r_sos_constraint = sosopt.sos_constraint(
+            name='r_sos',
+            greater_than_zero=r,
+            relaxation='dsos',
+        ).apply(state)
+
+        problem = sosopt.sos_problem(
+            lin_cost=-g,
+            constraints=(r_sos_constraint,),
+            solver=sosopt.cvxopt_solver,
+        )
+
+        state, result = sosopt.solve_with_change_of_basis(problem).apply(state)
+        ```
+    """
+
+    def update_change_of_basis(state: State, problem: SOSProblem, result: ConicProblemResult):
+        constraints = []
+        updated_primitives = []
+
+        for constraint in problem.constraints:
+            match constraint:
+                case PolynomialConstraint():
+                    primitives = []
+
+                    for primitive in constraint.primitives:
+                        match primitive:
+                            case SumOfSquaresPrimitive(options=SumOfSquaresOptions(relaxation='dsos' | 'sdsos')):
+                                state, change_of_basis = to_change_of_basis(
+                                    primitive=primitive,
+                                    symbol_values=result.symbol_values,
+                                    regularization=regularization,
+                                ).apply(state)
+
+                                primitive = primitive.copy(change_of_basis=change_of_basis)
+                                updated_primitives.append(primitive)
+
+                        primitives.append(primitive)
+
+                    constraints.append(constraint.copy(primitives=tuple(primitives)))
+
+                case _:
+                    constraints.append(constraint)
+
+        return state, (problem.copy(constraints=tuple(constraints)), tuple(updated_primitives))
+
+    def update_solver_args(
+        state: State,
+        solver_args: SolverArgs,
+        next_problem: SOSProblem,
+        primitives: tuple[SumOfSquaresPrimitive, ...],
+    ):
+        # only the cone constraints depending on the change of basis are converted again
+        cone_constraints = []
+
+        for primitive in primitives:
+            state, primitive_cone_constraints = primitive.to_cone_constraints().apply(state)
+            cone_constraints.extend(primitive_cone_constraints)
+
+        state, updated_solver_args = to_solver_args(
+            indices=solver_args.indices,
+            **init_conic_problem(
+                lin_cost=None,
+                constraints=tuple(cone_constraints),
+                solver=problem.solver,
+            ).to_constraint_data(),
+        ).apply(state)
+
+        try:
+            return state, solver_args.replace_constraints(updated_solver_args)
+
+        except ValueError:
+            # the constraints cannot be matched by name, hence the whole problem is converted
+            return next_problem.to_solver_args().apply(state)
+
+    def _solve_with_change_of_basis(state: State):
+        state, conic_problem = problem.to_conic_problem().apply(state)
+        state, solver_args = conic_problem.to_solver_args().apply(state)
+        state, result = conic_problem.solve(solver_args=solver_args).apply(state)
+
+        if not result.solver_data.is_successful:
+            raise Exception(f'The initial SOS problem could not be solved: {result.solver_data.status}.')
+
+        current_problem = problem
+        costs = [result.solver_data.cost]
+        termination = 'max_iterations'
+        failed_result = None
+
+        for _ in range(max_iterations - 1):
+            state, (next_problem, primitives) = update_change_of_basis(state, current_problem, result)
+            state, solver_args = update_solver_args(state, solver_args, next_problem, primitives)
+
+            # the decision variables do not depend on the change of basis
+            state, next_result = conic_problem.solve(solver_args=solver_args).apply(state)
+
+            if not next_result.solver_data.is_successful:
+                termination = 'solver_failed'
+                failed_result = next_result
+                break
+
+            improvement = costs[-1] - next_result.solver_data.cost
+
+            current_problem = next_problem
+            result = next_result
+            costs.append(next_result.solver_data.cost)
+
+            if improvement <= tolerance * max(1.0, abs(costs[-2])):
+                termination = 'converged'
+                break
+
+        return state, ChangeOfBasisResult(
+            problem=current_problem,
+            result=result,
+            costs=tuple(costs),
+            termination=termination,
+            failed_result=failed_result,
+        )
+
+    return statemonad.get_map_put(_solve_with_change_of_basis)
@@ -10,6 +10,7 @@ from polymat.typing import MatrixExpression, VectorExpression, State
 # from sosopt.coneconstraints.anonymousvariablesmixin import AnonymousVariablesMixin
 # from sosopt.coneconstraints.decisionvariablesmixin import DecisionVariablesMixin
 from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
+from sosopt.utils.totuplesubstitutions import to_tuple_substitutions
 # from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
 
 
@@ -48,7 +49,7 @@ class ConeConstraint:
         )
 
         if len(decision_variable_symbols):
-            evaluated_expression = self.expression.eval(substitutions)
+            evaluated_expression = self.expression.eval(to_tuple_substitutions(substitutions))
 
             return self.copy(
                 expression=evaluated_expression,
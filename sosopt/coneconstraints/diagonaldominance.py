@@ -0,0 +1,131 @@
+import itertools
+
+import numpy as np
+
+import statemonad
+
+import polymat
+from polymat.typing import SymmetricMatrixExpression, State
+
+from sosopt.coneconstraints.linearinequalityconstraint import init_linear_inequality_constraint
+from sosopt.coneconstraints.secondorderconeconstraint import init_second_order_cone_constraint
+from sosopt.polymat.symbols.auxiliaryvariablesymbol import AuxiliaryVariableSymbol
+
+
+def _to_entries(expression: SymmetricMatrixExpression, size: int):
+    """
+    Returns the diagonal entries and the off-diagonal entries (i, j) with i < j of a
+    symmetric matrix as vectors, together with the incidence matrices mapping each
+    off-diagonal entry to its row index i and its column index j.
+    """
+
+    pairs = tuple(itertools.combinations(range(size), 2))
+    vector = expression.to_vector()
+
+    diagonal = vector[tuple(i + size * i for i in range(size)), 0]
+    off_diagonal = vector[tuple(i + size * j for i, j in pairs), 0].cache()
+
+    row_incidence = np.zeros((size, len(pairs)))
+    col_incidence = np.zeros((size, len(pairs)))
+    for index, (i, j) in enumerate(pairs):
+        row_incidence[i, index] = 1
+        col_incidence[j, index] = 1
+
+    return diagonal, off_diagonal, row_incidence, col_incidence
+
+
+def init_diagonally_dominant_constraints(
+    name: str,
+    expression: SymmetricMatrixExpression,
+    size: int,
+):
+    """
+    Constrains a symmetric matrix Q to be diagonally dominant with non-negative diagonal,
+    Q_ii >= sum_{j != i} |Q_ij|, which is sufficient for Q to be positive semidefinite.
+
+    The absolute values are bounded by auxilliary variables u_ij >= |Q_ij|, resulting in a
+    single linear inequality constraint.
+    """
+
+    def _init_diagonally_dominant_constraints(state: State):
+        if size == 1:
+            state, constraint = init_linear_inequality_constraint(
+                name=name,
+                expression=expression.to_vector(),
+            ).apply(state)
+
+            return state, (constraint,)
+
+        diagonal, off_diagonal, row_incidence, col_incidence = _to_entries(expression, size)
+
+        u = polymat.define_variable(
+            name=AuxiliaryVariableSymbol(f'{name}_dsos_u'),
+            size=row_incidence.shape[1],
+        )
+
+        state, constraint = init_linear_inequality_constraint(
+            name=name,
+            expression=polymat.v_stack((
+                u + off_diagonal,
+                u - off_diagonal,
+                diagonal - polymat.from_(row_incidence + col_incidence) @ u,
+            )),
+        ).apply(state)
+
+        return state, (constraint,)
+
+    return statemonad.get_map_put(_init_diagonally_dominant_constraints)
+
+
+def init_scaled_diagonally_dominant_constraints(
+    name: str,
+    expression: SymmetricMatrixExpression,
+    size: int,
+):
+    """
+    Constrains a symmetric matrix Q to be scaled diagonally dominant, which is sufficient for
+    Q to be positive semidefinite.
+
+    Q is written as the sum of positive semidefinite matrices that are non-zero only in the 2x2
+    submatrix [[a_ij, Q_ij], [Q_ij, b_ij]] of the entries i and j, plus a non-negative diagonal.
+    Each 2x2 submatrix results in a second-order cone (a_ij + b_ij, 2 Q_ij, a_ij - b_ij). The cones
+    are stacked into a single second-order cone constraint, and the diagonal results in a linear
+    inequality constraint.
+    """
+
+    def _init_scaled_diagonally_dominant_constraints(state: State):
+        if size == 1:
+            state, constraint = init_linear_inequality_constraint(
+                name=name,
+                expression=expression.to_vector(),
+            ).apply(state)
+
+            return state, (constraint,)
+
+        diagonal, off_diagonal, row_incidence, col_incidence = _to_entries(expression, size)
+        n_pairs = row_incidence.shape[1]
+
+        a = polymat.define_variable(name=AuxiliaryVariableSymbol(f'{name}_sdsos_a'), size=n_pairs)
+        b = polymat.define_variable(name=AuxiliaryVariableSymbol(f'{name}_sdsos_b'), size=n_pairs)
+
+        stacked = polymat.v_stack((a + b, 2 * off_diagonal, a - b))
+
+        # the cones (a_ij + b_ij, 2 Q_ij, a_ij - b_ij) are stacked into a single constraint
+        state, cone_constraint = init_second_order_cone_constraint(
+            name=f'{name}_sdsos',
+            expression=stacked[
+                tuple(index + n_pairs * entry for index in range(n_pairs) for entry in range(3)), 0
+            ],
+            dims=(3,) * n_pairs,
+        ).apply(state)
+
+        state, constraint = init_linear_inequality_constraint(
+            name=name,
+            expression=diagonal
+                - polymat.from_(row_incidence) @ a
+                - polymat.from_(col_incidence) @ b,
+        ).apply(state)
+
+        return state, (cone_constraint, constraint)
+
+    return statemonad.get_map_put(_init_scaled_diagonally_dominant_constraints)
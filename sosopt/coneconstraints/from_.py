@@ -1,9 +1,13 @@
+import polymat
 from polymat.typing import (
+    ScalarPolynomialExpression,
     SymmetricMatrixExpression,
     VectorExpression,
 )
 
 from sosopt.coneconstraints.equalityconstraint import init_equality_constraint
+from sosopt.coneconstraints.linearinequalityconstraint import init_linear_inequality_constraint
+from sosopt.coneconstraints.secondorderconeconstraint import init_second_order_cone_constraint
 from sosopt.coneconstraints.semidefiniteconstraint import init_semi_definite_constraint
 
 
@@ -63,3 +67,65 @@ def equality_constraint(
         name=name,
         expression=equal_to_zero,
     )
+
+
+def linear_inequality_constraint(
+    name: str,
+    greater_than_zero: VectorExpression,
+):
+    """
+    This constraint ensures that all entries of the vector expression are non-negative.
+
+    Args:
+        name: The name of the constraint. 
+        greater_than_zero: The vector expression whose entries must be non-negative.
+
+    Returns:
+        (StateMonad[LinearInequalityConstraint]): A cone constraint
+
+    Example:
+        ``` python
+        state, ineq_constraint = sosopt.linear_inequality_constraint(
+            name='ineq',
+            greater_than_zero=r,
+        ).apply(state)
+        ```
+    """
+
+    return init_linear_inequality_constraint(
+        name=name,
+        expression=greater_than_zero,
+    )
+
+
+def second_order_cone_constraint(
+    name: str,
+    vector: VectorExpression,
+    upper_bound: ScalarPolynomialExpression,
+):
+    """
+    This constraint ensures that the Euclidean norm of a vector expression is smaller than
+    a scalar expression.
+
+    Args:
+        name: The name of the constraint. 
+        vector: The vector expression $v$ whose norm is bounded.
+        upper_bound: The scalar expression $t$ such that $||v||_2 \\leq t$.
+
+    Returns:
+        (StateMonad[SecondOrderConeConstraint]): A cone constraint
+
+    Example:
+        ``` python
+        state, soc_constraint = sosopt.second_order_cone_constraint(
+            name='soc',
+            vector=Q.diag(),
+            upper_bound=t,
+        ).apply(state)
+        ```
+    """
+
+    return init_second_order_cone_constraint(
+        name=name,
+        expression=polymat.v_stack((upper_bound, vector)),
+    )
@@ -0,0 +1,49 @@
+from dataclasses import replace
+from dataclassabc import dataclassabc
+
+import statemonad
+
+from polymat.typing import VectorExpression, State
+
+from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
+from sosopt.coneconstraints.coneconstraint import ConeConstraint, to_decision_variable_symbols
+
+
+@dataclassabc(frozen=True, slots=True)
+class SecondOrderConeConstraint(ConeConstraint):
+    name: str | None
+
+    # the first entry is required to be greater than the norm of the remaining entries
+    expression: VectorExpression
+
+    decision_variable_symbols: tuple[ConeDecisionVariableSymbol, ...]
+
+    # if not None, the expression stacks several second-order cones of the given dimensions,
+    # which are converted to an array representation at once
+    dims: tuple[int, ...] | None
+
+    def to_vector(self) -> VectorExpression:
+        return self.expression
+
+    def copy(self, /, **others):
+        return replace(self, **others)
+
+
+def init_second_order_cone_constraint(
+    name: str | None,
+    expression: VectorExpression,
+    decision_variable_symbols: tuple[ConeDecisionVariableSymbol, ...] | None = None,
+    dims: tuple[int, ...] | None = None,
+):
+    def _init_second_order_cone_constraint(state: State, decision_variable_symbols=decision_variable_symbols):
+        if decision_variable_symbols is None:
+            state, decision_variable_symbols = to_decision_variable_symbols(expression).apply(state)
+
+        return state, SecondOrderConeConstraint(
+            name=name,
+            expression=expression,
+            decision_variable_symbols=decision_variable_symbols,
+            dims=dims,
+        )
+
+    return statemonad.get_map_put(_init_second_order_cone_constraint)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor
+import contextvars
 from dataclasses import dataclass, replace
+import functools
 from functools import cached_property
 
+import numpy as np
+
 import statemonad
 
 from polymat.typing import ScalarPolynomialExpression, VectorExpression, State
@@ -10,18 +16,32 @@ from polymat.typing import ScalarPolynomialExpression, VectorExpression, State
 from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
 # from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
 from sosopt.conversions import to_linear_cost
+from sosopt.profiling import Profile, current_profile, solve_scope, stage
 from sosopt.coneconstraints.coneconstraint import ConeConstraint
 from sosopt.coneconstraints.equalityconstraint import EqualityConstraint
+from sosopt.coneconstraints.linearinequalityconstraint import LinearInequalityConstraint
+from sosopt.coneconstraints.secondorderconeconstraint import SecondOrderConeConstraint
 from sosopt.coneconstraints.semidefiniteconstraint import SemiDefiniteConstraint
 from sosopt.solvers.solveargs import SolverArgs, to_solver_args
 from sosopt.solvers.solvermixin import SolverMixin
 from sosopt.solvers.solverdata import SolutionFound, SolutionNotFound, SolverData
+from sosopt.solvers.warmstart import WarmStart
 
 
 @dataclass(frozen=True)
 class ConicProblemResult:
     solver_data: SolverData
-    symbol_values: dict[ConeDecisionVariableSymbol, tuple[float, ...]]
+
+    # numpy arrays (views into the solution vector if possible), or tuples of floats
+    # if requested by `solve(tuple_symbol_values=True)`
+    symbol_values: dict[ConeDecisionVariableSymbol, np.ndarray | tuple[float, ...]]
+
+    # primal and dual solution used to warm start a subsequent solve, None if no solution was found
+    warm_start: WarmStart | None = None
+
+    # stages recorded since the solve started, including their memory if enabled, if the problem was
+    # solved within `sosopt.profile()`
+    profile: Profile | None = None
 
 
 @dataclass(frozen=True)
@@ -74,29 +94,42 @@ class ConicProblem:
 
         return dict(gen_variable_index_ranges())
 
-    def to_solver_args(self):
-        def to_solver_args_with_state(state: State):
-            # filter positive semidefinite constraints
-            s_data = tuple(
-                (constraint.name, constraint.to_vector())
-                for constraint in self.constraints
-                if isinstance(constraint, SemiDefiniteConstraint)
-            )
-
-            # # filter linear inequality constraints
-            # l_data = tuple(
-            #     (constraint.name, constraint.to_vector())
-            #     for constraint in self.constraints
-            #     if isinstance(constraint, LinearConstraint)
-            # )
+    def to_constraint_data(self):
+        """
+        Returns the name and vector expression of each constraint grouped by cone in the order
+        s_data, q_data, l_data, eq_data expected by `to_solver_args`. Second-order cone
+        constraints stacking several cones additionally provide the dimensions of the cones.
+        """
 
-            # filter linear equality constraints
-            eq_data = tuple(
+        def filter_constraints(cls):
+            return tuple(
                 (constraint.name, constraint.to_vector())
                 for constraint in self.constraints
-                if isinstance(constraint, EqualityConstraint)
+                if isinstance(constraint, cls)
             )
 
+        def gen_second_order_cone_data():
+            for constraint in self.constraints:
+                match constraint:
+                    case SecondOrderConeConstraint(dims=None):
+                        yield constraint.name, constraint.to_vector()
+                    case SecondOrderConeConstraint():
+                        # stacked cones are split after the conversion to an array representation
+                        yield constraint.name, constraint.to_vector(), constraint.dims
+
+        return {
+            # positive semidefinite constraints
+            's_data': filter_constraints(SemiDefiniteConstraint),
+            # second-order cone constraints
+            'q_data': tuple(gen_second_order_cone_data()),
+            # linear inequality constraints
+            'l_data': filter_constraints(LinearInequalityConstraint),
+            # linear equality constraints
+            'eq_data': filter_constraints(EqualityConstraint),
+        }
+
+    def to_solver_args(self):
+        def to_solver_args_with_state(state: State):
             def gen_decision_variable_indices():
                 for start, stop in self._variable_index_ranges(state).values():
                     for index in range(start, stop):
@@ -108,64 +141,166 @@ class ConicProblem:
                 indices=indices,
                 lin_cost=self.lin_cost,
                 quad_cost=self.quad_cost,
-                s_data=s_data,
-                q_data=None,    # not yet implemented
-                l_data=None,    # not yet implemented
-                eq_data=eq_data,
+                **self.to_constraint_data(),
             ).apply(state)
         
         return statemonad.get_map_put(to_solver_args_with_state)
 
-    def solve(self, solver_args: SolverArgs | None = None):
-        def solve_and_retrieve_symbol_values(
-                solver_args: SolverArgs,
-                variable_index_ranges: dict[ConeDecisionVariableSymbol, tuple[int, int]]
-        ):
-            solver_data = self.solver.solve(solver_args)
-
-            match solver_data:
-                case SolutionNotFound():
-                    symbol_values = {}
-
-                case SolutionFound():
-                    solution = solver_data.solution
-
-                    def gen_symbol_values():
-                        for symbol, (start, stop) in variable_index_ranges.items():
-
-                            solution_sel = [solver_args.indices.index(index) for index in range(start, stop)]
-
-                            yield (
-                                symbol,
-                                # convert numpy.float to float
-                                tuple(float(v) for v in solution[solution_sel]),
-                            )
-
-                    symbol_values = dict(gen_symbol_values())
-
-                case _:
-                    raise Exception(f'Unknown return value from solver {self.solver}.')
-
-            return ConicProblemResult(
-                solver_data=solver_data,
-                symbol_values=symbol_values,
-            )
-
+    def solve(
+        self,
+        solver_args: SolverArgs | None = None,
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+    ):
+        """
+        Solves the conic problem.
+
+        If the result of a previous solve is given as `warm_start`, its primal and dual solution
+        are mapped onto the variables and constraints of this problem by variable index and
+        constraint name, and passed to the solver as initial point. Variables and constraints
+        that are not part of the previous result are initialized with default values. MOSEK
+        ignores the initial point with a warning, as its interior-point optimizer does not
+        support warm starts.
+        """
+
+        @solve_scope()
         def solve_with_state(state: State, solver_args=solver_args):
             variable_index_ranges = self._variable_index_ranges(state)
 
             if solver_args is None:
                 state, solver_args = self.to_solver_args().apply(state)
 
-            sos_result_mapping = solve_and_retrieve_symbol_values(
+            sos_result_mapping = solve_solver_args(
+                solver=self.solver,
                 solver_args=solver_args,
                 variable_index_ranges=variable_index_ranges,
+                tuple_symbol_values=tuple_symbol_values,
+                warm_start=warm_start,
             )
 
             return state, sos_result_mapping
 
         return statemonad.get_map_put(solve_with_state)
 
+    async def solve_async(
+        self,
+        state: State,
+        solver_args: SolverArgs | None = None,
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+        executor: Executor | None = None,
+        timeout: float | None = None,
+    ) -> tuple[State, ConicProblemResult]:
+        """
+        Asynchronous counterpart of `solve`, running the compile and solver stages in a thread
+        pool executor (the default executor of the event loop if None).
+
+        If the coroutine is cancelled or the timeout expires, the remaining stages are not started
+        and `asyncio.CancelledError`, respectively `TimeoutError`, is raised. A stage that has already
+        started runs to completion in the executor, but its result is discarded.
+        """
+
+        async def run_stages():
+            loop = asyncio.get_running_loop()
+
+            variable_index_ranges = self._variable_index_ranges(state)
+
+            if solver_args is None:
+                # propagate the context (e.g. an active profiler) to the executor
+                next_state, args = await loop.run_in_executor(
+                    executor, contextvars.copy_context().run, self.to_solver_args().apply, state,
+                )
+            else:
+                next_state, args = state, solver_args
+
+            result = await loop.run_in_executor(
+                executor,
+                contextvars.copy_context().run,
+                functools.partial(
+                    solve_solver_args,
+                    solver=self.solver,
+                    solver_args=args,
+                    variable_index_ranges=variable_index_ranges,
+                    tuple_symbol_values=tuple_symbol_values,
+                    warm_start=warm_start,
+                ),
+            )
+
+            return next_state, result
+
+        # the scope is propagated to the executor together with the context
+        with solve_scope():
+            return await asyncio.wait_for(run_stages(), timeout)
+
+
+@solve_scope()
+def solve_solver_args(
+    solver: SolverMixin,
+    solver_args: SolverArgs,
+    variable_index_ranges: dict[ConeDecisionVariableSymbol, tuple[int, int]],
+    tuple_symbol_values: bool = False,
+    warm_start: ConicProblemResult | None = None,
+) -> ConicProblemResult:
+    """
+    Solves the solver arguments and retrieves the values of the decision variable symbols
+    from the solution.
+    """
+
+    match warm_start:
+        case ConicProblemResult(warm_start=WarmStart() as previous):
+            initial_point = solver_args.to_initial_point(previous)
+        case _:
+            initial_point = None
+
+    with stage('solve'):
+        solver_data = solver.solve(solver_args, initial_point=initial_point)
+
+    match solver_data:
+        case SolutionNotFound():
+            symbol_values = {}
+            next_warm_start = None
+
+        case SolutionFound():
+            solution = solver_data.solution
+
+            # computed once for all symbols
+            positions = solver_args.to_index_positions()
+
+            def gen_symbol_values():
+                for symbol, (start, stop) in variable_index_ranges.items():
+                    solution_sel = positions[start:stop]
+
+                    if len(solution_sel) < stop - start or np.any(solution_sel == -1):
+                        raise Exception(f'Symbol {symbol} is not part of the solver arguments.')
+
+                    first = solution_sel[0]
+
+                    # use a view into the solution vector if the variables are stored contiguously
+                    if np.array_equal(solution_sel, np.arange(first, first + len(solution_sel))):
+                        values = solution[first:first + len(solution_sel)]
+                    else:
+                        values = solution[solution_sel]
+
+                    if tuple_symbol_values:
+                        # convert numpy.float to float
+                        values = tuple(values.tolist())
+
+                    yield symbol, values
+
+            with stage('retrieve_symbol_values'):
+                symbol_values = dict(gen_symbol_values())
+                next_warm_start = solver_args.to_warm_start(solver_data)
+
+        case _:
+            raise Exception(f'Unknown return value from solver {solver}.')
+
+    return ConicProblemResult(
+        solver_data=solver_data,
+        symbol_values=symbol_values,
+        warm_start=next_warm_start,
+        profile=current_profile(),
+    )
+
 
 def init_conic_problem(
     lin_cost: ScalarPolynomialExpression,
@@ -1,12 +1,10 @@
-import numpy as np
-
 import statemonad
 
 import polymat
 from polymat.typing import ScalarPolynomialExpression, VectorExpression, MatrixExpression
 
+from sosopt.coneconstraints.secondorderconeconstraint import init_second_order_cone_constraint
 from sosopt.polymat.from_ import define_variable
-from sosopt.polynomialconstraints.from_ import sos_matrix_constraint
 
 
 def to_linear_cost(
@@ -14,11 +12,10 @@ def to_linear_cost(
     quad_cost: VectorExpression,
     lin_cost: ScalarPolynomialExpression | None = None, 
 ):
-    # https://math.stackexchange.com/questions/2256241/writing-a-convex-quadratic-program-qp-as-a-semidefinite-program-sdp
-    
-    def _to_linear_cost(state):
+    # The epigraph d >= q^T q of the quadratic cost is a rotated second-order cone,
+    # which is encoded by the second-order cone ||(2 q, d - 1)|| <= d + 1.
 
-        state, (n_rows, _) = polymat.to_shape(quad_cost).apply(state)
+    def _to_linear_cost(state):
 
         t = define_variable(name=f't_{name}')
 
@@ -28,12 +25,9 @@ def to_linear_cost(
             case MatrixExpression():
                 d = t - lin_cost
 
-        state, constraint = sos_matrix_constraint(
+        state, constraint = init_second_order_cone_constraint(
             name=name,
-            greater_than_zero=polymat.concat((
-                (polymat.from_(np.eye(n_rows)), quad_cost),
-                (quad_cost.T, d)
-            ))
+            expression=polymat.v_stack((d + 1, 2 * quad_cost, d - 1)),
         ).apply(state)
 
         return state, (t, constraint)
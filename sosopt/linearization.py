@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Iterable
+
+import numpy as np
+
+import statemonad
+
+import polymat
+from polymat.typing import MatrixExpression, State, VariableExpression
+
+from sosopt.conicproblem import ConicProblemResult
+from sosopt.coneconstraints.coneconstraint import ConeConstraint
+from sosopt.coneconstraints.equalityconstraint import EqualityConstraint
+from sosopt.coneconstraints.linearinequalityconstraint import LinearInequalityConstraint
+from sosopt.parametricsosproblem import init_parametric_sos_problem, to_parameter_symbols
+from sosopt.polymat.from_ import define_variable
+from sosopt.polymat.sources.polynomialvariable import PolynomialVariable
+from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.polynomialconstraints.polynomialconstraint import PolynomialConstraint
+from sosopt.sosproblem import SOSProblem
+from sosopt.utils.totuplesubstitutions import to_tuple_substitutions
+
+
+@dataclass(frozen=True)
+class LinearizationResult:
+    # values of the decision variables after the last successful step
+    symbol_values: dict[DecisionVariableSymbol, tuple[float, ...]]
+
+    # result of the SOS problem solved for the last group after the last accepted step
+    result: ConicProblemResult
+
+    # cost of the SOS problem evaluated at each accepted iterate, excluding the proximal term
+    costs: tuple[float, ...]
+
+    # reason the iteration stopped: 'converged' if the step size or the cost change fell below
+    # the tolerance, 'max_iterations', or 'solver_failed' if a linearized problem was not solved
+    # to optimality
+    termination: str
+
+    # result of the problem that failed if termination is 'solver_failed', None otherwise
+    failed_result: ConicProblemResult | None
+
+    @property
+    def converged(self) -> bool:
+        return self.termination == 'converged'
+
+
+def linearize_expression(
+    expression: MatrixExpression,
+    groups: tuple[tuple[DecisionVariableSymbol, ...], ...],
+    symbol_values: dict[DecisionVariableSymbol, tuple[float, ...]],
+) -> MatrixExpression:
+    """
+    Linearizes an expression that is affine in the decision variables of each group around the
+    given values.
+
+    For such a (multi-affine) expression e(z), the first-order Taylor expansion equals the sum of
+    e(z) with all groups except one fixed, minus (n - 1) e(z_k), where n is the number of groups.
+    """
+
+    if len(groups) < 2:
+        return expression
+
+    def fix_groups_except(index: int):
+        return {
+            symbol: symbol_values[symbol]
+            for other_index, group in enumerate(groups)
+            if other_index != index
+            for symbol in group
+        }
+
+    fixed = expression.eval({symbol: symbol_values[symbol] for group in groups for symbol in group})
+
+    linearized = expression.eval(fix_groups_except(0))
+    for index in range(1, len(groups)):
+        linearized = linearized + expression.eval(fix_groups_except(index))
+
+    return linearized - (len(groups) - 1) * fixed
+
+
+def linearize_sos_problem(
+    problem: SOSProblem,
+    groups: tuple[tuple[DecisionVariableSymbol, ...], ...],
+    symbol_values: dict[DecisionVariableSymbol, tuple[float, ...]],
+) -> SOSProblem:
+    """
+    Linearizes the cost and the constraints of an SOS problem around the given values.
+    Only constraint primitives, equality and linear inequality constraints containing decision
+    variables of more than one group are linearized. Second-order cone and semidefinite
+    constraints must be affine in the decision variables.
+    """
+
+    def to_active_groups(constraint):
+        # restrict the linearization to the groups appearing in the constraint
+        return tuple(
+            active_group
+            for group in groups
+            if (active_group := tuple(s for s in group if s in constraint.decision_variable_symbols))
+        )
+
+    def n_active_groups(constraint):
+        return len(to_active_groups(constraint))
+
+    def linearize(constraint):
+        active_groups = to_active_groups(constraint)
+
+        if len(active_groups) < 2:
+            return constraint
+
+        return constraint.copy(
+            expression=linearize_expression(constraint.expression, active_groups, symbol_values),
+        )
+
+    def gen_constraints():
+        for constraint in problem.constraints:
+            match constraint:
+                case PolynomialConstraint():
+                    yield constraint.copy(
+                        primitives=tuple(linearize(primitive) for primitive in constraint.primitives)
+                    )
+
+                case EqualityConstraint() | LinearInequalityConstraint():
+                    yield linearize(constraint)
+
+                case ConeConstraint():
+                    # the linearization of a second-order cone or semidefinite constraint is no
+                    # (inner) approximation of the convex cone
+                    if 1 < n_active_groups(constraint):
+                        raise ValueError(
+                            f'The cone constraint "{constraint.name}" is not affine in the decision variables '
+                            'and cannot be linearized.'
+                        )
+
+                    yield constraint
+
+    def linearize_cost(cost: MatrixExpression | None):
+        if cost is None:
+            return None
+
+        return linearize_expression(cost, groups, symbol_values)
+
+    return problem.copy(
+        lin_cost=linearize_cost(problem.lin_cost),
+        quad_cost=linearize_cost(problem.quad_cost),
+        constraints=tuple(gen_constraints()),
+    )
+
+
+def solve_with_linearization(
+    problem: SOSProblem,
+    groups: Iterable[Iterable[DecisionVariableSymbol | VariableExpression | PolynomialVariable]],
+    symbol_values: dict[DecisionVariableSymbol, Iterable[float]],
+    proximal_weight: float = 1.0,
+    max_iterations: int = 20,
+    tolerance: float = 1e-4,
+):
+    """
+    Solves an SOS problem that is bilinear in groups of decision variables by sequential
+    linearization (convex-concave procedure).
+
+    In each step, the bilinear terms are linearized around the current iterate and a proximal
+    term (w/2) |z - z_k|^2 on the decision variables of all groups is added to the cost. The
+    resulting convex SOS problem is solved for all groups simultaneously. As the linearized SOS
+    constraints are no inner approximation, the step is made feasible by solving the original
+    SOS problem for the decision variables of the last group, where the decision variables of all
+    other groups are fixed to the step. The step is accepted if this problem is solved to
+    optimality and the cost of the SOS problem does not increase. Otherwise, the proximal weight
+    is doubled and the step is repeated from the current iterate. Second-order cone and
+    semidefinite constraints are not linearized and must be affine in the decision variables.
+
+    The iteration stops if the relative step size or the relative change of the cost of the SOS
+    problem is smaller than the tolerance, or if a linearized problem is not solved to
+    optimality.
+
+    Args:
+        problem: SOS problem that is affine in the decision variables of each group.
+        groups: Groups of decision variables, or polynomial variables.
+        symbol_values: Initial values of the decision variables. Missing values of the decision
+            variables are computed by solving the SOS problem with the given values substituted.
+        proximal_weight: Minimum weight w of the proximal term.
+        max_iterations: Maximum number of linearized problems solved.
+        tolerance: Relative step size |z_{k+1} - z_k| / max(1, |z_k|), or relative change of the
+            cost, at convergence.
+
+    Returns:
+        (StateMonad[LinearizationResult]): The result of the last accepted step.
+
+    Example:
+        ``` python
+        state, symbol_values = sosopt.to_symbol_values(u, -x1 - x2).apply(state)
+
+        state, result = sosopt.solve_with_linearization(
+            problem=sos_problem,
+            groups=((V,), (u,)),
+            symbol_values=symbol_values,
+        ).apply(state)
+        ```
+    """
+
+    group_symbols = tuple(to_parameter_symbols(group) for group in groups)
+    symbols = tuple(symbol for group in group_symbols for symbol in group)
+
+    if len(group_symbols) < 2:
+        raise ValueError('The linearization requires at least two groups of decision variables.')
+
+    # decision variables fixed to the step when solving for the last group
+    fixed_symbols = tuple(symbol for group in group_symbols[:-1] for symbol in group)
+
+    def _solve_with_linearization(state: State):
+        values = to_tuple_substitutions(symbol_values)
+
+        # the cost is evaluated for all decision variables
+        if any(symbol not in values for symbol in problem.decision_variable_symbols):
+            state, result = problem.eval(values).solve(tuple_symbol_values=True).apply(state)
+
+            if not result.solver_data.is_successful:
+                raise Exception(f'The initial SOS problem could not be solved: {result.solver_data.status}.')
+
+            values = values | result.symbol_values
+
+        def to_size(symbol):
+            start, stop = state.get_index_range(symbol)
+            return stop - start
+
+        variables = polymat.v_stack(tuple(define_variable(symbol, size=to_size(symbol)) for symbol in symbols))
+
+        def to_vector(values):
+            return np.concatenate(tuple(np.array(values[symbol], dtype=np.double) for symbol in symbols))
+
+        state, restoration = init_parametric_sos_problem(
+            problem=problem,
+            parameters=fixed_symbols,
+        ).apply(state)
+
+        result = None
+        state, cost = problem.to_cost(values).apply(state)
+        costs = []
+        weight = proximal_weight
+        termination = 'max_iterations'
+        failed_result = None
+
+        for _ in range(max_iterations):
+            linearized = linearize_sos_problem(problem, group_symbols, values)
+
+            # (w/2) |z - z_k|^2 is encoded by the quadratic cost (1/2) |sqrt(w) (z - z_k)|^2
+            current = to_vector(values)
+            proximal = math.sqrt(weight) * (variables - polymat.from_(current.reshape(-1, 1)))
+
+            if linearized.quad_cost is None:
+                quad_cost = proximal
+            else:
+                quad_cost = polymat.v_stack((linearized.quad_cost, proximal))
+
+            # not warm-started, see `solve_with_alternation`
+            state, step_result = linearized.copy(quad_cost=quad_cost).solve(
+                tuple_symbol_values=True,
+            ).apply(state)
+
+            if not step_result.solver_data.is_optimal:
+                termination = 'solver_failed'
+                failed_result = step_result
+                break
+
+            next_result = restoration.solve(
+                substitutions={symbol: step_result.symbol_values[symbol] for symbol in fixed_symbols},
+                tuple_symbol_values=True,
+            )
+
+            if next_result.solver_data.is_optimal:
+                next_values = values | step_result.symbol_values | next_result.symbol_values
+                state, next_cost = problem.to_cost(next_values).apply(state)
+
+            # allow an increase of the cost within the tolerance caused by the solver accuracy
+            if not next_result.solver_data.is_optimal or cost + tolerance * max(1.0, abs(cost)) < next_cost:
+                # shorten the step
+                weight = 2 * weight
+                continue
+
+            values = next_values
+            result = next_result
+            weight = max(proximal_weight, weight / 2)
+
+            previous_cost, cost = cost, next_cost
+            costs.append(cost)
+
+            step = np.linalg.norm(to_vector(values) - current)
+            if (
+                step <= tolerance * max(1.0, np.linalg.norm(current))
+                or abs(previous_cost - cost) <= tolerance * max(1.0, abs(previous_cost))
+            ):
+                termination = 'converged'
+                break
+
+        if result is None:
+            match failed_result:
+                case None:
+                    raise Exception('No step of the linearization decreased the cost of the SOS problem.')
+                case _:
+                    raise Exception(
+                        f'The first linearized SOS problem could not be solved: {failed_result.solver_data.status}.'
+                    )
+
+        return state, LinearizationResult(
+            symbol_values=values,
+            result=result,
+            costs=tuple(costs),
+            termination=termination,
+            failed_result=failed_result,
+        )
+
+    return statemonad.get_map_put(_solve_with_linearization)
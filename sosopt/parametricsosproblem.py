@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+import statemonad
+
+from polymat.typing import State, VariableExpression
+
+from sosopt.coneconstraints.coneconstraint import ConeConstraint
+from sosopt.conicproblem import ConicProblemResult, solve_solver_args
+from sosopt.polymat.sources.polynomialvariable import PolynomialVariable
+from sosopt.polymat.symbols.conedecisionvariablesymbol import ConeDecisionVariableSymbol
+from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.polynomialconstraints.constraintprimitives.polynomialconstraintprimitive import (
+    PolynomialConstraintPrimitive,
+)
+from sosopt.polynomialconstraints.polynomialconstraint import PolynomialConstraint
+from sosopt.solvers.parametricsolverargs import ParametricSolverArgs, to_parametric_solver_args
+from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.sosproblem import SOSProblem
+
+
+@dataclass(frozen=True)
+class ParametricSOSProblem:
+    """
+    SOS problem compiled once for a set of parameters.
+
+    The parameters are decision variables of the SOS problem that get substituted before solving.
+    Compared to `SOSProblem.eval` followed by `SOSProblem.solve`, instantiating the problem for new
+    parameter values neither evaluates the polynomial expressions nor requires a state.
+    """
+
+    solver_args: ParametricSolverArgs
+    solver: SolverMixin
+
+    # index range of each decision variable symbol in the state
+    variable_index_ranges: dict[ConeDecisionVariableSymbol, tuple[int, int]]
+
+    # range of each parameter symbol in the parameter vector
+    parameter_ranges: dict[DecisionVariableSymbol, tuple[int, int]]
+
+    @property
+    def parameter_symbols(self) -> tuple[DecisionVariableSymbol, ...]:
+        return tuple(self.parameter_ranges.keys())
+
+    def to_parameter_values(
+        self, substitutions: dict[DecisionVariableSymbol | VariableExpression, Iterable[float]]
+    ) -> np.ndarray:
+        substitutions = to_symbol_substitutions(substitutions)
+
+        parameter_values = np.zeros(self.solver_args.n_parameter)
+
+        for symbol, (start, stop) in self.parameter_ranges.items():
+            if symbol not in substitutions:
+                raise Exception(f'No value provided for parameter {symbol}.')
+
+            parameter_values[start:stop] = np.fromiter(substitutions[symbol], dtype=np.double, count=stop - start)
+
+        return parameter_values
+
+    def to_solver_args(self, substitutions: dict[DecisionVariableSymbol | VariableExpression, Iterable[float]]):
+        return self.solver_args.to_solver_args(self.to_parameter_values(substitutions))
+
+    def solve(
+        self,
+        substitutions: dict[DecisionVariableSymbol | VariableExpression, Iterable[float]],
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+    ) -> ConicProblemResult:
+        return self.solve_parameter_values(
+            parameter_values=self.to_parameter_values(substitutions),
+            tuple_symbol_values=tuple_symbol_values,
+            warm_start=warm_start,
+        )
+
+    def solve_parameter_values(
+        self,
+        parameter_values: np.ndarray,
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+    ) -> ConicProblemResult:
+        return solve_solver_args(
+            solver=self.solver,
+            solver_args=self.solver_args.to_solver_args(parameter_values),
+            variable_index_ranges=self.variable_index_ranges,
+            tuple_symbol_values=tuple_symbol_values,
+            warm_start=warm_start,
+        )
+
+
+def to_parameter_symbols(
+    parameters: Iterable[DecisionVariableSymbol | VariableExpression | PolynomialVariable],
+) -> tuple[DecisionVariableSymbol, ...]:
+    def gen_parameter_symbols():
+        for parameter in parameters:
+            match parameter:
+                case PolynomialVariable():
+                    yield from parameter.iterate_symbols()
+                case VariableExpression():
+                    # e.g. defined by `sosopt.define_variable`
+                    yield parameter.symbol
+                case _:
+                    yield parameter
+
+    # removes duplicates while keeping the order
+    return tuple(dict.fromkeys(gen_parameter_symbols()))
+
+
+def to_symbol_substitutions(
+    substitutions: dict[DecisionVariableSymbol | VariableExpression, Iterable[float]],
+) -> dict[DecisionVariableSymbol, Iterable[float]]:
+    def to_symbol(key):
+        match key:
+            case VariableExpression():
+                # e.g. defined by `sosopt.define_variable`
+                return key.symbol
+            case _:
+                return key
+
+    return {to_symbol(key): values for key, values in substitutions.items()}
+
+
+def init_parametric_sos_problem(
+    problem: SOSProblem,
+    parameters: Iterable[DecisionVariableSymbol | VariableExpression | PolynomialVariable],
+):
+    """
+    Compiles an SOS problem whose data depends affinely on the given parameters.
+
+    Args:
+        problem: SOS problem containing the parameters as decision variables.
+        parameters: Decision variables, or polynomial variables whose coefficients are the
+            parameters. The cost and the constraints must be affine in the parameters, and the
+            products between parameters and remaining decision variables are at most bilinear.
+            Constraints that only contain parameters are dropped, as in `SOSProblem.eval`.
+
+    Returns:
+        (StateMonad[ParametricSOSProblem]): The compiled SOS problem.
+
+    Example:
+        ``` python
+        state, problem = sosopt.parametric_sos_problem(
+            problem=sos_problem,
+            parameters=(a,),
+        ).apply(state)
+
+        for a_value in a_values:
+            result = problem.solve({a.symbol: (a_value,)})
+        ```
+    """
+
+    parameter_symbols = to_parameter_symbols(parameters)
+
+    def is_parametric_only(constraint: PolynomialConstraintPrimitive | ConeConstraint):
+        return all(symbol in parameter_symbols for symbol in constraint.decision_variable_symbols)
+
+    def gen_constraints():
+        # as in `SOSProblem.eval`, drop the constraints without decision variables after substitution
+        for constraint in problem.constraints:
+            match constraint:
+                case PolynomialConstraint():
+                    yield constraint.copy(primitives=tuple(
+                        primitive for primitive in constraint.primitives
+                        if not is_parametric_only(primitive)
+                    ))
+
+                case _ if not is_parametric_only(constraint):
+                    yield constraint
+
+    def _init_parametric_sos_problem(state: State):
+        state, conic_problem = problem.copy(
+            constraints=tuple(gen_constraints()),
+        ).to_conic_problem().apply(state)
+
+        def to_index_range(symbol):
+            match state.get_index_range(symbol):
+                case None:
+                    raise Exception(f'Symbol {symbol} not registered')
+                case index_range:
+                    return index_range
+
+        variable_index_ranges = {
+            symbol: to_index_range(symbol)
+            for symbol in conic_problem.decision_variable_symbols
+            if symbol not in parameter_symbols
+        }
+
+        def gen_parameter_indices():
+            for symbol in parameter_symbols:
+                start, stop = to_index_range(symbol)
+                yield from range(start, stop)
+
+        def gen_parameter_ranges():
+            position = 0
+            for symbol in parameter_symbols:
+                start, stop = to_index_range(symbol)
+                yield symbol, (position, position + stop - start)
+                position += stop - start
+
+        indices = tuple(
+            index
+            for start, stop in variable_index_ranges.values()
+            for index in range(start, stop)
+        )
+
+        state, solver_args = to_parametric_solver_args(
+            indices=indices,
+            parameter_indices=tuple(gen_parameter_indices()),
+            lin_cost=conic_problem.lin_cost,
+            quad_cost=conic_problem.quad_cost,
+            **conic_problem.to_constraint_data(),
+        ).apply(state)
+
+        return state, ParametricSOSProblem(
+            solver_args=solver_args,
+            solver=problem.solver,
+            variable_index_ranges=variable_index_ranges,
+            parameter_ranges=dict(gen_parameter_ranges()),
+        )
+
+    return statemonad.get_map_put(_init_parametric_sos_problem)
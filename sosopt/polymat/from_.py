@@ -26,6 +26,9 @@ def gram_matrix(
     monomials: MatrixExpression | None = None,
     auxilliary_variable_symbol: AuxiliaryVariableSymbol | None = None,
     sparse_smr: bool | None = None,
+    newton_polytope: str | None = 'hull',
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
 ):
     """
     Performs an SOS decomposition to retrieve the SMR from a polynomial expression.
@@ -36,6 +39,14 @@ def gram_matrix(
         variables: Defines the polynomial variables.
         monomials: Defines the monomial vector $Z(x)$.
         sparse_smr: If True, no SOS decomposition variables are defined.
+        newton_polytope: Method used to prune the monomial vector $Z(x)$ to half the
+            Newton polytope if it is not provided and sparse_smr is False
+            (see `sos_monomial_basis`).
+        term_sparsity_order: If not None and sparse_smr is False, only the entries of $Q$
+            within a block of the term sparsity pattern of order term_sparsity_order are
+            parametrized. The sparse SMR is block-diagonal without further restriction.
+        sign_symmetry: If True and sparse_smr is False, only the entries of $Q$ between
+            monomials that behave identically under the sign symmetries of $p(x)$ are parametrized.
     """
 
     if sparse_smr is None:
@@ -53,6 +64,9 @@ def gram_matrix(
             variables=variables,
             monomials=monomials,
             auxilliary_variable_symbol=auxilliary_variable_symbol,
+            newton_polytope=newton_polytope,
+            term_sparsity_order=term_sparsity_order,
+            sign_symmetry=sign_symmetry,
         )
 
     return polymat.from_(node).symmetric()
@@ -62,6 +76,7 @@ def sos_monomial_basis(
     expression: MatrixExpression,
     variables: MatrixExpression,
     sparse_smr: bool | None = None,
+    newton_polytope: str | None = 'hull',
 ):
     """
     Defines an SOS monomial basis $Z(x)$ used for SOS decomposition.
@@ -71,6 +86,12 @@ def sos_monomial_basis(
             as $p(x) = Z(x)^T Q Z(x)$ for some a monomial vector $Z(x)$.
         variables: Defines the polynomial variables.
         sparse_smr: If True, no SOS decomposition variables are defined
+        newton_polytope: If sparse_smr is False, the monomials are pruned to the ones
+            contained in half the Newton polytope of $p(x)$. With 'hull', the facets of
+            the Newton polytope are computed once and all monomials are tested at once.
+            With 'lp', a linear program is solved per monomial, which is slower but more
+            robust for many variables. If None, the monomials are only filtered
+            by their degree.
     """
 
     if sparse_smr is None:
@@ -85,6 +106,7 @@ def sos_monomial_basis(
         node = init_sos_monomial_basis(
             child=expression,
             variables=variables,
+            newton_polytope=newton_polytope,
         )
 
     return polymat.from_(node)
@@ -30,12 +30,16 @@ def gram_matrix[State: BaseState](
     monomials: MonomialVectorExpression[State] | None = None,
     auxilliary_variable_symbol: AuxiliaryVariableSymbol | None = None,
     sparse_smr: bool | None = None,
+    newton_polytope: str | None = 'hull',
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
 ) -> SymmetricMatrixExpression[State]: ...
 
 def sos_monomial_basis[State: BaseState](
     expression: MatrixExpression[State],
     variables: VariableVectorExpression[State],
     sparse_smr: bool | None = None,
+    newton_polytope: str | None = 'hull',
 ) -> MonomialVectorExpression[State]: ...
 
 class define_multiplier[State: BaseState]:
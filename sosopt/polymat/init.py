@@ -106,6 +106,8 @@ class GramMatrixImpl(GramMatrix):
     monomials: ExpressionNode
     variables: GramMatrix.VariableType
     auxilliary_variable_symbol: AuxiliaryVariableSymbol | None
+    term_sparsity_order: int | None
+    sign_symmetry: bool
     stack: tuple[FrameSummary, ...]
 
 
@@ -114,15 +116,24 @@ def init_gram_matrix(
     variables: GramMatrix.VariableType,
     monomials: ExpressionNode | None = None,
     auxilliary_variable_symbol: AuxiliaryVariableSymbol | None = None,
+    newton_polytope: str | None = 'hull',
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
 ):
     if monomials is None:
-        monomials = init_sos_monomial_basis(child=child, variables=variables)
+        monomials = init_sos_monomial_basis(
+            child=child,
+            variables=variables,
+            newton_polytope=newton_polytope,
+        )
 
     return GramMatrixImpl(
         child=child,
         variables=variables,
         monomials=monomials,
         auxilliary_variable_symbol=auxilliary_variable_symbol,
+        term_sparsity_order=term_sparsity_order,
+        sign_symmetry=sign_symmetry,
         stack=GramMatrix.get_frame_summary(),
     )
 
@@ -155,15 +166,18 @@ def init_gram_matrix_sparse(
 class QuadraticMonomialVectorImpl(SOSMonomialBasis):
     child: ExpressionNode
     variables: SOSMonomialBasis.VariableType
+    newton_polytope: str | None
 
 
 def init_sos_monomial_basis(
     child: ExpressionNode,
     variables: SOSMonomialBasis.VariableType,
+    newton_polytope: str | None = 'hull',
 ):
     return QuadraticMonomialVectorImpl(
         child=child,
         variables=variables,
+        newton_polytope=newton_polytope,
     )
 
 
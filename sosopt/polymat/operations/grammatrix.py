@@ -1,13 +1,17 @@
 import abc
-import itertools
 from typing import override
 
+import numpy as np
+
 import polymat
 from polymat.abc import FrameSummaryMixin, ExpressionNode, SingleChildExpressionNode
 from polymat.typing import SparseRepr
 
 from sosopt.polymat.symbols.auxiliaryvariablesymbol import AuxiliaryVariableSymbol
+from sosopt.profiling import instrument
 from sosopt.state.state import State
+from sosopt.utils.toexponentmatrix import to_exponent_matrix, to_monomials, to_pair_product_groups
+from sosopt.utils.togrammatrixblocks import to_gram_matrix_blocks
 
 
 class GramMatrix(FrameSummaryMixin, SingleChildExpressionNode[State]):
@@ -23,18 +27,26 @@ class GramMatrix(FrameSummaryMixin, SingleChildExpressionNode[State]):
     @abc.abstractmethod
     def auxilliary_variable_symbol(self) -> AuxiliaryVariableSymbol | None: ...
 
+    # If term sparsity or sign symmetry is exploited, only pairs of monomials in the same
+    # block are parametrized, which makes the Gram matrix block-diagonal up to a permutation.
+    @property
+    @abc.abstractmethod
+    def term_sparsity_order(self) -> int | None: ...
+
+    @property
+    @abc.abstractmethod
+    def sign_symmetry(self) -> bool: ...
+
     def __str__(self):
         return f"sos_smr({self.child}, {self.variables})"
 
     @override
+    @instrument('gram_matrix')
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state=state)
         state, monomial_vector = self.monomials.apply(state=state)
         state, indices = self.to_variable_indices(state, self.variables)
 
-        monomial_degree = SparseRepr.monomial_op.monomial_degree
-        sort_monomial = SparseRepr.monomial_op.sort_monomial
-        add_monomials = SparseRepr.monomial_op.add_monomials
         add_polynomial = SparseRepr.polynomial_matrix_op.add_polynomial_to_polynomial_matrix_mutable
 
         if not (child.shape == (1, 1)):
@@ -48,16 +60,40 @@ class GramMatrix(FrameSummaryMixin, SingleChildExpressionNode[State]):
         # keep order of monomials
         monomials = tuple(monomial_vector.to_monomials())
 
+        # pairs (row, col) with col <= row in row-major order
+        rows, cols = np.tril_indices(len(monomials))
+
+        if self.term_sparsity_order is not None or self.sign_symmetry:
+            def gen_support():
+                if polynomial := child.at(0, 0):
+                    for monomial in polynomial.keys():
+                        yield tuple((index, count) for index, count in monomial if index in indices)
+
+            blocks = to_gram_matrix_blocks(
+                monomials=monomials,
+                support=gen_support(),
+                term_sparsity_order=self.term_sparsity_order,
+                sign_symmetry=self.sign_symmetry,
+            )
+
+            block_of = np.empty(len(monomials), dtype=np.int64)
+            for index, block in enumerate(blocks):
+                block_of[list(block)] = index
+
+            in_same_block = block_of[rows] == block_of[cols]
+            rows, cols = rows[in_same_block], cols[in_same_block]
+
         # group all combinations of monomial pairs that result in the same monomial when multiplied together
-        monomials_prod = {}
-        for (row, row_monom), (col, col_monom) in itertools.product(enumerate(monomials), repeat=2):
-            if col <= row:
-                # if abs(monomial_degree(row_monom) - monomial_degree(col_monom)) <= 1:
-                # print(f'{row_monom=}, {col_monom=}')
-                monom = sort_monomial(add_monomials(row_monom, col_monom))
-                if monom not in monomials_prod:
-                    monomials_prod[monom] = []
-                monomials_prod[monom].append((row, col))
+        basis_indices = tuple(sorted(set(index for monomial in monomials for index, _ in monomial)))
+        exponents = to_exponent_matrix(monomials, basis_indices)
+
+        products, groups = to_pair_product_groups(exponents, rows, cols)
+
+        # the groups are ordered by their first pair, which determines the auxiliary variable indices
+        monomials_prod = {
+            monomial: tuple(zip(rows[group].tolist(), cols[group].tolist()))
+            for monomial, group in zip(to_monomials(products, basis_indices), groups)
+        }
 
         if self.auxilliary_variable_symbol in state.indices:
             start, _ = state.indices[self.auxilliary_variable_symbol]
@@ -10,6 +10,7 @@ from polymat.sparserepr.init import init_sparse_repr_from_iterable
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state.state import State
 from polymat.utils.getstacklines import FrameSummaryMixin, to_operator_traceback
+from sosopt.profiling import instrument
 
 
 class GramMatrixSparse(FrameSummaryMixin, SingleChildExpressionNode):
@@ -67,6 +68,7 @@ class GramMatrixSparse(FrameSummaryMixin, SingleChildExpressionNode):
         return f"quadratic_in({self.child}, {self.variables})"
 
     @override
+    @instrument('gram_matrix')
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state=state)
         state, monomial_vector = self.monomials.apply(state=state)
@@ -82,6 +84,7 @@ class GramMatrixSparse(FrameSummaryMixin, SingleChildExpressionNode):
 
         # keep order of monomials
         monomials = tuple(monomial_vector.to_monomials())
+        position = {monomial: index for index, monomial in enumerate(monomials)}
 
         def gen_polymatrix():
             polynomial = child.at(0, 0)
@@ -102,8 +105,8 @@ class GramMatrixSparse(FrameSummaryMixin, SingleChildExpressionNode):
                     left, right = split_monomial_indices(x_monomial)
 
                     try:
-                        col = monomials.index(left)
-                    except ValueError:
+                        col = position[left]
+                    except KeyError:
                         raise AssertionError(
                             to_operator_traceback(
                                 message=f"{left=} not in {monomials}",
@@ -112,8 +115,8 @@ class GramMatrixSparse(FrameSummaryMixin, SingleChildExpressionNode):
                         )
 
                     try:
-                        row = monomials.index(right)
-                    except ValueError:
+                        row = position[right]
+                    except KeyError:
                         raise AssertionError(
                             to_operator_traceback(
                                 message=f"{right=} not in {monomials}",
@@ -12,6 +12,7 @@ from polymat.expressiontree.nodes import (
     SingleChildExpressionNode,
 )
 
+from sosopt.profiling import instrument
 from sosopt.state.state import State as BaseState
 
 
@@ -35,6 +36,7 @@ class GramMatrixUsingEqConstr[State: BaseState](
         return f"quadratic_in({self.child}, {self.variables})"
 
     @override
+    @instrument('gram_matrix')
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state=state)
         state, monomial_vector = self.monomials.apply(state=state)
@@ -1,95 +1,121 @@
 import abc
-from collections import Counter
-import itertools
-import math
 from typing import override
 
+import numpy as np
+
 from polymat.expressiontree.nodes import (
     SingleChildExpressionNode,
 )
-from polymat.sparserepr.data.monomial import sort_monomial, sort_monomials
+from polymat.sparserepr.data.monomial import (
+    MonomialType,
+    sort_monomial,
+    sort_monomials,
+    split_monomial_indices,
+)
 from polymat.sparserepr.init import init_sparse_repr_from_iterable
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state.state import State
 
+from sosopt.profiling import instrument
+from sosopt.utils.inhalfnewtonpolytope import in_half_newton_polytope
+from sosopt.utils.toexponentmatrix import (
+    is_row_in,
+    to_bounded_exponents,
+    to_exponent_matrix,
+    to_monomials,
+)
+
 
 class SOSMonomialBasis(SingleChildExpressionNode):
     @property
     @abc.abstractmethod
     def variables(self) -> SingleChildExpressionNode.VariableType: ...
 
+    # method used to prune the monomials to half the Newton polytope ('hull' or 'lp'),
+    # or None to only filter the monomials by their degree
+    @property
+    @abc.abstractmethod
+    def newton_polytope(self) -> str | None: ...
+
     def __str__(self):
         return f"sos_monomial_basis({self.child}, {self.variables})"
 
+    def _prune_to_half_newton_polytope(
+        self,
+        exponents: np.ndarray,
+        support: np.ndarray,
+        indices: tuple[int, ...],
+    ) -> tuple[MonomialType, ...]:
+        if not len(exponents) or not len(support):
+            return to_monomials(exponents, indices)
+
+        is_inside = in_half_newton_polytope(
+            exponents=exponents,
+            support=support,
+            method=self.newton_polytope,
+        )
+
+        pruned_exponents = exponents[is_inside]
+        pruned = to_monomials(pruned_exponents, indices)
+
+        # A support monomial that is not the product of two monomials of the pruned basis
+        # can not be represented by any SOS polynomial. To obtain an infeasible SOS problem
+        # rather than a failing Gram matrix construction, its split monomials are kept.
+        rows, cols = np.triu_indices(len(pruned_exponents))
+        is_product = is_row_in(support, pruned_exponents[rows] + pruned_exponents[cols])
+
+        pruned_set = set(pruned)
+
+        def gen_missing_monomials():
+            for monomial in to_monomials(support[~is_product], indices):
+                for split in split_monomial_indices(monomial):
+                    split = sort_monomial(split)
+                    if split not in pruned_set:
+                        pruned_set.add(split)
+                        yield split
+
+        return pruned + tuple(gen_missing_monomials())
+
     # overwrites the abstract method of `ExpressionBaseMixin`
     @override
+    @instrument('sos_monomial_basis')
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state=state)
         state, indices = self.to_variable_indices(state, self.variables)
 
         def gen_monomials():
             for _, polynomial in child.entries():
-                for monomial in polynomial.keys():
-                    yield tuple(
-                        (index, power) for index, power in monomial if index in indices
-                    )
-
-        monomials = set(gen_monomials())
-
-        def gen_monomial_degrees():
-            for monomial in monomials:
-                yield sum(d for _, d in monomial)
-
-        monomial_degrees = tuple(gen_monomial_degrees())
-
-        min_deg = min(math.floor(d / 2) for d in monomial_degrees)
-        max_deg = max(math.ceil(d / 2) for d in monomial_degrees)
-
-        def gen_min_max_degree_per_index():
-            for index in indices:
-                def gen_degrees_per_variable():
-                    for monomial in monomials:
-                        monomial_dict = dict(monomial)
-                        yield monomial_dict.get(index, 0)
+                yield from polynomial.keys()
 
-                min_deg = min(math.floor(v / 2) for v in gen_degrees_per_variable())
-                max_deg = max(math.ceil(v / 2) for v in gen_degrees_per_variable())
+        # rows of the support are unique, the powers of other variables are dropped
+        support = np.unique(to_exponent_matrix(tuple(gen_monomials()), indices), axis=0)
 
-                yield index, (min_deg, max_deg)
+        monomial_degrees = support.sum(axis=1)
 
-        min_max_degree_per_index = dict(gen_min_max_degree_per_index())
+        min_deg = int(monomial_degrees.min()) // 2
+        max_deg = -(-int(monomial_degrees.max()) // 2)
 
-        def gen_combinations():
-            for degree in range(min_deg, max_deg + 1):
-                yield from itertools.combinations_with_replacement(indices, degree)
+        # bounds on the degree of each variable in the monomial basis
+        min_degree_per_index = support.min(axis=0) // 2
+        max_degree_per_index = -(-support.max(axis=0) // 2)
 
-        def acc_combinations(acc, index_combination):
-            state, filtered_monomials = acc
-
-            def gen_filtered_monomials():
-                monomial = sort_monomial(tuple(Counter(index_combination).items()))
-                monomial_dict = dict(monomial)
-
-                def is_candidate():
-                    for index, (min_deg, max_deg) in min_max_degree_per_index.items():
-                        degree = monomial_dict.get(index, 0)
-                        
-                        if not (min_deg <= degree <= max_deg):
-                            return False
-
-                    return True
-
-                if is_candidate():
-                    yield monomial
-                    
-            return state, filtered_monomials + tuple(gen_filtered_monomials())
-
-        *_, (state, monomials) = itertools.accumulate(
-            gen_combinations(),
-            acc_combinations,
-            initial=(state, tuple()),
+        # enumerates only the monomials within the degree bounds
+        exponents = to_bounded_exponents(
+            lower=min_degree_per_index,
+            upper=max_degree_per_index,
+            min_degree=min_deg,
+            max_degree=max_deg,
         )
 
+        if self.newton_polytope is not None:
+            monomials = self._prune_to_half_newton_polytope(
+                exponents=exponents,
+                support=support,
+                indices=indices,
+            )
+        else:
+            monomials = to_monomials(exponents, indices)
+
         sorted_monomials = sort_monomials(monomials)
 
         def gen_polynomial_matrix():
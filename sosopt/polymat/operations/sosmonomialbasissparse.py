@@ -10,6 +10,8 @@ from polymat.sparserepr.init import init_sparse_repr_from_iterable
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state.state import State
 
+from sosopt.profiling import instrument
+
 
 class SOSMonomialBasisSparse(SingleChildExpressionNode):
     """
@@ -55,6 +57,7 @@ class SOSMonomialBasisSparse(SingleChildExpressionNode):
 
     # overwrites the abstract method of `ExpressionBaseMixin`
     @override
+    @instrument('sos_monomial_basis')
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state=state)
         state, indices = self.to_variable_indices(state, self.variables)
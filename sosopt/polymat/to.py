@@ -1,9 +1,19 @@
+import math
+
+import numpy as np
+import scipy.sparse
+import sympy
+
 from sosopt.polymat.sources.polynomialvariable import PolynomialVariable
 from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.solvers.parametricarray import ParametricArray
 import statemonad
 
 import polymat
+from polymat.arrayrepr.init import init_array_repr
+from polymat.sparserepr.data.monomial import monomial_degree
 from polymat.typing import (
+    ArrayRepr,
     MatrixExpression,
 )
 
@@ -11,7 +21,7 @@ from sosopt.state.state import State as BaseState
 
 
 def to_symbol_values[State: BaseState](
-    variable: PolynomialVariable[State], 
+    variable: PolynomialVariable[State],
     value: MatrixExpression[State]
 ):
     def _to_symbol_values(state: State):
@@ -27,3 +37,206 @@ def to_symbol_values[State: BaseState](
         return state, symbol_values
 
     return statemonad.get_map_put(_to_symbol_values)
+
+
+def to_sparse_array[State: BaseState](
+    expr: MatrixExpression[State],
+    variables: tuple[int, ...],
+    name: str | None = None,
+):
+    """
+    Converts an expression that is affine in the given variables to an array representation
+    without creating a dense intermediate array.
+
+    Compared to `polymat.to_array`, the linear part is stored as a sparse CSC array of shape
+    (n_eq, n_param), and the constant part as a dense (n_eq, 1) array. The entries of a matrix
+    expression are stacked column by column.
+    """
+
+    def _to_sparse_array(state: State):
+        state, polymatrix = polymat.to_sparse_repr(expr).apply(state)
+        n_row, n_col = polymatrix.shape
+        n_eq = n_row * n_col
+        n_param = len(variables)
+
+        index_to_array_index = {index: col for col, index in enumerate(variables)}
+        assert len(index_to_array_index) == len(variables), f'Indcies contains duplicates: {variables=}.'
+
+        constant = np.zeros((n_eq, 1), dtype=np.double)
+        rows, cols, values = [], [], []
+
+        for (row, col), polynomial in polymatrix.entries():
+            # column-major ordering consistent with `polymat.to_array`
+            eq_index = row + n_row * col
+
+            for monomial, value in polynomial.items():
+                match monomial_degree(monomial):
+                    case 0:
+                        constant[eq_index, 0] = value
+
+                    case 1:
+                        ((index, _),) = monomial
+
+                        if index not in index_to_array_index:
+                            variable_name = state.get_name(index)
+
+                            raise Exception(''.join((
+                                f'While converting a polynomial expression "{name}" to an array representation, the index {index} ',
+                                f'(associated with the variable "{variable_name}") ' if variable_name else '',
+                                f"found in the expression is not an element of the provided list of variable indices {variables}.",
+                            )))
+
+                        rows.append(eq_index)
+                        cols.append(index_to_array_index[index])
+                        values.append(value)
+
+                    case degree:
+                        sympy_monomial = math.prod(
+                            sympy.Symbol(state.get_name(index) or f'*_{index}') ** power
+                            for index, power in monomial
+                        )
+
+                        raise AssertionError(
+                            (
+                                f'The degree={degree} of the polynomial "{name}" in decision variables'
+                                f" used to encode the optimization problem constraint must not exceed 1. "
+                                f'However, the monomial "{sympy_monomial}" is of higher degree.'
+                            )
+                        )
+
+        linear = scipy.sparse.coo_array(
+            (
+                np.array(values, dtype=np.double),
+                (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)),
+            ),
+            shape=(n_eq, n_param),
+        ).tocsc()
+
+        array_repr: ArrayRepr = init_array_repr(
+            n_eq=n_eq,
+            n_param=n_param,
+            n_row=n_row if 1 < n_col else None,
+        )
+        array_repr.data[0] = constant
+        array_repr.data[1] = linear
+
+        return state, array_repr
+
+    return statemonad.get_map_put(_to_sparse_array)
+
+
+def to_parametric_sparse_array[State: BaseState](
+    expr: MatrixExpression[State],
+    variables: tuple[int, ...],
+    parameters: tuple[int, ...],
+    name: str | None = None,
+):
+    """
+    Converts an expression that is affine in the given variables, and whose coefficients are
+    affine in the given parameters, to a parametric array representation.
+
+    The constant part and the linear part of the array representation are recovered from the
+    parameter values by a sparse matrix-vector product (see `ParametricArray`).
+    """
+
+    def _to_parametric_sparse_array(state: State):
+        state, polymatrix = polymat.to_sparse_repr(expr).apply(state)
+        n_row, n_col = polymatrix.shape
+        n_eq = n_row * n_col
+        n_param = len(variables)
+        n_parameter = len(parameters)
+
+        variable_to_array_index = {index: col for col, index in enumerate(variables)}
+        parameter_to_array_index = {index: col for col, index in enumerate(parameters)}
+        assert not (variable_to_array_index.keys() & parameter_to_array_index.keys()), 'Variables and parameters overlap.'
+
+        constant_rows, constant_parameters, constant_values = [], [], []
+        linear_rows, linear_cols, linear_parameters, linear_values = [], [], [], []
+
+        for (row, col), polynomial in polymatrix.entries():
+            # column-major ordering consistent with `polymat.to_array`
+            eq_index = row + n_row * col
+
+            for monomial, value in polynomial.items():
+                variable_part = tuple((index, power) for index, power in monomial if index in variable_to_array_index)
+                parameter_part = tuple((index, power) for index, power in monomial if index in parameter_to_array_index)
+
+                if len(variable_part) + len(parameter_part) < len(monomial):
+                    index = next(
+                        index for index, _ in monomial
+                        if index not in variable_to_array_index and index not in parameter_to_array_index
+                    )
+                    variable_name = state.get_name(index)
+
+                    raise Exception(''.join((
+                        f'While converting a polynomial expression "{name}" to a parametric array representation, the index {index} ',
+                        f'(associated with the variable "{variable_name}") ' if variable_name else '',
+                        "found in the expression is neither a decision variable nor a parameter.",
+                    )))
+
+                if 1 < monomial_degree(variable_part) or 1 < monomial_degree(parameter_part):
+                    sympy_monomial = math.prod(
+                        sympy.Symbol(state.get_name(index) or f'*_{index}') ** power
+                        for index, power in monomial
+                    )
+
+                    raise AssertionError(
+                        (
+                            f'The polynomial "{name}" must be affine in the decision variables and in the parameters'
+                            f' used to encode the optimization problem constraint. '
+                            f'However, the monomial "{sympy_monomial}" is of higher degree.'
+                        )
+                    )
+
+                # the last column corresponds to the constant parameter 1
+                match parameter_part:
+                    case ((index, _),):
+                        parameter = parameter_to_array_index[index]
+                    case _:
+                        parameter = n_parameter
+
+                match variable_part:
+                    case ((index, _),):
+                        linear_rows.append(eq_index)
+                        linear_cols.append(variable_to_array_index[index])
+                        linear_parameters.append(parameter)
+                        linear_values.append(value)
+
+                    case _:
+                        constant_rows.append(eq_index)
+                        constant_parameters.append(parameter)
+                        constant_values.append(value)
+
+        constant = scipy.sparse.coo_array(
+            (
+                np.array(constant_values, dtype=np.double),
+                (np.array(constant_rows, dtype=np.int64), np.array(constant_parameters, dtype=np.int64)),
+            ),
+            shape=(n_eq, n_parameter + 1),
+        ).tocsr()
+
+        # the (sorted) keys enumerate the non-zero entries of the linear part in CSC order
+        keys = np.array(linear_cols, dtype=np.int64) * n_eq + np.array(linear_rows, dtype=np.int64)
+        unique_keys, entry_indices = np.unique(keys, return_inverse=True)
+
+        linear = scipy.sparse.coo_array(
+            (
+                np.array(linear_values, dtype=np.double),
+                (entry_indices.reshape(-1), np.array(linear_parameters, dtype=np.int64)),
+            ),
+            shape=(len(unique_keys), n_parameter + 1),
+        ).tocsr()
+
+        array = ParametricArray(
+            n_eq=n_eq,
+            n_param=n_param,
+            n_row=n_row if 1 < n_col else None,
+            constant=constant,
+            linear=linear,
+            linear_indices=unique_keys % n_eq,
+            linear_indptr=np.searchsorted(unique_keys // n_eq, np.arange(n_param + 1)),
+        )
+
+        return state, array
+
+    return statemonad.get_map_put(_to_parametric_sparse_array)
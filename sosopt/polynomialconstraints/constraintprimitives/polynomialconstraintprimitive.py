@@ -9,6 +9,7 @@ from polymat.typing import MatrixExpression, State
 from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
 from sosopt.polynomialconstraints.constraintprimitives.decisionvariablesmixin import DecisionVariablesMixin
 from sosopt.coneconstraints.coneconstraint import ConeConstraint
+from sosopt.utils.totuplesubstitutions import to_tuple_substitutions
 
 
 class PolynomialConstraintPrimitive(
@@ -35,6 +36,12 @@ class PolynomialConstraintPrimitive(
         self,
     ) -> StateMonad[State, ConeConstraint]: ...
 
+    def to_cone_constraints(
+        self,
+    ) -> StateMonad[State, tuple[ConeConstraint, ...]]:
+        # primitives that are encoded by more than one cone constraint override this method
+        return self.to_cone_constraint().map(lambda cone_constraint: (cone_constraint,))
+
     def eval(
         self, substitutions: dict[DecisionVariableSymbol, tuple[float, ...]]
     ) -> PolynomialConstraintPrimitive | None:
@@ -46,7 +53,7 @@ class PolynomialConstraintPrimitive(
         )
 
         if len(decision_variable_symbols):
-            evaluated_expression = self.expression.eval(substitutions)
+            evaluated_expression = self.expression.eval(to_tuple_substitutions(substitutions))
 
             return self.copy(
                 expression=evaluated_expression,
@@ -5,11 +5,20 @@ import functools
 from typing import override
 
 from dataclassabc import dataclassabc
+import numpy as np
 
+import statemonad
+
+import polymat
 from polymat.typing import (
     ScalarPolynomialExpression,
+    State,
 )
 
+from sosopt.coneconstraints.diagonaldominance import (
+    init_diagonally_dominant_constraints,
+    init_scaled_diagonally_dominant_constraints,
+)
 from sosopt.coneconstraints.semidefiniteconstraint import init_semi_definite_constraint
 from sosopt.polymat.symbols.auxiliaryvariablesymbol import AuxiliaryVariableSymbol
 from sosopt.polymat.from_ import (
@@ -23,6 +32,8 @@ from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
 from sosopt.polynomialconstraints.polynomialvariablesmixin import (
     PolynomialVariablesMixin,
 )
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
+from sosopt.utils.togrammatrixblocks import to_gram_matrix_pattern_blocks
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -32,6 +43,12 @@ class SumOfSquaresPrimitive(PolynomialVariablesMixin, PolynomialConstraintPrimit
     polynomial_variable_indices: tuple[int, ...]
     decision_variable_symbols: tuple[DecisionVariableSymbol, ...]
     sparse_smr: bool
+    newton_polytope: str | None
+    options: SumOfSquaresOptions
+
+    # matrices B, one for each block Q of the Gram matrix, such that B^T Q B is constrained by
+    # the relaxation instead of Q (see `solve_with_change_of_basis`)
+    change_of_basis: tuple[np.ndarray, ...] | None
 
     @functools.cached_property
     def auxilliary_variable_symbol(self):
@@ -43,6 +60,7 @@ class SumOfSquaresPrimitive(PolynomialVariablesMixin, PolynomialConstraintPrimit
             expression=self.expression,
             variables=self.polynomial_variable,
             sparse_smr=self.sparse_smr,
+            newton_polytope=self.newton_polytope,
         ).cache()
 
     @functools.cached_property
@@ -53,6 +71,8 @@ class SumOfSquaresPrimitive(PolynomialVariablesMixin, PolynomialConstraintPrimit
             monomials=self.sos_monomial_basis,
             auxilliary_variable_symbol=self.auxilliary_variable_symbol,
             sparse_smr=self.sparse_smr,
+            term_sparsity_order=self.options.term_sparsity_order,
+            sign_symmetry=self.options.sign_symmetry,
         ).cache()
 
     def copy(self, /, **others):
@@ -66,6 +86,86 @@ class SumOfSquaresPrimitive(PolynomialVariablesMixin, PolynomialConstraintPrimit
             decision_variable_symbols=None,     # enforce reevaluation of decision variables
         )
 
+    def to_gram_matrix_blocks(self):
+        """
+        Returns the blocks of the block-diagonal Gram matrix as tuples of positions in the
+        SOS monomial basis.
+
+        The blocks are read from the sparsity pattern of the (cached) Gram matrix, hence the
+        term sparsity and sign symmetry blocks are only computed once when the Gram matrix
+        is parametrized.
+        """
+
+        def _to_gram_matrix_blocks(state: State):
+            state, polymatrix = polymat.to_sparse_repr(self.gram_matrix).apply(state)
+
+            blocks = to_gram_matrix_pattern_blocks(
+                size=polymatrix.shape[0],
+                entries=(index for index, polynomial in polymatrix.entries() if polynomial),
+            )
+
+            return state, blocks
+
+        return statemonad.get_map_put(_to_gram_matrix_blocks)
+
+    @override
+    def to_cone_constraints(self):
+        if not self.options.is_block_diagonal and self.options.relaxation == 'sos':
+            return self.to_cone_constraint().map(lambda cone_constraint: (cone_constraint,))
+
+        def _to_cone_constraints(state: State):
+            state, blocks = self.to_gram_matrix_blocks().apply(state)
+
+            match blocks:
+                case (block,):
+                    named_blocks = ((self.name, self.gram_matrix, len(block)),)
+
+                case _:
+                    # the Gram matrix is zero outside of the blocks, hence it is positive
+                    # semidefinite if each diagonal block is positive semidefinite
+                    named_blocks = tuple(
+                        (f'{self.name}_b{index}', self.gram_matrix[block, block], len(block))
+                        for index, block in enumerate(blocks)
+                    )
+
+            cone_constraints = []
+
+            for index, (name, expression, size) in enumerate(named_blocks):
+                if self.options.relaxation != 'sos' and self.change_of_basis is not None:
+                    basis = self.change_of_basis[index]
+                    expression = polymat.from_(basis.T) @ expression @ polymat.from_(basis)
+
+                match self.options.relaxation:
+                    case 'sos':
+                        state, cone_constraint = init_semi_definite_constraint(
+                            name=name,
+                            expression=expression,
+                        ).apply(state)
+                        block_cone_constraints = (cone_constraint,)
+
+                    case 'sdsos':
+                        state, block_cone_constraints = init_scaled_diagonally_dominant_constraints(
+                            name=name,
+                            expression=expression,
+                            size=size,
+                        ).apply(state)
+
+                    case 'dsos':
+                        state, block_cone_constraints = init_diagonally_dominant_constraints(
+                            name=name,
+                            expression=expression,
+                            size=size,
+                        ).apply(state)
+
+                    case _:
+                        raise ValueError(f'Unknown relaxation "{self.options.relaxation}".')
+
+                cone_constraints.extend(block_cone_constraints)
+
+            return state, tuple(cone_constraints)
+
+        return statemonad.get_map_put(_to_cone_constraints)
+
 
 def init_sum_of_squares_primitive(
     name: str,
@@ -73,7 +173,12 @@ def init_sum_of_squares_primitive(
     polynomial_variable_indices: tuple[int, ...],
     decision_variable_symbols: tuple[DecisionVariableSymbol, ...],
     sparse_smr: bool,
+    newton_polytope: str | None = 'hull',
+    options: SumOfSquaresOptions | None = None,
+    change_of_basis: tuple[np.ndarray, ...] | None = None,
 ):
+    if options is None:
+        options = SumOfSquaresOptions()
 
     return SumOfSquaresPrimitive(
         name=name,
@@ -81,4 +186,7 @@ def init_sum_of_squares_primitive(
         polynomial_variable_indices=polynomial_variable_indices,
         decision_variable_symbols=decision_variable_symbols,
         sparse_smr=sparse_smr,
+        newton_polytope=newton_polytope,
+        options=options,
+        change_of_basis=change_of_basis,
     )
@@ -0,0 +1,136 @@
+import itertools
+
+import statemonad
+from statemonad.typing import StateMonad
+
+import polymat
+from polymat.typing import (
+    State as BaseState,
+    MatrixExpression,
+)
+
+from sosopt.polymat.from_ import define_multiplier
+from sosopt.polynomialconstraints.constraintprimitives.decisionvariablesmixin import to_decision_variable_symbols
+from sosopt.polynomialconstraints.constraintprimitives.sumofsquaresprimitive import (
+    init_sum_of_squares_primitive,
+)
+from sosopt.polynomialconstraints.constraintprimitives.zeropolynomialprimitive import (
+    init_zero_polynomial_primitive,
+)
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
+from sosopt.utils.tochordalcliques import to_chordal_cliques
+
+
+def to_correlative_sparsity_cliques[State: BaseState](
+    expressions: tuple[MatrixExpression[State], ...],
+    polynomial_variable_indices: tuple[int, ...],
+    domain_polynomials: tuple[MatrixExpression[State], ...] = tuple(),
+) -> StateMonad[State, tuple[tuple[int, ...], ...]]:
+    """
+    Builds the correlative sparsity pattern graph of the polynomial variables and returns the
+    maximal cliques of a chordal extension of the graph.
+
+    Two variables are connected if they appear together in a monomial of one of the expressions,
+    or if they both appear in the same domain polynomial.
+    """
+
+    def _to_correlative_sparsity_cliques(state: State):
+        # The SOS polynomials of the cliques are full multipliers, whose monomial basis is not
+        # spanned by the split monomials of the sparse SMR, which renders the problem infeasible.
+        if state.sparse_smr:
+            raise Exception(
+                'Correlative sparsity requires the dense monomial basis, '
+                'initialize the state with `sosopt.init_state(sparse_smr=False)`.'
+            )
+
+        polynomial_indices = set(polynomial_variable_indices)
+
+        edges = set()
+
+        for expression in expressions:
+            state, polymatrix = polymat.to_sparse_repr(expression).apply(state)
+
+            for _, polynomial in polymatrix.entries():
+                for monomial in polynomial.keys():
+                    monomial_indices = sorted(
+                        index for index, _ in monomial if index in polynomial_indices
+                    )
+                    edges |= set(itertools.combinations(monomial_indices, 2))
+
+        for domain_polynomial in domain_polynomials:
+            state, variable_indices = polymat.to_variable_indices(domain_polynomial).apply(state)
+
+            domain_indices = sorted(set(variable_indices) & polynomial_indices)
+            edges |= set(itertools.combinations(domain_indices, 2))
+
+        cliques = to_chordal_cliques(
+            nodes=polynomial_variable_indices,
+            edges=edges,
+        )
+
+        return state, cliques
+
+    return statemonad.get_map_put(_to_correlative_sparsity_cliques)
+
+
+def init_correlative_sparsity_primitives[State: BaseState](
+    name: str,
+    expression: MatrixExpression[State],
+    cliques: tuple[tuple[int, ...], ...],
+    polynomial_variable_indices: tuple[int, ...],
+    sparse_smr: bool,
+    newton_polytope: str | None = 'hull',
+    options: SumOfSquaresOptions | None = None,
+):
+    """
+    Decomposes the SOS condition on a scalar polynomial expression p(x) into an SOS polynomial s_k(x_k)
+    for each clique x_k of the correlative sparsity pattern and a zero polynomial condition
+    p(x) - sum_k s_k(x_k) = 0.
+    """
+
+    def _init_correlative_sparsity_primitives(state: State):
+        state, max_degrees = polymat.to_degree(
+            expression, variables=polynomial_variable_indices
+        ).apply(state)
+        max_degree = max(max(max_degrees))
+
+        constraint_primitives = []
+        residual = expression
+
+        for index, clique in enumerate(cliques):
+            clique_name = f'{name}_c{index}'
+
+            state, clique_polynomial = define_multiplier(
+                name=f'{clique_name}_s',
+                degree=int(max_degree),
+                variables=clique,
+            ).apply(state)
+
+            constraint_primitives.append(
+                init_sum_of_squares_primitive(
+                    name=clique_name,
+                    expression=clique_polynomial,
+                    decision_variable_symbols=tuple(clique_polynomial.iterate_symbols()),
+                    polynomial_variable_indices=clique,
+                    sparse_smr=sparse_smr,
+                    newton_polytope=newton_polytope,
+                    options=options,
+                )
+            )
+
+            residual = residual - clique_polynomial
+
+        state, decision_variable_symbols = to_decision_variable_symbols(residual).apply(state)
+
+        constraint_primitives.append(
+            init_zero_polynomial_primitive(
+                name=name,
+                expression=residual,
+                polynomial_variable_indices=polynomial_variable_indices,
+                decision_variable_symbols=decision_variable_symbols,
+            )
+        )
+
+        return state, tuple(constraint_primitives)
+
+    return statemonad.get_map_put(_init_correlative_sparsity_primitives)
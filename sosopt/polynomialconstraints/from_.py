@@ -10,6 +10,7 @@ from polymat.typing import (
 
 from sosopt.polynomialconstraints.quadraticmoduleconstraint import init_quadratic_module_constraint
 from sosopt.polynomialconstraints.sumofsqauresconstraint import init_sum_of_squares_constraint
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
 from sosopt.polynomialconstraints.zeropolynomialconstraint import init_zero_polynomial_constraint
 from sosopt.semialgebraicset import SemialgebraicSet
 
@@ -48,6 +49,10 @@ def sos_constraint(
     name: str,
     greater_than_zero: MatrixExpression | None = None,
     smaller_than_zero: MatrixExpression | None = None,
+    correlative_sparsity: bool = False,
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
+    relaxation: str = 'sos',
 ):
     """
     This polynomial constraint ensures that a scalar polynomial expression belongs 
@@ -58,6 +63,22 @@ def sos_constraint(
         greater_than_zero: The polynomial expression that must be SOS.
         smaller_than_zero: The polynomial expression whose negative must be SOS.
             This argument is ignore if greater_than_zero is not None.
+        correlative_sparsity: If True, the polynomial is decomposed into a sum of SOS
+            polynomials, one for each maximal clique of a chordal extension of the
+            correlative sparsity pattern of the polynomial variables. Requires a state
+            initialized with `sparse_smr=False`. The Gram matrices of the SOS polynomials are
+            then accessed through the `primitives` of the constraint.
+        term_sparsity_order: If not None, the Gram matrix is block-diagonalized according to
+            the term sparsity pattern of the polynomial (TSSOS) and each block is encoded as a
+            separate semidefinite constraint. The order defines the number of iterations used
+            to extend the support when computing the blocks.
+        sign_symmetry: If True, the sign symmetries of the polynomial are detected from its
+            support and the Gram matrix is block-diagonalized by the resulting parity classes
+            of the monomials. Each block is encoded as a separate semidefinite constraint.
+        relaxation: With 'sos', the Gram matrix is constrained to be positive semidefinite.
+            With 'sdsos' or 'dsos', it is constrained to be scaled diagonally dominant
+            (second-order cone constraints) or diagonally dominant (linear inequality
+            constraints), which is conservative but results in a much cheaper problem.
 
     Returns:
         (StateMonad[SumOfSqauresConstraint]): A polynomial constraint
@@ -81,6 +102,12 @@ def sos_constraint(
     return init_sum_of_squares_constraint(
         name=name,
         positive_matrix=positive_matrix,
+        correlative_sparsity=correlative_sparsity,
+        options=SumOfSquaresOptions(
+            term_sparsity_order=term_sparsity_order,
+            sign_symmetry=sign_symmetry,
+            relaxation=relaxation,
+        ),
     )
 
 
@@ -140,6 +167,10 @@ def quadratic_module_constraint(
     domain: SemialgebraicSet | None = None,
     greater_than_zero: MatrixExpression | None = None,
     smaller_than_zero: MatrixExpression | None = None,
+    correlative_sparsity: bool = False,
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
+    relaxation: str = 'sos',
 ):
     """
     This polynomial constraint defines a non-negativity condition on a subset of the 
@@ -152,6 +183,18 @@ def quadratic_module_constraint(
         greater_than_zero: The polynomial expression that must be non-negative on the domain.
         smaller_than_zero: The polynomial expression that must be non-positive on the domain.
             This argument is ignore if greater_than_zero is not None.
+        correlative_sparsity: If True, the SOS certificate is decomposed into a sum of SOS
+            polynomials, one for each maximal clique of a chordal extension of the
+            correlative sparsity pattern, and each multiplier is defined on the clique
+            containing the variables of its domain polynomial. Requires a state initialized
+            with `sparse_smr=False`.
+        term_sparsity_order: If not None, the Gram matrices of the SOS polynomials are
+            block-diagonalized according to their term sparsity patterns (TSSOS). The order
+            defines the number of iterations used to extend the support when computing the blocks.
+        sign_symmetry: If True, the Gram matrices of the SOS polynomials are block-diagonalized
+            according to the sign symmetries detected from their supports.
+        relaxation: Cone used to constrain the Gram matrices of the SOS polynomials,
+            'sos', 'sdsos' or 'dsos' (see `sos_constraint`).
 
     Returns:
         (StateMonad[QuadraticModuleConstraint]): A polynomial constraint
@@ -179,4 +222,10 @@ def quadratic_module_constraint(
         name,
         expression=positive_matrix,
         domain=domain,
+        correlative_sparsity=correlative_sparsity,
+        options=SumOfSquaresOptions(
+            term_sparsity_order=term_sparsity_order,
+            sign_symmetry=sign_symmetry,
+            relaxation=relaxation,
+        ),
     )
\ No newline at end of file
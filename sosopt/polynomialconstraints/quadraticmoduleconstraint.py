@@ -17,10 +17,15 @@ from sosopt.polynomialconstraints.constraintprimitives.polynomialconstraintprimi
     PolynomialConstraintPrimitive,
 )
 from sosopt.polynomialconstraints.constraintprimitives.decisionvariablesmixin import to_decision_variable_symbols
+from sosopt.polynomialconstraints.correlativesparsity import (
+    init_correlative_sparsity_primitives,
+    to_correlative_sparsity_cliques,
+)
 from sosopt.polynomialconstraints.polynomialvariablesmixin import (
     PolynomialVariablesMixin,
     to_polynomial_variable_indices,
 )
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
 from sosopt.polymat.from_ import define_multiplier
 from sosopt.polymat.sources.polynomialvariable import ScalarPolynomialVariable
 from sosopt.semialgebraicset import SemialgebraicSet
@@ -86,6 +91,8 @@ def init_quadratic_module_constraint(
     name: str,
     expression: MatrixExpression,
     domain: SemialgebraicSet | None = None,
+    correlative_sparsity: bool = False,
+    options: SumOfSquaresOptions | None = None,
 ):
     def create_constraint(state: State):
         if domain is None:
@@ -118,18 +125,29 @@ def init_quadratic_module_constraint(
 
         match shape:
             case (1, 1):
-                get_name = lambda r, c, d: f"{name}_{d}"  # noqa: E731
+                get_entry_name = lambda r, c: name  # noqa: E731
             case (1, _):
-                get_name = lambda r, c, d: f"{name}_{c}_{d}"  # noqa: E731
+                get_entry_name = lambda r, c: f"{name}_{c}"  # noqa: E731
             case (_, 1):
-                get_name = lambda r, c, d: f"{name}_{r}_{d}"  # noqa: E731
+                get_entry_name = lambda r, c: f"{name}_{r}"  # noqa: E731
             case _:
-                get_name = lambda r, c, d: f"{name}_{r}_{c}_{d}"  # noqa: E731
+                get_entry_name = lambda r, c: f"{name}_{r}_{c}"  # noqa: E731
+
+        get_name = lambda r, c, d: f"{get_entry_name(r, c)}_{d}"  # noqa: E731
 
         for row in range(n_rows):
             for col in range(n_cols):
                 condition_entry = expression[row, col]
 
+                if correlative_sparsity:
+                    state, cliques = to_correlative_sparsity_cliques(
+                        expressions=(condition_entry,),
+                        polynomial_variable_indices=polynomial_indices,
+                        domain_polynomials=tuple(domain_polynomials.values()),
+                    ).apply(state)
+                else:
+                    cliques = (polynomial_indices,)
+
                 state, max_cond_degrees = polymat.to_degree(
                     condition_entry,
                     variables=polynomial_indices,
@@ -142,11 +160,22 @@ def init_quadratic_module_constraint(
                 for domain_name, domain_polynomial in domain_polynomials.items():
                     multiplier_name = get_name(row, col, domain_name)
 
+                    if 1 < len(cliques):
+                        # the multiplier is defined on a clique containing all variables of the domain polynomial
+                        state, domain_indices = polymat.to_variable_indices(domain_polynomial).apply(state)
+                        domain_indices = set(domain_indices).intersection(polynomial_indices)
+
+                        multiplier_indices = next(
+                            clique for clique in cliques if domain_indices.issubset(clique)
+                        )
+                    else:
+                        multiplier_indices = polynomial_indices
+
                     state, multiplier = define_multiplier(
                         name=f'{multiplier_name}_m',
                         degree=max(max_domain_degree, max_cond_degree),
                         multiplicand=domain_polynomial,
-                        variables=polynomial_indices,
+                        variables=multiplier_indices,
                     ).apply(state)
 
                     multipliers_entry[domain_name] = multiplier
@@ -161,25 +190,44 @@ def init_quadratic_module_constraint(
                                 name=multiplier_name,
                                 expression=multiplier,
                                 decision_variable_symbols=tuple(multiplier.iterate_symbols()),
-                                polynomial_variable_indices=polynomial_indices,
+                                polynomial_variable_indices=multiplier_indices,
                                 sparse_smr=state.sparse_smr,
+                                newton_polytope=state.newton_polytope,
+                                options=options,
                             )
                         )
 
                 multipliers[row, col] = multipliers_entry
                 sos_certificates[row, col] = sos_certificate
 
-                state, decision_variable_symbols = to_decision_variable_symbols(sos_certificate).apply(state)
-
-                constraint_primitives.append(
-                    init_sum_of_squares_primitive(
-                        name=name,
+                if 1 < len(cliques):
+                    # one SOS polynomial per clique of the correlative sparsity pattern
+                    state, primitives = init_correlative_sparsity_primitives(
+                        name=get_entry_name(row, col),
                         expression=sos_certificate,
+                        cliques=cliques,
                         polynomial_variable_indices=polynomial_indices,
-                        decision_variable_symbols=decision_variable_symbols,
                         sparse_smr=state.sparse_smr,
+                        newton_polytope=state.newton_polytope,
+                        options=options,
+                    ).apply(state)
+
+                    constraint_primitives.extend(primitives)
+
+                else:
+                    state, decision_variable_symbols = to_decision_variable_symbols(sos_certificate).apply(state)
+
+                    constraint_primitives.append(
+                        init_sum_of_squares_primitive(
+                            name=name,
+                            expression=sos_certificate,
+                            polynomial_variable_indices=polynomial_indices,
+                            decision_variable_symbols=decision_variable_symbols,
+                            sparse_smr=state.sparse_smr,
+                            newton_polytope=state.newton_polytope,
+                            options=options,
+                        )
                     )
-                )
 
         match shape:
             case (1, 1):
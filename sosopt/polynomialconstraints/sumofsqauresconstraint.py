@@ -10,11 +10,18 @@ import polymat
 from polymat.typing import MatrixExpression
 
 from sosopt.polynomialconstraints.constraintprimitives.decisionvariablesmixin import to_decision_variable_symbols
+from sosopt.polynomialconstraints.constraintprimitives.polynomialconstraintprimitive import (
+    PolynomialConstraintPrimitive,
+)
 from sosopt.polynomialconstraints.constraintprimitives.sumofsquaresprimitive import (
-    SumOfSquaresPrimitive,
     init_sum_of_squares_primitive,
 )
+from sosopt.polynomialconstraints.correlativesparsity import (
+    init_correlative_sparsity_primitives,
+    to_correlative_sparsity_cliques,
+)
 from sosopt.polynomialconstraints.polynomialconstraint import PolynomialConstraint
+from sosopt.polynomialconstraints.sumofsquaresoptions import SumOfSquaresOptions
 from sosopt.polynomialconstraints.polynomialvariablesmixin import (
     PolynomialVariablesMixin,
     to_polynomial_variable_indices,
@@ -24,7 +31,7 @@ from sosopt.polynomialconstraints.polynomialvariablesmixin import (
 @dataclassabc(frozen=True, slots=True)
 class SumOfSqauresConstraint(PolynomialVariablesMixin, PolynomialConstraint):
     name: str  # override
-    primitives: tuple[SumOfSquaresPrimitive]  # override
+    primitives: tuple[PolynomialConstraintPrimitive, ...]  # override
     polynomial_variable_indices: tuple[int, ...]  # override
 
     # the parametrized polynomial matrix that is required to be SOS in each entry
@@ -35,23 +42,36 @@ class SumOfSqauresConstraint(PolynomialVariablesMixin, PolynomialConstraint):
 
     def copy(self, /, **others):
         return replace(self, **others)
+
+    def _to_single_primitive(self):
+        # with correlative sparsity, or for a matrix condition, the Gram matrices of the
+        # individual SOS polynomials are accessed through `primitives`
+        if 1 < len(self.primitives):
+            raise Exception(
+                f'SOS constraint {self.name} consists of {len(self.primitives)} primitives, '
+                'access their Gram matrices through `primitives` instead.'
+            )
+
+        return self.primitives[0]
     
     @property
     def auxilliary_variable_symbol(self):
-        return self.primitives[0].auxilliary_variable_symbol
+        return self._to_single_primitive().auxilliary_variable_symbol
 
     @property
     def sos_monomial_basis(self):
-        return self.primitives[0].sos_monomial_basis
+        return self._to_single_primitive().sos_monomial_basis
     
     @property
     def gram_matrix(self):
-        return self.primitives[0].gram_matrix
+        return self._to_single_primitive().gram_matrix
 
 
 def init_sum_of_squares_constraint(
     name: str,
     positive_matrix: MatrixExpression,
+    correlative_sparsity: bool = False,
+    options: SumOfSquaresOptions | None = None,
 ):
     def create_constraint(state: State):
         state, polynomial_indices= to_polynomial_variable_indices(
@@ -62,21 +82,52 @@ def init_sum_of_squares_constraint(
 
         constraint_primitives = []
 
+        match (n_rows, n_cols):
+            case (1, 1):
+                get_name = lambda r, c: name  # noqa: E731
+            case _:
+                get_name = lambda r, c: f"{name}_{r}_{c}"  # noqa: E731
+
         for row in range(n_rows):
             for col in range(n_cols):
                 condition_entry = positive_matrix[row, col]
 
-                state, decision_variable_symbols = to_decision_variable_symbols(condition_entry).apply(state)
-
-                constraint_primitives.append(
-                    init_sum_of_squares_primitive(
-                        name=name,
+                if correlative_sparsity:
+                    state, cliques = to_correlative_sparsity_cliques(
+                        expressions=(condition_entry,),
+                        polynomial_variable_indices=polynomial_indices,
+                    ).apply(state)
+                else:
+                    cliques = (polynomial_indices,)
+
+                if 1 < len(cliques):
+                    # one SOS polynomial per clique of the correlative sparsity pattern
+                    state, primitives = init_correlative_sparsity_primitives(
+                        name=get_name(row, col),
                         expression=condition_entry,
-                        decision_variable_symbols=decision_variable_symbols,
+                        cliques=cliques,
                         polynomial_variable_indices=polynomial_indices,
                         sparse_smr=state.sparse_smr,
+                        newton_polytope=state.newton_polytope,
+                        options=options,
+                    ).apply(state)
+
+                    constraint_primitives.extend(primitives)
+
+                else:
+                    state, decision_variable_symbols = to_decision_variable_symbols(condition_entry).apply(state)
+
+                    constraint_primitives.append(
+                        init_sum_of_squares_primitive(
+                            name=name,
+                            expression=condition_entry,
+                            decision_variable_symbols=decision_variable_symbols,
+                            polynomial_variable_indices=polynomial_indices,
+                            sparse_smr=state.sparse_smr,
+                            newton_polytope=state.newton_polytope,
+                            options=options,
+                        )
                     )
-                )
 
         constraint = SumOfSqauresConstraint(
             name=name,
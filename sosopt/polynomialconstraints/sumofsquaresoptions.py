@@ -0,0 +1,25 @@
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class SumOfSquaresOptions:
+    """
+    Options defining how the Gram matrix of an SOS polynomial is constrained.
+    """
+
+    # order of the term sparsity iteration, term sparsity is not exploited if None
+    term_sparsity_order: int | None = None
+
+    # if True, the Gram matrix is block-diagonalized according to the sign symmetries of the polynomial
+    sign_symmetry: bool = False
+
+    # cone used to constrain the Gram matrix: 'sos' (positive semidefinite),
+    # 'sdsos' (scaled diagonally dominant) or 'dsos' (diagonally dominant)
+    relaxation: str = 'sos'
+
+    @property
+    def is_block_diagonal(self) -> bool:
+        return self.term_sparsity_order is not None or self.sign_symmetry
+
+    def copy(self, /, **others):
+        return replace(self, **others)
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    stage: str
+
+    # name of the constraint being processed, inherited from the enclosing stage if not given
+    constraint: str | None
+
+    # start time in seconds relative to the start of the profiler, and wall time in seconds
+    start: float
+    duration: float
+
+    # nesting level of the stage, the durations of nested stages are included in their parents
+    depth: int
+
+    thread_id: int
+
+    # peak and retained memory allocated within the stage in bytes if memory tracking is enabled
+    peak_bytes: int | None = None
+    retained_bytes: int | None = None
+
+
+@dataclass
+class _MemoryFrame:
+    # traced memory at the start of the stage, and peak traced memory observed so far
+    start: int
+    peak: int
+
+
+def _add_to_summary(entry: dict, event: StageEvent):
+    entry['count'] += 1
+    entry['time'] += event.duration
+
+    if event.peak_bytes is not None:
+        entry['peak_bytes'] = max(entry.get('peak_bytes', 0), event.peak_bytes)
+        entry['retained_bytes'] = entry.get('retained_bytes', 0) + event.retained_bytes
+
+
+@dataclass(frozen=True)
+class Profile:
+    events: tuple[StageEvent, ...]
+
+    def to_stage_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the call count and the total wall time of each stage, as well as the maximum
+        peak and the total retained memory if memory tracking is enabled.
+        """
+
+        summary: dict[str, dict[str, float]] = {}
+
+        for event in self.events:
+            _add_to_summary(summary.setdefault(event.stage, {'count': 0, 'time': 0.0}), event)
+
+        return summary
+
+    def to_constraint_summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Returns the summary of each stage (see `to_stage_summary`) per constraint name.
+        """
+
+        summary: dict[str, dict[str, dict[str, float]]] = {}
+
+        for event in self.events:
+            if event.constraint is None:
+                continue
+
+            entry = summary.setdefault(event.constraint, {}).setdefault(event.stage, {'count': 0, 'time': 0.0})
+            _add_to_summary(entry, event)
+
+        return summary
+
+    def to_dict(self):
+        return {
+            'stages': self.to_stage_summary(),
+            'constraints': self.to_constraint_summary(),
+            'events': [asdict(event) for event in self.events],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Returns the events in the Chrome trace event format, which can be opened in
+        chrome://tracing or Perfetto after writing it with `json.dump`.
+        """
+
+        pid = os.getpid()
+
+        return {
+            'traceEvents': [
+                {
+                    'name': event.stage,
+                    'cat': 'sosopt',
+                    'ph': 'X',
+                    'ts': event.start * 1e6,
+                    'dur': event.duration * 1e6,
+                    'pid': pid,
+                    'tid': event.thread_id,
+                    'args': {
+                        key: value
+                        for key, value in (
+                            ('constraint', event.constraint),
+                            ('peak_bytes', event.peak_bytes),
+                            ('retained_bytes', event.retained_bytes),
+                        )
+                        if value is not None
+                    },
+                }
+                for event in self.events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+
+class Profiler:
+    """
+    Records the wall time and optionally the memory of the stages of the compile-and-solve pipeline.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[StageEvent], None] | None = None,
+        memory: bool = False,
+    ):
+        self.callback = callback
+        self.memory = memory
+        self.start = time.perf_counter()
+        self._events: list[StageEvent] = []
+
+    def add(self, event: StageEvent):
+        self._events.append(event)
+
+        if self.callback is not None:
+            self.callback(event)
+
+    def to_profile(self) -> Profile:
+        return Profile(events=tuple(self._events))
+
+
+_profiler: ContextVar[Profiler | None] = ContextVar('sosopt_profiler', default=None)
+_constraint: ContextVar[str | None] = ContextVar('sosopt_constraint', default=None)
+_depth: ContextVar[int] = ContextVar('sosopt_depth', default=0)
+_memory_frame: ContextVar[_MemoryFrame | None] = ContextVar('sosopt_memory_frame', default=None)
+
+# events recorded since the start of the outermost solve
+_solve_events: ContextVar[list[StageEvent] | None] = ContextVar('sosopt_solve_events', default=None)
+
+
+@contextmanager
+def profile(
+    callback: Callable[[StageEvent], None] | None = None,
+    memory: bool = False,
+) -> Iterator[Profiler]:
+    """
+    Records the stages of all SOS problems compiled and solved within the context.
+
+    Each `ConicProblemResult` created within the context is attached the profile of the stages
+    recorded since its solve started, whereas the profiler returns the stages of all solves.
+
+    Args:
+        callback: Optional function called with each recorded stage event.
+        memory: If True, the peak and retained memory of each stage is recorded using `tracemalloc`,
+            which slows down the pipeline. Only allocations made through Python's allocator are
+            traced (including numpy arrays, but not the internal memory of the solvers).
+            Memory of stages running concurrently in different threads is not separated.
+
+    Example:
+        ``` python
+        with sosopt.profile() as profiler:
+            state, result = problem.solve().apply(state)
+
+        print(result.profile.to_stage_summary())
+
+        # peak and retained memory per stage and constraint
+        with sosopt.profile(memory=True) as profiler:
+            state, result = problem.solve().apply(state)
+
+        print(result.profile.to_constraint_summary())
+        ```
+    """
+
+    profiler = Profiler(callback=callback, memory=memory)
+    token = _profiler.set(profiler)
+
+    # only stop tracing if it was started here
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    try:
+        yield profiler
+    finally:
+        _profiler.reset(token)
+
+        if start_tracing:
+            tracemalloc.stop()
+
+
+def current_profile() -> Profile | None:
+    """
+    Returns the profile recorded since the start of the current solve (see `solve_scope`), or
+    the profile recorded so far outside of a solve, or None if no profiler is active.
+    """
+
+    match _profiler.get(), _solve_events.get():
+        case None, _:
+            return None
+        case profiler, None:
+            return profiler.to_profile()
+        case _, events:
+            return Profile(events=tuple(events))
+
+
+@contextmanager
+def solve_scope() -> Iterator[None]:
+    """
+    Collects the stages recorded within the context for the profile of the solve result. Nested
+    scopes are part of the outermost scope, such that the profile of a solve includes its compile
+    stages. The scope is propagated together with the context to other threads.
+    """
+
+    if _profiler.get() is None or _solve_events.get() is not None:
+        yield
+        return
+
+    token = _solve_events.set([])
+
+    try:
+        yield
+    finally:
+        _solve_events.reset(token)
+
+
+@contextmanager
+def stage(name: str, constraint: str | None = None) -> Iterator[None]:
+    """
+    Records the wall time and optionally the memory of a pipeline stage if a profiler is active.
+    """
+
+    profiler = _profiler.get()
+
+    if profiler is None:
+        yield
+        return
+
+    if constraint is None:
+        constraint = _constraint.get()
+
+    if profiler.memory and tracemalloc.is_tracing():
+        parent_frame = _memory_frame.get()
+        current, peak = tracemalloc.get_traced_memory()
+
+        # the peak is reset for each stage, hence it is passed on to the parent stage first
+        if parent_frame is not None:
+            parent_frame.peak = max(parent_frame.peak, peak)
+
+        tracemalloc.reset_peak()
+        frame = _MemoryFrame(start=current, peak=current)
+    else:
+        parent_frame = frame = None
+
+    depth = _depth.get()
+    constraint_token = _constraint.set(constraint)
+    depth_token = _depth.set(depth + 1)
+    frame_token = _memory_frame.set(frame)
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _memory_frame.reset(frame_token)
+        _depth.reset(depth_token)
+        _constraint.reset(constraint_token)
+
+        if frame is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            frame.peak = max(frame.peak, peak)
+
+            if parent_frame is not None:
+                parent_frame.peak = max(parent_frame.peak, frame.peak)
+
+            tracemalloc.reset_peak()
+
+            peak_bytes = frame.peak - frame.start
+            retained_bytes = current - frame.start
+        else:
+            peak_bytes = retained_bytes = None
+
+        event = StageEvent(
+            stage=name,
+            constraint=constraint,
+            start=start - profiler.start,
+            duration=end - start,
+            depth=depth,
+            thread_id=threading.get_ident(),
+            peak_bytes=peak_bytes,
+            retained_bytes=retained_bytes,
+        )
+
+        profiler.add(event)
+
+        if (solve_events := _solve_events.get()) is not None:
+            solve_events.append(event)
+
+
+def instrument(name: str):
+    """
+    Decorator recording each call of the function as a pipeline stage.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
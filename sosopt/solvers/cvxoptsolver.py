@@ -2,14 +2,17 @@ from dataclasses import dataclass
 import math
 import cvxopt
 import numpy as np
+import scipy.sparse
 
 from dataclassabc import dataclassabc
 
 from polymat.typing import ArrayRepr
 
+from sosopt.profiling import stage
 from sosopt.solvers.solveargs import SolverArgs
 from sosopt.solvers.solverdata import SolutionFound, SolutionNotFound
 from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.solvers.warmstart import InitialPoint
 
 
 @dataclass(frozen=True)
@@ -45,16 +48,83 @@ class CVXOptSolutionFound(CVXOptSolverData, SolutionFound):
     def cost(self) -> float:
         return self.primal_objective
 
+    @property
+    def dual_solution(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.z, self.y
+
+    @property
+    def is_optimal(self) -> bool:
+        # the status 'unknown' is accepted as successful, but the solution may be inaccurate
+        return self.status == 'optimal'
+
+
+def to_cone_interior(
+    vector: np.ndarray,
+    dim_l: int,
+    dim_q: list[int],
+    dim_s: list[int],
+    margin: float = 1e-8,
+) -> np.ndarray:
+    """
+    Shifts each cone block of the vector along the identity element of the cone such that
+    it lies strictly inside the cone, as CVXOPT rejects initial points on the boundary.
+    """
+
+    vector = vector.copy()
+    margin = margin * max(1.0, np.abs(vector).max(initial=0.0))
+
+    if dim_l:
+        block = vector[:dim_l]
+        if (step := margin - block.min()) > 0:
+            block += step
+
+    offset = dim_l
+    for dim in dim_q:
+        block = vector[offset:offset + dim]
+        if (step := margin - (block[0] - np.linalg.norm(block[1:]))) > 0:
+            block[0] += step
+        offset += dim
+
+    for dim in dim_s:
+        block = vector[offset:offset + dim * dim]
+        matrix = block.reshape(dim, dim)
+        if (step := margin - np.linalg.eigvalsh((matrix + matrix.T) / 2).min()) > 0:
+            block[::dim + 1] += step
+        offset += dim * dim
+
+    return vector
+
 
 class CVXOPTSolver(SolverMixin):
-    def solve(self, info: SolverArgs):
+    def solve(self, info: SolverArgs, initial_point: InitialPoint | None = None):
+        with stage('solver_input'):
+            solve_cone_program, solver_input = self._to_solver_input(info, initial_point)
+
+        with stage('optimize'):
+            return_val = solve_cone_program(**solver_input)
+
+        with stage('solver_output'):
+            return self._to_solver_data(return_val)
+
+    def _to_solver_input(self, info: SolverArgs, initial_point: InitialPoint | None):
+        """
+        Returns the CVXOPT function solving the cone program and its arguments.
+        """
+
+        def to_spmatrix(array: scipy.sparse.sparray) -> cvxopt.spmatrix:
+            coo = array.tocoo()
+            return cvxopt.spmatrix(coo.data, coo.row, coo.col, size=coo.shape)
+
         inequality_constraints = info.nonneg_orthant + info.second_order_cone + info.semidef_cone
 
         if inequality_constraints:
-            h = cvxopt.matrix(np.vstack(tuple(c[0] for c in inequality_constraints)))
-            G = cvxopt.matrix(np.vstack(tuple(-c[1] for c in inequality_constraints)))
+            h_array = np.vstack(tuple(c[0] for c in inequality_constraints))
+            G_array = -scipy.sparse.vstack(tuple(c[1] for c in inequality_constraints))
+
+            h = cvxopt.matrix(h_array)
+            G = to_spmatrix(G_array)
         else:
-            raise Exception('CVXOPT requires at least one semi-definite constraint.')
+            raise Exception('CVXOPT requires at least one cone constraint.')
 
         def get_dim_s(array: ArrayRepr) -> int:
             dim = np.sqrt(array.n_eq)
@@ -67,27 +137,55 @@ class CVXOPTSolver(SolverMixin):
 
         if info.equality:
             b = cvxopt.matrix(np.vstack(tuple(c[0] for c in info.equality)))
-            A = cvxopt.matrix(np.vstack(tuple(-c[1] for c in info.equality)))
+            A = to_spmatrix(-scipy.sparse.vstack(tuple(c[1] for c in info.equality)))
         else:
             b = None
             A = None
 
-        q = cvxopt.matrix(info.lin_cost[1].T)
+        q = cvxopt.matrix(info.lin_cost[1].T.toarray())
+
+        if initial_point is None:
+            primalstart = None
+            dualstart = None
+
+        else:
+            # the slack of the previous primal solution evaluated at the new constraints
+            s_start = h_array[:, 0] - G_array @ initial_point.x
+
+            primalstart = {
+                "x": cvxopt.matrix(initial_point.x),
+                "s": cvxopt.matrix(to_cone_interior(s_start, dim_l, dim_q, dim_s)),
+            }
+
+            if initial_point.z is None:
+                dualstart = None
+            else:
+                dualstart = {"z": cvxopt.matrix(to_cone_interior(initial_point.z, dim_l, dim_q, dim_s))}
+
+                if info.equality:
+                    dualstart["y"] = cvxopt.matrix(initial_point.y)
 
         if info.quad_cost is None:
-            return_val = cvxopt.solvers.conelp(
+            return cvxopt.solvers.conelp, dict(
                 c=q, G=G, h=h, A=A, b=b,
                 dims={"l": dim_l, "q": dim_q, "s": dim_s},
+                primalstart=primalstart,
+                dualstart=dualstart,
             )
 
         else:
-            P = cvxopt.matrix(info.quad_cost[1].T @ info.quad_cost[1])
+            # (1/2) |Q1 x + Q0|^2 equals (1/2) x^T Q1^T Q1 x + Q0^T Q1 x up to a constant
+            P = to_spmatrix(info.quad_cost[1].T @ info.quad_cost[1])
+            q = q + cvxopt.matrix(info.quad_cost[1].T @ info.quad_cost[0])
 
-            return_val = cvxopt.solvers.coneqp(
+            return cvxopt.solvers.coneqp, dict(
                 P=P, q=q, G=G, h=h, A=A, b=b,
                 dims={"l": dim_l, "q": dim_q, "s": dim_s},
+                # coneqp expects the primal and dual starting point in a single dictionary
+                initvals=None if primalstart is None else primalstart | (dualstart or {}),
             )
 
+    def _to_solver_data(self, return_val: dict):
         status = return_val["status"]
 
         if status == "optimal" or status == "unknown":
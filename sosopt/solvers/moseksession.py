@@ -0,0 +1,68 @@
+from contextlib import ExitStack
+
+import mosek
+
+from sosopt.profiling import stage
+from sosopt.solvers.moseksolver import (
+    MosekTaskData,
+    load_mosek_task,
+    optimize_mosek_task,
+    to_mosek_task_data,
+    update_mosek_task,
+)
+from sosopt.solvers.solveargs import SolverArgs
+from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.solvers.warmstart import InitialPoint
+
+
+class MosekSession(SolverMixin):
+    """
+    Mosek solver that keeps its task alive between solves.
+
+    The task is bound to the structure of the last solved problem, i.e. the number of variables,
+    the cone domains and the number of equality constraints. Solving a problem of the same
+    structure only updates the coefficients that changed, whereas a problem of a different
+    structure replaces the task.
+    """
+
+    def __init__(self):
+        self._exit_stack = ExitStack()
+        self._task: mosek.Task | None = None
+        self._data: MosekTaskData | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._exit_stack.close()
+        self._task = None
+        self._data = None
+
+    def solve(self, info: SolverArgs, initial_point: InitialPoint | None = None):
+        with stage('solver_input'):
+            data = to_mosek_task_data(info)
+
+            if self._task is None or self._data.structure != data.structure:
+                self.close()
+
+                task = self._exit_stack.enter_context(mosek.Task())
+                load_mosek_task(task, data)
+
+                # the task is only kept once the problem is loaded
+                self._task = task
+
+            else:
+                try:
+                    update_mosek_task(self._task, self._data, data)
+
+                except Exception:
+                    # a partially updated task no longer matches the data of the last problem
+                    self.close()
+                    raise
+
+            self._data = data
+
+        return optimize_mosek_task(self._task, data, initial_point)
@@ -1,11 +1,17 @@
+from dataclasses import dataclass
+import warnings
+
 import mosek
 import numpy as np
+import scipy.sparse
 
 from dataclassabc import dataclassabc
 
+from sosopt.profiling import stage
 from sosopt.solvers.solveargs import SolverArgs
 from sosopt.solvers.solverdata import SolutionFound, SolutionNotFound
 from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.solvers.warmstart import InitialPoint
 from sosopt.utils.toquadraticsize import to_quadratic_size
 
 
@@ -23,106 +29,305 @@ class MosekSolutionFound(SolutionFound):
     is_successful: bool
 
 
-class MosekSolver(SolverMixin):
-    def solve(self, info: SolverArgs):
+@dataclass(frozen=True)
+class MosekTaskData:
+    """
+    Numerical data of a Mosek task in the form expected by the Mosek API.
+    """
+
+    # number of decision variables and of task variables including the epigraph variable
+    n_var: int
+    n_task_var: int
+
+    # dense linear cost of size n_task_var
+    c: np.ndarray
+
+    # cone domain type ('r+', 'q', 'rq' or 'svecpsd') and dimension of each conic constraint
+    domains: tuple[tuple[str, int], ...]
+
+    # affine expressions F x + g of all conic constraints
+    F: scipy.sparse.csr_array
+    g: np.ndarray
+
+    # linear equality constraints A x = b
+    A: scipy.sparse.csr_array
+    b: np.ndarray
+
+    @property
+    def structure(self):
+        """
+        Two tasks with the same structure only differ in their coefficients.
+        """
+
+        return self.n_task_var, self.domains, self.A.shape[0]
+
+
+def to_triplets(array: scipy.sparse.sparray, row_offset: int = 0, col_dtype: type = np.int64):
+    """
+    Returns the rows, columns and values of the nonzero entries of a sparse array.
+
+    Mosek expects 64-bit AFE indices, but 32-bit constraint and variable indices, hence the
+    columns are passed to Mosek with col_dtype=np.int32.
+    """
+
+    array = array.tocoo()
+    return (
+        array.row.astype(np.int64) + row_offset,
+        array.col.astype(col_dtype),
+        array.data.astype(np.double),
+    )
+
+
+def to_mosek_task_data(info: SolverArgs) -> MosekTaskData:
+    def to_vectorized_tril_indices(n_col, offset=0):
+        """
+        The row indices for a 2x2 matrix are [0, 1, 3].
+        """
+        size = to_quadratic_size(n_col)
+        row, col = np.tril_indices(size, offset)
+        return np.sort(np.ravel_multi_index((col, row), (size, size)))
+
+    n_var = info.lin_cost[1].shape[1]
+
+    if info.quad_cost is None:
+        n_task_var = n_var
+    else:
+        # additional epigraph variable t of the quadratic cost
+        n_task_var = n_var + 1
+
+    c = np.zeros(n_task_var)
+    c[:n_var] = info.lin_cost[1].toarray()[0]
+
+    def gen_afe_blocks():
+        """
+        Yields the domain, the constant part and the sparse linear part in triplet form of each
+        conic constraint mapped to affine expressions (AFE) in Mosek.
+        """
+
+        for array in info.nonneg_orthant:
+            yield ('r+', array.n_eq), array[0][:, 0], to_triplets(array[1])
+
+        for array in info.second_order_cone:
+            yield ('q', array.n_eq), array[0][:, 0], to_triplets(array[1])
+
+        for array in info.semidef_cone:
+            # Mosek requires only the lower-triangle entries of the semi-definite matrix
+            # scaled such that the inner product is preserved
+            row_indices = to_vectorized_tril_indices(array.n_eq)
+            off_diag_indices = to_vectorized_tril_indices(array.n_eq, -1)
+
+            scale = np.ones(array.n_eq)
+            scale[off_diag_indices] = np.sqrt(2)
+
+            # maps each vectorized matrix entry to its position in the AFE block or -1 if not used
+            afe_indices = np.full(array.n_eq, -1, dtype=np.int64)
+            afe_indices[row_indices] = np.arange(len(row_indices))
+
+            rows, cols, vals = to_triplets(array[1])
+            is_tril = afe_indices[rows] != -1
+
+            yield (
+                ('svecpsd', len(row_indices)),
+                (scale * array[0][:, 0])[row_indices],
+                (afe_indices[rows[is_tril]], cols[is_tril], (scale[rows] * vals)[is_tril]),
+            )
 
         if info.quad_cost is not None:
-            raise Exception('Mosek can not solve a quadratic cost.')
-
-        # def to_quadratic_size(n):
-        #     n_sqrt = np.sqrt(n)
-        #     assert n_sqrt.is_integer(), f'{n=}'
-        #     return int(n_sqrt)
-
-        def to_vectorized_tril_indices(n_col, offset=0):
-            """
-            The row indices for a 2x2 matrix are [0, 2, 3].
-            """
-            size = to_quadratic_size(n_col)
-            row, col = np.tril_indices(size, offset)
-            return sorted(np.ravel_multi_index((col, row), (size, size)))
-        
-        def to_sparse_representation(G):
-            afeidx, varidx = np.nonzero(G)
-            f_val = G[afeidx, varidx]
-            return tuple(afeidx), tuple(varidx), tuple(f_val)
-                
+            # the epigraph 2 t >= q^T q of the quadratic cost (1/2) q^T q is encoded
+            # by the rotated second-order cone (t, 1, q)
+            c[n_var] = 1.0
+
+            q_rows, q_cols, q_vals = to_triplets(info.quad_cost[1], row_offset=2)
+
+            yield (
+                ('rq', info.quad_cost.n_eq + 2),
+                np.concatenate(([0.0, 1.0], info.quad_cost[0][:, 0])),
+                (
+                    np.concatenate(([0], q_rows)).astype(np.int64),
+                    np.concatenate(([n_var], q_cols)).astype(np.int64),
+                    np.concatenate(([1.0], q_vals)),
+                ),
+            )
+
+    F_rows, F_vars = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    F_vals, g = [np.zeros(0)], [np.zeros(0)]
+    domains = []
+    afe_index = 0
+
+    for domain, h, (rows, cols, vals) in gen_afe_blocks():
+        F_rows.append(rows + afe_index)
+        F_vars.append(cols)
+        F_vals.append(vals)
+        g.append(h)
+        domains.append(domain)
+
+        afe_index += len(h)
+
+    F = scipy.sparse.coo_array(
+        (np.concatenate(F_vals), (np.concatenate(F_rows), np.concatenate(F_vars))),
+        shape=(afe_index, n_task_var),
+    ).tocsr()
+
+    if info.equality:
+        b = np.concatenate(tuple(c[0][:, 0] for c in info.equality))
+        A_rows, A_vars, A_vals = to_triplets(-scipy.sparse.vstack(tuple(c[1] for c in info.equality)))
+
+        # the shape includes the epigraph variable
+        A = scipy.sparse.coo_array((A_vals, (A_rows, A_vars)), shape=(b.shape[0], n_task_var)).tocsr()
+    else:
+        b = np.zeros(0)
+        A = scipy.sparse.csr_array((0, n_task_var))
+
+    return MosekTaskData(
+        n_var=n_var,
+        n_task_var=n_task_var,
+        c=c,
+        domains=tuple(domains),
+        F=F,
+        g=np.concatenate(g),
+        A=A,
+        b=b,
+    )
+
+
+def load_mosek_task(task: mosek.Task, data: MosekTaskData):
+    """
+    Loads the problem into an empty Mosek task.
+    """
+
+    task.appendvars(data.n_task_var)
+    task.putcslice(0, data.n_task_var, data.c)
+
+    # variable bounds are set to infinity
+    inf = 0.0
+    task.putvarboundsliceconst(0, data.n_task_var, mosek.boundkey.fr, -inf, +inf)
+
+    def append_domain(kind: str, size: int):
+        match kind:
+            case 'r+':
+                return task.appendrplusdomain(size)
+            case 'q':
+                return task.appendquadraticconedomain(size)
+            case 'rq':
+                return task.appendrquadraticconedomain(size)
+            case 'svecpsd':
+                return task.appendsvecpsdconedomain(size)
+            case _:
+                raise Exception(f'Unknown domain {kind}.')
+
+    domain_indices = tuple(append_domain(kind, size) for kind, size in data.domains)
+
+    if data.domains:
+        n_afe = data.g.shape[0]
+
+        # add the affine expressions of all conic constraints
+        task.appendafes(n_afe)
+        task.putafefentrylist(*to_triplets(data.F, col_dtype=np.int32))
+        task.putafegslice(0, n_afe, data.g)
+
+        # indicate which affine expressions belong to which conic constraint
+        index = 0
+        for domain, (_, size) in zip(domain_indices, data.domains):
+            task.appendaccseq(domain, index, None)
+            index = index + size
+
+    if data.b.shape[0]:
+        n_lin_eq = data.b.shape[0]
+
+        A_rows, A_vars, A_vals = to_triplets(data.A, col_dtype=np.int32)
+
+        task.appendcons(n_lin_eq)
+        task.putaijlist(A_rows.astype(np.int32), A_vars, A_vals)
+        task.putconboundslice(0, n_lin_eq, [mosek.boundkey.fx] * n_lin_eq, data.b, data.b)
+
+    task.putobjsense(mosek.objsense.minimize)
+
+
+def update_mosek_task(task: mosek.Task, previous: MosekTaskData, data: MosekTaskData):
+    """
+    Updates the coefficients of a Mosek task loaded with a problem of the same structure,
+    touching only the coefficients that changed.
+    """
+
+    def to_changed_entries(previous: scipy.sparse.csr_array, current: scipy.sparse.csr_array):
+        # entries that vanish are overwritten with zero
+        diff = (current - previous).tocsr()
+        diff.eliminate_zeros()
+        diff = diff.tocoo()
+
+        if diff.nnz == 0:
+            # indexing with empty index arrays returns a sparse array instead of an empty vector
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0)
+
+        return (
+            diff.row.astype(np.int64),
+            diff.col.astype(np.int32),
+            np.asarray(current[diff.row, diff.col], dtype=np.double),
+        )
+
+    c_indices = np.flatnonzero(previous.c != data.c)
+    if len(c_indices):
+        task.putclist(c_indices.astype(np.int32), data.c[c_indices])
+
+    F_rows, F_vars, F_vals = to_changed_entries(previous.F, data.F)
+    if len(F_rows):
+        task.putafefentrylist(F_rows, F_vars, F_vals)
+
+    g_indices = np.flatnonzero(previous.g != data.g)
+    if len(g_indices):
+        task.putafeglist(g_indices.astype(np.int64), data.g[g_indices])
+
+    A_rows, A_vars, A_vals = to_changed_entries(previous.A, data.A)
+    if len(A_rows):
+        task.putaijlist(A_rows.astype(np.int32), A_vars, A_vals)
+
+    b_indices = np.flatnonzero(previous.b != data.b)
+    if len(b_indices):
+        b = data.b[b_indices]
+        task.putconboundlist(b_indices.astype(np.int32), [mosek.boundkey.fx] * len(b_indices), b, b)
+
+
+def optimize_mosek_task(
+    task: mosek.Task,
+    data: MosekTaskData,
+    initial_point: InitialPoint | None = None,
+):
+    if initial_point is not None:
+        # the interior-point optimizer used for conic problems does not support warm starts
+        warnings.warn(
+            'MOSEK solves the problem with the interior-point optimizer, which does not support '
+            'warm starts. The initial point is ignored.',
+            stacklevel=2,
+        )
+
+    with stage('optimize'):
+        task.optimize()
+
+    with stage('solver_output'):
+        # Get status information about the solution
+        status = task.getsolsta(mosek.soltype.itr)
+
+        if (status == mosek.solsta.optimal):
+            return MosekSolutionFound(
+                solution=np.array(task.getxx(mosek.soltype.itr))[:data.n_var],
+                status=status,
+                iterations=task.getintinf(mosek.iinfitem.intpnt_iter),
+                cost=task.getprimalobj(mosek.soltype.itr),
+                is_successful=True,
+            )
+        else:
+            return MosekSolutionNotFound(
+                status=status,
+            )
+
+
+class MosekSolver(SolverMixin):
+    def solve(self, info: SolverArgs, initial_point: InitialPoint | None = None):
         with mosek.Task() as task:
-            # linear cost
-            q = info.lin_cost[1].T
-            n_var = q.shape[0]
-            task.appendvars(n_var)
-            for j in np.nonzero(q)[0]:
-                task.putcj(j, q[j, 0])
-
-            # variable bounds are set to infinity
-            inf = 0.0
-            for j in range(n_var):
-                task.putvarbound(j, mosek.boundkey.fr, -inf, +inf)
-
-            if info.semidef_cone:
-                def gen_s_arrays():
-                    for array in info.semidef_cone:
-                        row_indices = to_vectorized_tril_indices(array.n_eq)
-                        off_diag_indices = to_vectorized_tril_indices(array.n_eq, -1)
-
-                        array[0][off_diag_indices,:] *= np.sqrt(2)
-                        array[1][off_diag_indices,:] *= np.sqrt(2)
-
-                        # Mosek requires only the lower-triangle entries of the semi-definite matrix
-                        yield array[0][row_indices, :], array[1][row_indices, :]
-
-                s_arrays = tuple(gen_s_arrays())
-
-                h = np.vstack(tuple(c[0] for c in s_arrays))
-                G = np.vstack(tuple(c[1] for c in s_arrays))
-
-                n_eq = G.shape[0]
-                n_var = G.shape[1]
-
-                G_rows, G_vars, G_vals = to_sparse_representation(G)
-    
-                # add semi-definite entries
-                task.appendafes(n_eq)
-                task.putafefentrylist(G_rows, G_vars, G_vals)
-                task.putafegslice(0, n_eq, tuple(h))
-
-                # indicate which semi-definite entries belong to which semi-definite constraint
-                index = 0
-                for array in s_arrays:
-                    n_array_eq = array[0].shape[0]
-                    task.appendacc(task.appendsvecpsdconedomain(n_array_eq), list(range(index, index + n_array_eq)), None)
-                    index = index + n_array_eq
-
-            if info.equality:
-                b = np.vstack(tuple(c[0] for c in info.equality))
-                A = np.vstack(tuple(-c[1] for c in info.equality))
-                n_lin_eq = A.shape[0]
-
-                A_rows, A_vars, A_vals = to_sparse_representation(A)
-
-                task.appendcons(n_lin_eq)
-                task.putaijlist(A_rows, A_vars, A_vals)
-                task.putconboundslice(0, n_lin_eq, tuple(mosek.boundkey.fx for _ in b), tuple(b), tuple(b))
-
-            task.putobjsense(mosek.objsense.minimize)
-
-            task.optimize()
-
-            # Get status information about the solution
-            status = task.getsolsta(mosek.soltype.itr)
-
-            if (status == mosek.solsta.optimal):
-                solver_result = MosekSolutionFound(
-                    solution=np.array(task.getxx(mosek.soltype.itr)),
-                    status=status,
-                    iterations=task.getintinf(mosek.iinfitem.intpnt_iter),
-                    cost=task.getprimalobj(mosek.soltype.itr),
-                    is_successful=True,
-                )
-            else:
-                solver_result = MosekSolutionNotFound(
-                    status=status,
-                )
-
-        return solver_result
\ No newline at end of file
+            with stage('solver_input'):
+                data = to_mosek_task_data(info)
+                load_mosek_task(task, data)
+
+            solver_result = optimize_mosek_task(task, data, initial_point)
+
+        return solver_result
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse
+
+from polymat.arrayrepr.init import init_array_repr
+from polymat.typing import ArrayRepr
+
+
+@dataclass(frozen=True)
+class ParametricArray:
+    """
+    Array representation whose constant and linear parts are affine in a vector of parameters.
+
+    Both parts are stored as sparse matrices with one column per parameter and a last column
+    for the constant parameter 1, such that instantiating the array representation for given
+    parameter values is a sparse matrix-vector product.
+    """
+
+    n_eq: int
+    n_param: int
+    n_row: int | None
+
+    # maps the extended parameter vector to the constant part of shape (n_eq, 1)
+    constant: scipy.sparse.csr_array
+
+    # maps the extended parameter vector to the non-zero entries of the linear part in CSC order
+    linear: scipy.sparse.csr_array
+
+    # row indices and column pointers of the linear part in CSC format
+    linear_indices: np.ndarray
+    linear_indptr: np.ndarray
+
+    @property
+    def n_parameter(self) -> int:
+        return self.constant.shape[1] - 1
+
+    def to_array_repr(self, parameter_values: np.ndarray) -> ArrayRepr:
+        extended_values = np.append(parameter_values, 1.0)
+
+        array_repr: ArrayRepr = init_array_repr(
+            n_eq=self.n_eq,
+            n_param=self.n_param,
+            n_row=self.n_row,
+        )
+        array_repr.data[0] = (self.constant @ extended_values).reshape(-1, 1)
+        array_repr.data[1] = scipy.sparse.csc_array(
+            (self.linear @ extended_values, self.linear_indices, self.linear_indptr),
+            shape=(self.n_eq, self.n_param),
+        )
+
+        return array_repr
+
+    def split(self, dims: tuple[int, ...]) -> tuple['ParametricArray', ...]:
+        """
+        Splits a parametric array of a vector stacking several cones into one parametric array
+        per cone.
+        """
+
+        assert sum(dims) == self.n_eq, f'{dims=} do not sum up to {self.n_eq=}'
+
+        # column of each non-zero entry of the linear part
+        entry_cols = np.repeat(np.arange(self.n_param), np.diff(self.linear_indptr))
+        stops = np.cumsum(dims)
+
+        def gen_arrays():
+            for start, stop in zip(stops - dims, stops):
+                in_cone = (start <= self.linear_indices) & (self.linear_indices < stop)
+                counts = np.bincount(entry_cols[in_cone], minlength=self.n_param)
+
+                yield ParametricArray(
+                    n_eq=int(stop - start),
+                    n_param=self.n_param,
+                    n_row=None,
+                    constant=self.constant[start:stop],
+                    linear=self.linear[in_cone],
+                    linear_indices=self.linear_indices[in_cone] - start,
+                    linear_indptr=np.append(0, np.cumsum(counts)),
+                )
+
+        return tuple(gen_arrays())
@@ -0,0 +1,148 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+import statemonad
+
+import polymat
+from polymat.typing import (
+    MatrixExpression,
+    ScalarPolynomialExpression,
+    VectorExpression,
+)
+
+from sosopt.polymat.to import to_parametric_sparse_array
+from sosopt.solvers.parametricarray import ParametricArray
+from sosopt.solvers.solveargs import (
+    ConeData,
+    SolverArgs,
+    to_stacked_cone_data,
+    to_stacked_cone_names,
+)
+from sosopt.state.state import State
+
+
+class ParametricSolverArgs(NamedTuple):
+    """
+    Solver arguments whose data is affine in a vector of parameters.
+    """
+
+    # cost
+    lin_cost: ParametricArray
+    quad_cost: ParametricArray | None
+
+    # constraints
+    nonneg_orthant: tuple[ParametricArray, ...]
+    second_order_cone: tuple[ParametricArray, ...]
+    semidef_cone: tuple[ParametricArray, ...]
+    equality: tuple[ParametricArray, ...]
+
+    # names of the constraints in the order nonneg_orthant, second_order_cone, semidef_cone, equality
+    constraint_names: tuple[str, ...]
+
+    indices: tuple[int, ...]
+    parameter_indices: tuple[int, ...]
+
+    # for debugging
+    variable_names: tuple[str, ...]
+
+    @property
+    def n_parameter(self):
+        return len(self.parameter_indices)
+
+    def to_solver_args(self, parameter_values: np.ndarray) -> SolverArgs:
+        """
+        Instantiates the solver arguments for the parameter values ordered as the parameter indices.
+        """
+
+        assert len(parameter_values) == self.n_parameter, f'{len(parameter_values)=}, {self.n_parameter=}'
+
+        def to_array_reprs(arrays: tuple[ParametricArray, ...]):
+            return tuple(array.to_array_repr(parameter_values) for array in arrays)
+
+        return SolverArgs(
+            lin_cost=self.lin_cost.to_array_repr(parameter_values),
+            quad_cost=None if self.quad_cost is None else self.quad_cost.to_array_repr(parameter_values),
+            nonneg_orthant=to_array_reprs(self.nonneg_orthant),
+            second_order_cone=to_array_reprs(self.second_order_cone),
+            semidef_cone=to_array_reprs(self.semidef_cone),
+            equality=to_array_reprs(self.equality),
+            constraint_names=self.constraint_names,
+            indices=self.indices,
+            variable_names=self.variable_names,
+        )
+
+
+def to_parametric_solver_args(
+    indices: tuple[int, ...],
+    parameter_indices: tuple[int, ...],
+    lin_cost: ScalarPolynomialExpression | None = None,
+    quad_cost: VectorExpression | None = None,
+    l_data: Iterable[tuple[str, VectorExpression]] | None = None,
+    q_data: Iterable[ConeData] | None = None,
+    s_data: Iterable[tuple[str, VectorExpression]] | None = None,
+    eq_data: Iterable[tuple[str, VectorExpression]] | None = None,
+):
+    if lin_cost is None:
+        lin_cost = polymat.from_polynomial(0)
+
+    def create_parametric_solver_args(state: State):
+        def to_array(state: State, name: str, expr: MatrixExpression):
+            return to_parametric_sparse_array(
+                name=name, expr=expr, variables=indices, parameters=parameter_indices,
+            ).apply(state)
+
+        state, lin_cost_array = to_array(state=state, name="linear_cost", expr=lin_cost)
+
+        if quad_cost is None:
+            quad_cost_array = None
+
+        else:
+            state, quad_cost_array = to_array(
+                state=state, name="quadratic_cost", expr=quad_cost
+            )
+
+        constraint_names = []
+
+        def to_arrays(state: State, data: Iterable[ConeData] | None):
+            arrays = []
+            if data is not None:
+                for entry in data:
+                    name, expr, dims = to_stacked_cone_data(entry)
+                    state, array = to_array(state=state, name=name, expr=expr)
+
+                    if dims is None:
+                        arrays.append(array)
+                        constraint_names.append(name)
+                    else:
+                        arrays.extend(array.split(dims))
+                        constraint_names.extend(to_stacked_cone_names(name, dims))
+
+            return state, tuple(arrays)
+
+        state, l_data_arrays = to_arrays(state, l_data)
+        state, q_data_arrays = to_arrays(state, q_data)
+        state, s_data_arrays = to_arrays(state, s_data)
+        state, eq_data_arrays = to_arrays(state, eq_data)
+
+        def gen_variable_names():
+            for index in indices:
+                if name := state.get_name(index):
+                    yield name
+
+        variable_names = tuple(gen_variable_names())
+
+        return state, ParametricSolverArgs(
+            lin_cost=lin_cost_array,
+            quad_cost=quad_cost_array,
+            nonneg_orthant=l_data_arrays,
+            second_order_cone=q_data_arrays,
+            semidef_cone=s_data_arrays,
+            equality=eq_data_arrays,
+            constraint_names=tuple(constraint_names),
+            indices=indices,
+            parameter_indices=parameter_indices,
+            variable_names=variable_names,
+        )
+
+    return statemonad.get_map_put(create_parametric_solver_args)
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import tempfile
+from typing import Callable, Iterator
+
+import numpy as np
+import scipy.sparse
+
+from polymat.arrayrepr.init import init_array_repr
+from polymat.typing import ArrayRepr
+
+from sosopt.solvers.parametricarray import ParametricArray
+from sosopt.solvers.parametricsolverargs import ParametricSolverArgs
+from sosopt.solvers.solveargs import SolverArgs
+
+
+# identifies the buffer layout
+_MAGIC = 0x534F534F5054   # 'SOSOPT'
+_VERSION = 2
+
+# global header: magic, version, number of blocks, number of integers per block header, number of arrays
+_N_GLOBAL_HEADER = 5
+
+# each array is described by its offset, its number of entries and its data type
+_N_ARRAY_HEADER = 3
+_DTYPES = (np.dtype(np.double), np.dtype(np.int32), np.dtype(np.int64))
+
+# kind of each block in the order of the solver arguments
+_LIN_COST, _QUAD_COST, _NONNEG_ORTHANT, _SECOND_ORDER_CONE, _SEMIDEF_CONE, _EQUALITY = range(6)
+
+# memory maps opened by this process, reused by repeated attachments
+_attached: dict[str, tuple[np.memmap, SolverArgs | ParametricSolverArgs]] = {}
+
+
+def _attach[T](path: str, read: Callable[[np.ndarray, list[np.ndarray]], T]) -> T:
+    if path not in _attached:
+        # copy-on-write such that in-place operations (e.g. sorting indices) do not alter the buffer
+        buffer = np.memmap(path, dtype=np.uint8, mode='c')
+
+        def view(offset: int, count: int, dtype):
+            return buffer[offset:offset + count * np.dtype(dtype).itemsize].view(dtype)
+
+        magic, version, n_blocks, n_block_header, n_arrays = view(0, _N_GLOBAL_HEADER, np.int64)
+        assert magic == _MAGIC and version == _VERSION, f'Invalid buffer {path}.'
+
+        offset = _N_GLOBAL_HEADER * 8
+        block_headers = view(offset, n_blocks * n_block_header, np.int64).reshape(n_blocks, n_block_header)
+
+        offset += block_headers.nbytes
+        array_headers = view(offset, n_arrays * _N_ARRAY_HEADER, np.int64).reshape(n_arrays, _N_ARRAY_HEADER)
+
+        arrays = [
+            view(array_offset, count, _DTYPES[dtype])
+            for array_offset, count, dtype in array_headers.tolist()
+        ]
+
+        _attached[path] = buffer, read(block_headers, arrays)
+
+    return _attached[path][1]
+
+
+def _detach(path: str):
+    _attached.pop(path, None)
+
+
+def _to_index_array(values: np.ndarray) -> np.ndarray:
+    # keep 32-bit indices if possible, such that scipy does not convert them when attaching
+    dtype = np.int32 if values.max(initial=0) < np.iinfo(np.int32).max else np.int64
+    return values.astype(dtype)
+
+
+@contextmanager
+def _share(
+    block_headers: np.ndarray,
+    arrays: tuple[np.ndarray, ...],
+    directory: str | None,
+) -> Iterator[str]:
+    """
+    Writes the block headers and the arrays to one contiguous buffer with an index header.
+    """
+
+    if directory is None:
+        directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+    def align(offset: int):
+        return (offset + 7) // 8 * 8
+
+    arrays = tuple(np.ascontiguousarray(array).reshape(-1) for array in arrays)
+
+    # compute the layout of the buffer
+    offset = (_N_GLOBAL_HEADER + block_headers.size + _N_ARRAY_HEADER * len(arrays)) * 8
+
+    array_headers = []
+    for array in arrays:
+        offset = align(offset)
+        array_headers.append((offset, len(array), _DTYPES.index(array.dtype)))
+        offset += array.nbytes
+
+    size = align(offset)
+
+    file_descriptor, path = tempfile.mkstemp(prefix='sosopt_', suffix='.bin', dir=directory)
+    os.close(file_descriptor)
+
+    try:
+        buffer = np.memmap(path, dtype=np.uint8, mode='w+', shape=(max(size, 1),))
+
+        def write(buffer: np.memmap, offset: int, values: np.ndarray):
+            buffer[offset:offset + values.nbytes] = values.view(np.uint8).reshape(-1)
+
+        n_blocks, n_block_header = block_headers.shape
+        headers = np.concatenate((
+            np.array((_MAGIC, _VERSION, n_blocks, n_block_header, len(arrays)), dtype=np.int64),
+            block_headers.astype(np.int64).reshape(-1),
+            np.array(array_headers, dtype=np.int64).reshape(-1),
+        ))
+        write(buffer, 0, headers)
+
+        for (array_offset, _, _), array in zip(array_headers, arrays):
+            write(buffer, array_offset, array)
+
+        buffer.flush()
+
+        # unmaps the buffer before the file is attached
+        del buffer
+
+        yield path
+
+    finally:
+        _detach(path)
+        os.remove(path)
+
+
+def _gen_blocks(solver_args: SolverArgs | ParametricSolverArgs):
+    yield _LIN_COST, solver_args.lin_cost
+
+    if solver_args.quad_cost is not None:
+        yield _QUAD_COST, solver_args.quad_cost
+
+    for kind, arrays in (
+        (_NONNEG_ORTHANT, solver_args.nonneg_orthant),
+        (_SECOND_ORDER_CONE, solver_args.second_order_cone),
+        (_SEMIDEF_CONE, solver_args.semidef_cone),
+        (_EQUALITY, solver_args.equality),
+    ):
+        for array in arrays:
+            yield kind, array
+
+
+def _to_blocks_by_kind[T](block_headers: np.ndarray, blocks: Iterator[T]) -> dict[int, list[T]]:
+    blocks_by_kind = {kind: [] for kind in range(6)}
+
+    for kind, block in zip(block_headers[:, 0].tolist(), blocks):
+        blocks_by_kind[kind].append(block)
+
+    return blocks_by_kind
+
+
+@dataclass(frozen=True)
+class SharedSolverArgs:
+    """
+    Handle to solver arguments stored in a memory-mapped file.
+
+    All constraint blocks are laid out in one contiguous buffer with an index header, such that
+    the handle is cheap to send to another process. A process attaches to the buffer by calling
+    `to_solver_args`, which creates the arrays as views into the memory map without copying.
+    """
+
+    path: str
+
+    # strings are not stored in the buffer
+    constraint_names: tuple[str, ...]
+    variable_names: tuple[str, ...]
+
+    def to_solver_args(self) -> SolverArgs:
+        """
+        Attaches to the buffer, which is mapped only once per process.
+        """
+
+        return _attach(self.path, self._read_solver_args)
+
+    def detach(self):
+        """
+        Releases the memory map of this process. The solver arguments must no longer be used.
+        """
+
+        _detach(self.path)
+
+    def _read_solver_args(self, block_headers: np.ndarray, arrays: list[np.ndarray]) -> SolverArgs:
+        indices, *block_arrays = arrays
+
+        def gen_array_reprs():
+            for (_, n_eq, n_param, n_row), (constant, data, row_indices, indptr) in zip(
+                block_headers.tolist(), zip(*(iter(block_arrays),) * 4),
+            ):
+                array_repr: ArrayRepr = init_array_repr(
+                    n_eq=n_eq,
+                    n_param=n_param,
+                    n_row=None if n_row == -1 else n_row,
+                )
+                array_repr.data[0] = constant.reshape(-1, 1)
+                array_repr.data[1] = scipy.sparse.csc_array(
+                    (data, row_indices, indptr),
+                    shape=(n_eq, n_param),
+                    copy=False,
+                )
+
+                yield array_repr
+
+        blocks = _to_blocks_by_kind(block_headers, gen_array_reprs())
+        (lin_cost,) = blocks[_LIN_COST]
+
+        return SolverArgs(
+            lin_cost=lin_cost,
+            quad_cost=blocks[_QUAD_COST][0] if blocks[_QUAD_COST] else None,
+            nonneg_orthant=tuple(blocks[_NONNEG_ORTHANT]),
+            second_order_cone=tuple(blocks[_SECOND_ORDER_CONE]),
+            semidef_cone=tuple(blocks[_SEMIDEF_CONE]),
+            equality=tuple(blocks[_EQUALITY]),
+            constraint_names=self.constraint_names,
+            indices=tuple(indices.tolist()),
+            variable_names=self.variable_names,
+        )
+
+
+@dataclass(frozen=True)
+class SharedParametricSolverArgs:
+    """
+    Handle to parametric solver arguments stored in a memory-mapped file, see `SharedSolverArgs`.
+    """
+
+    path: str
+
+    # strings are not stored in the buffer
+    constraint_names: tuple[str, ...]
+    variable_names: tuple[str, ...]
+
+    def to_parametric_solver_args(self) -> ParametricSolverArgs:
+        """
+        Attaches to the buffer, which is mapped only once per process.
+        """
+
+        return _attach(self.path, self._read_parametric_solver_args)
+
+    def detach(self):
+        """
+        Releases the memory map of this process. The solver arguments must no longer be used.
+        """
+
+        _detach(self.path)
+
+    def _read_parametric_solver_args(
+        self, block_headers: np.ndarray, arrays: list[np.ndarray]
+    ) -> ParametricSolverArgs:
+        indices, parameter_indices, *block_arrays = arrays
+
+        # the constant parameter 1 is appended to the parameters
+        n_extended = len(parameter_indices) + 1
+
+        def gen_parametric_arrays():
+            for (_, n_eq, n_param, n_row), (
+                constant_data, constant_indices, constant_indptr,
+                linear_data, linear_indices, linear_indptr,
+                entry_indices, entry_indptr,
+            ) in zip(block_headers.tolist(), zip(*(iter(block_arrays),) * 8)):
+                yield ParametricArray(
+                    n_eq=n_eq,
+                    n_param=n_param,
+                    n_row=None if n_row == -1 else n_row,
+                    constant=scipy.sparse.csr_array(
+                        (constant_data, constant_indices, constant_indptr),
+                        shape=(n_eq, n_extended),
+                        copy=False,
+                    ),
+                    linear=scipy.sparse.csr_array(
+                        (linear_data, linear_indices, linear_indptr),
+                        shape=(len(entry_indices), n_extended),
+                        copy=False,
+                    ),
+                    linear_indices=entry_indices,
+                    linear_indptr=entry_indptr,
+                )
+
+        blocks = _to_blocks_by_kind(block_headers, gen_parametric_arrays())
+        (lin_cost,) = blocks[_LIN_COST]
+
+        return ParametricSolverArgs(
+            lin_cost=lin_cost,
+            quad_cost=blocks[_QUAD_COST][0] if blocks[_QUAD_COST] else None,
+            nonneg_orthant=tuple(blocks[_NONNEG_ORTHANT]),
+            second_order_cone=tuple(blocks[_SECOND_ORDER_CONE]),
+            semidef_cone=tuple(blocks[_SEMIDEF_CONE]),
+            equality=tuple(blocks[_EQUALITY]),
+            constraint_names=self.constraint_names,
+            indices=tuple(indices.tolist()),
+            parameter_indices=tuple(parameter_indices.tolist()),
+            variable_names=self.variable_names,
+        )
+
+
+@contextmanager
+def share_solver_args(
+    solver_args: SolverArgs,
+    directory: str | None = None,
+) -> Iterator[SharedSolverArgs]:
+    """
+    Writes the solver arguments to a memory-mapped file that is removed when the context exits.
+
+    Args:
+        solver_args: Solver arguments to share.
+        directory: Directory of the file, by default '/dev/shm' if available to keep the
+            buffer in memory, otherwise the temporary directory.
+
+    Returns:
+        (SharedSolverArgs): A handle that is cheap to pickle, and from which the solver arguments
+        are attached without copying.
+
+    Example:
+        ``` python
+        state, solver_args = sos_problem.to_solver_args().apply(state)
+
+        with sosopt.share_solver_args(solver_args) as shared:
+            # only the handle is pickled
+            future = executor.submit(solve_shared, shared)
+        ```
+    """
+
+    block_headers = []
+    arrays = [np.fromiter(solver_args.indices, dtype=np.int64, count=len(solver_args.indices))]
+
+    for kind, array in _gen_blocks(solver_args):
+        linear = scipy.sparse.csc_array(array[1])
+        linear.sum_duplicates()
+
+        block_headers.append((kind, array.n_eq, array.n_param, -1 if array.n_row is None else array.n_row))
+        arrays.extend((
+            np.asarray(array[0], dtype=np.double),
+            linear.data.astype(np.double),
+            _to_index_array(linear.indices),
+            _to_index_array(linear.indptr),
+        ))
+
+    with _share(np.array(block_headers, dtype=np.int64).reshape(-1, 4), tuple(arrays), directory) as path:
+        yield SharedSolverArgs(
+            path=path,
+            constraint_names=solver_args.constraint_names,
+            variable_names=solver_args.variable_names,
+        )
+
+
+@contextmanager
+def share_parametric_solver_args(
+    solver_args: ParametricSolverArgs,
+    directory: str | None = None,
+) -> Iterator[SharedParametricSolverArgs]:
+    """
+    Writes the parametric solver arguments to a memory-mapped file that is removed when the
+    context exits, see `share_solver_args`.
+    """
+
+    block_headers = []
+    arrays = [
+        np.fromiter(solver_args.indices, dtype=np.int64, count=len(solver_args.indices)),
+        np.fromiter(solver_args.parameter_indices, dtype=np.int64, count=solver_args.n_parameter),
+    ]
+
+    for kind, array in _gen_blocks(solver_args):
+        block_headers.append((kind, array.n_eq, array.n_param, -1 if array.n_row is None else array.n_row))
+
+        for matrix in (array.constant, array.linear):
+            matrix = scipy.sparse.csr_array(matrix)
+            arrays.extend((
+                matrix.data.astype(np.double),
+                _to_index_array(matrix.indices),
+                _to_index_array(matrix.indptr),
+            ))
+
+        arrays.extend((
+            _to_index_array(np.asarray(array.linear_indices)),
+            _to_index_array(np.asarray(array.linear_indptr)),
+        ))
+
+    with _share(np.array(block_headers, dtype=np.int64).reshape(-1, 4), tuple(arrays), directory) as path:
+        yield SharedParametricSolverArgs(
+            path=path,
+            constraint_names=solver_args.constraint_names,
+            variable_names=solver_args.variable_names,
+        )
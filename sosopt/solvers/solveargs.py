@@ -1,9 +1,13 @@
 from typing import Iterable, NamedTuple
 
+import numpy as np
+import scipy.sparse
+
 from sosopt.utils.toquadraticsize import to_quadratic_size
 import statemonad
 
 import polymat
+from polymat.arrayrepr.init import init_array_repr
 from polymat.typing import (
     ArrayRepr,
     MatrixExpression,
@@ -12,6 +16,10 @@ from polymat.typing import (
     VariableVectorExpression,
 )
 
+from sosopt.polymat.to import to_sparse_array
+from sosopt.profiling import instrument, stage
+from sosopt.solvers.solverdata import SolutionFound
+from sosopt.solvers.warmstart import InitialPoint, WarmStart
 from sosopt.state.state import State
 
 
@@ -26,6 +34,9 @@ class SolverArgs(NamedTuple):
     semidef_cone: tuple[ArrayRepr, ...]
     equality: tuple[ArrayRepr, ...]
 
+    # names of the constraints in the order nonneg_orthant, second_order_cone, semidef_cone, equality
+    constraint_names: tuple[str, ...]
+
     indices: tuple[int, ...]
 
     # for debugging
@@ -35,11 +46,179 @@ class SolverArgs(NamedTuple):
     def n_var(self):
         return len(self.indices)
 
+    def to_index_positions(self) -> np.ndarray:
+        """
+        Returns an array mapping each variable index to its position in the solution vector,
+        or -1 if the variable is not part of the problem.
+        """
+
+        indices = np.fromiter(self.indices, dtype=np.int64, count=len(self.indices))
+
+        positions = np.full(indices.max(initial=-1) + 1, -1, dtype=np.int64)
+        positions[indices] = np.arange(len(indices))
+
+        return positions
+
+    def replace_constraints(self, other: 'SolverArgs') -> 'SolverArgs':
+        """
+        Replaces the arrays of the constraints of this solver arguments by the arrays of the
+        constraints of `other` with the same name, such that only the constraints that changed
+        need to be converted again.
+
+        Both solver arguments must be defined over the same variables, and each replaced
+        constraint must have a unique name and keep its cone and size.
+        """
+
+        if other.indices != self.indices:
+            raise ValueError('The solver arguments are not defined over the same variables.')
+
+        cones = (self.nonneg_orthant, self.second_order_cone, self.semidef_cone, self.equality)
+        other_cones = (other.nonneg_orthant, other.second_order_cone, other.semidef_cone, other.equality)
+
+        # position of each constraint within its cone
+        def gen_positions(cones):
+            for cone, arrays in enumerate(cones):
+                for position in range(len(arrays)):
+                    yield cone, position
+
+        positions = dict(zip(self.constraint_names, gen_positions(cones)))
+        replaced = [list(arrays) for arrays in cones]
+
+        for name, (cone, position) in zip(other.constraint_names, gen_positions(other_cones)):
+            array = other_cones[cone][position]
+
+            if self.constraint_names.count(name) != 1:
+                raise ValueError(f'Constraint "{name}" is not uniquely defined by its name.')
+
+            match positions[name]:
+                case (self_cone, self_position) if (
+                    self_cone == cone and replaced[cone][self_position].n_eq == array.n_eq
+                ):
+                    replaced[cone][self_position] = array
+                case _:
+                    raise ValueError(f'Constraint "{name}" changed its cone or size.')
+
+        return self._replace(
+            nonneg_orthant=tuple(replaced[0]),
+            second_order_cone=tuple(replaced[1]),
+            semidef_cone=tuple(replaced[2]),
+            equality=tuple(replaced[3]),
+        )
+
+    def to_warm_start(self, solver_data: SolutionFound) -> WarmStart:
+        """
+        Stores the primal solution by variable index and the dual solution by constraint name.
+        Duals of constraints whose name is not unique are dropped.
+        """
+
+        indices = np.fromiter(self.indices, dtype=np.int64, count=len(self.indices))
+        primal = np.array(solver_data.solution[:self.n_var], dtype=np.double)
+
+        def gen_dual():
+            if solver_data.dual_solution is None:
+                return
+
+            z, y = solver_data.dual_solution
+
+            cone_arrays = self.nonneg_orthant + self.second_order_cone + self.semidef_cone
+
+            def gen_blocks(vector, arrays):
+                start = 0
+                for array in arrays:
+                    yield vector[start:start + array.n_eq]
+                    start += array.n_eq
+
+            blocks = (*gen_blocks(z, cone_arrays), *gen_blocks(y, self.equality))
+
+            for name, block in zip(self.constraint_names, blocks):
+                if self.constraint_names.count(name) == 1:
+                    yield name, np.array(block, dtype=np.double)
+
+        return WarmStart(
+            indices=indices,
+            primal=primal,
+            dual=dict(gen_dual()),
+        )
+
+    def to_initial_point(self, warm_start: WarmStart) -> InitialPoint:
+        """
+        Maps a warm start onto the variables and constraints of the solver arguments.
+
+        Variables not part of the warm start are initialized with zero. The dual of a constraint
+        not part of the warm start (or of different size) is initialized with the identity element
+        of its cone, respectively with zero for equality constraints.
+        """
+
+        indices = np.fromiter(self.indices, dtype=np.int64, count=len(self.indices))
+        positions = warm_start.to_index_positions()
+
+        selection = np.full(self.n_var, -1, dtype=np.int64)
+        in_range = indices < len(positions)
+        selection[in_range] = positions[indices[in_range]]
+
+        is_found = selection != -1
+        x = np.zeros(self.n_var, dtype=np.double)
+        x[is_found] = warm_start.primal[selection[is_found]]
+
+        if not warm_start.dual:
+            return InitialPoint(x=x, z=None, y=None)
+
+        def nonneg_orthant_identity(array: ArrayRepr):
+            return np.ones(array.n_eq)
+
+        def second_order_cone_identity(array: ArrayRepr):
+            e = np.zeros(array.n_eq)
+            e[0] = 1.0
+            return e
+
+        def semidef_cone_identity(array: ArrayRepr):
+            return np.eye(to_quadratic_size(array.n_eq)).reshape(-1)
+
+        def equality_default(array: ArrayRepr):
+            return np.zeros(array.n_eq)
+
+        def gen_dual(arrays, names, default):
+            for array, name in zip(arrays, names):
+                value = warm_start.dual.get(name)
+
+                if value is not None and len(value) == array.n_eq:
+                    yield value
+                else:
+                    yield default(array)
+
+        n_l = len(self.nonneg_orthant)
+        n_q = len(self.second_order_cone)
+        n_s = len(self.semidef_cone)
+        names = self.constraint_names
+
+        z = np.concatenate((
+            np.zeros(0),
+            *gen_dual(self.nonneg_orthant, names[:n_l], nonneg_orthant_identity),
+            *gen_dual(self.second_order_cone, names[n_l:n_l + n_q], second_order_cone_identity),
+            *gen_dual(self.semidef_cone, names[n_l + n_q:n_l + n_q + n_s], semidef_cone_identity),
+        ))
+        y = np.concatenate((
+            np.zeros(0),
+            *gen_dual(self.equality, names[n_l + n_q + n_s:], equality_default),
+        ))
+
+        return InitialPoint(x=x, z=z, y=y)
+
     def to_summary(self):
         def gen_summary():
             yield f'Number of decision variables: {self.n_var}'
             yield f'Quadratic cost: {self.quad_cost is not None}'
 
+            yield f'Linear inequality constraints: {len(self.nonneg_orthant)}'
+            if self.nonneg_orthant:
+                for index, array in enumerate(self.nonneg_orthant):
+                    yield f'  {index+1}. {array.n_eq}'
+
+            yield f'Second-order cone constraints: {len(self.second_order_cone)}'
+            if self.second_order_cone:
+                for index, array in enumerate(self.second_order_cone):
+                    yield f'  {index+1}. {array.n_eq}'
+
             yield f'Semidefinite constraints: {len(self.semidef_cone)}'
             if self.semidef_cone:
                 for index, array in enumerate(self.semidef_cone):
@@ -57,18 +236,62 @@ class SolverArgs(NamedTuple):
         return '\n'.join(gen_summary())
 
 
+# name and vector expression of a constraint, optionally followed by the dimensions of the
+# cones stacked in the vector expression
+ConeData = tuple[str, VectorExpression] | tuple[str, VectorExpression, tuple[int, ...]]
+
+
+def to_stacked_cone_data(entry: ConeData) -> tuple[str, VectorExpression, tuple[int, ...] | None]:
+    match entry:
+        case (name, expr):
+            return name, expr, None
+        case (name, expr, dims):
+            return name, expr, dims
+
+
+def to_stacked_cone_names(name: str, dims: tuple[int, ...]) -> tuple[str, ...]:
+    return tuple(f'{name}_{index}' for index in range(len(dims)))
+
+
+def _split_array_repr(array: ArrayRepr, dims: tuple[int, ...]) -> tuple[ArrayRepr, ...]:
+    """
+    Splits the array representation of a vector stacking several cones into one array
+    representation per cone.
+    """
+
+    assert sum(dims) == array.n_eq, f'{dims=} do not sum up to {array.n_eq=}'
+
+    constant = array[0]
+    linear = scipy.sparse.csr_array(array[1])
+    stops = np.cumsum(dims)
+
+    def gen_arrays():
+        for start, stop in zip(stops - dims, stops):
+            cone_array: ArrayRepr = init_array_repr(
+                n_eq=int(stop - start),
+                n_param=array.n_param,
+                n_row=None,
+            )
+            cone_array.data[0] = constant[start:stop]
+            cone_array.data[1] = linear[start:stop].tocsc()
+            yield cone_array
+
+    return tuple(gen_arrays())
+
+
 def to_solver_args(
     indices: VariableVectorExpression | tuple[int, ...],
     lin_cost: ScalarPolynomialExpression | None = None,
     quad_cost: VectorExpression | None = None,
     l_data: Iterable[tuple[str, VectorExpression]] | None = None,
-    q_data: Iterable[tuple[str, VectorExpression]] | None = None,
+    q_data: Iterable[ConeData] | None = None,
     s_data: Iterable[tuple[str, VectorExpression]] | None = None,
     eq_data: Iterable[tuple[str, VectorExpression]] | None = None,
 ):
     if lin_cost is None:
         lin_cost = polymat.from_polynomial(0)
 
+    @instrument('to_solver_args')
     def create_solver_args(state: State):
         match indices:
             case VariableVectorExpression():
@@ -77,25 +300,11 @@ def to_solver_args(
                 indices_ = indices
 
         def to_array(state: State, name: str, expr: MatrixExpression):
-            state, array = polymat.to_array(
-                name=name, expr=expr, variables=indices_
-            ).apply(state)
-
-            if 1 < array.degree:
-                monomial_expr = expr.truncate_monomials(
-                    variables=indices_, degrees=(array.degree,)
-                ).to_linear_monomials(indices_)[0, 0]
-                state, monomial = polymat.to_sympy(monomial_expr).apply(state)
-
-                raise AssertionError(
-                    (
-                        f'The degree={array.degree} of the polynomial "{name}" in decision variables'
-                        f" used to encode the optimization problem constraint must not exceed 1. "
-                        f'However, the monomial "{monomial}" is of higher degree.'
-                    )
-                )
-
-            return state, array
+            # the linear part is kept sparse to avoid dense (n_eq, n_var) intermediates
+            with stage('to_array', constraint=name):
+                return to_sparse_array(
+                    name=name, expr=expr, variables=indices_
+                ).apply(state)
 
         state, lin_cost_array = to_array(state=state, name="linear_cost", expr=lin_cost)
 
@@ -113,29 +322,41 @@ def to_solver_args(
             # maximum degree of cost function must be 2
             assert quad_cost_array.degree <= 1, f"{quad_cost_array.degree=}"
 
+        constraint_names = []
+
         l_data_arrays = []
         if l_data is not None:
             for name, expr in l_data:
                 state, array = to_array(state=state, name=name, expr=expr)
                 l_data_arrays.append(array)
+                constraint_names.append(name)
 
         q_data_arrays = []
         if q_data is not None:
-            for name, expr in q_data:
+            for entry in q_data:
+                name, expr, dims = to_stacked_cone_data(entry)
                 state, array = to_array(state=state, name=name, expr=expr)
-                q_data_arrays.append(array)
+
+                if dims is None:
+                    q_data_arrays.append(array)
+                    constraint_names.append(name)
+                else:
+                    q_data_arrays.extend(_split_array_repr(array, dims))
+                    constraint_names.extend(to_stacked_cone_names(name, dims))
 
         s_data_arrays = []
         if s_data is not None:
             for name, expr in s_data:
                 state, array = to_array(state=state, name=name, expr=expr)
                 s_data_arrays.append(array)
+                constraint_names.append(name)
 
         eq_data_arrays = []
         if eq_data is not None:
             for name, expr in eq_data:
                 state, array = to_array(state=state, name=name, expr=expr)
                 eq_data_arrays.append(array)
+                constraint_names.append(name)
 
         def gen_variable_names():
             for index in indices_:
@@ -151,6 +372,7 @@ def to_solver_args(
             second_order_cone=tuple(q_data_arrays),
             semidef_cone=tuple(s_data_arrays),
             equality=tuple(eq_data_arrays),
+            constraint_names=tuple(constraint_names),
             indices=indices_,
             variable_names=variable_names,
         )
@@ -12,6 +12,11 @@ class SolverData(ABC):
     @abstractmethod
     def is_successful(self) -> bool: ...
 
+    @property
+    def is_optimal(self) -> bool:
+        """ True if the solver reports an optimal solution, which is stricter than `is_successful` """
+        return self.is_successful
+
 
 class SolutionNotFound(SolverData):
     @property
@@ -35,6 +40,11 @@ class SolutionFound(SolverData):
     def solution(self) -> np.ndarray: ...
     """ Primal solution """
 
+    @property
+    def dual_solution(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """ Dual solution of the cone and equality constraints, or None if not provided by the solver """
+        return None
+
     @property
     def is_successful(self) -> bool:
         return True
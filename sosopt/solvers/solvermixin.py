@@ -1,8 +1,9 @@
 from abc import abstractmethod
 from sosopt.solvers.solveargs import SolverArgs
 from sosopt.solvers.solverdata import SolverData
+from sosopt.solvers.warmstart import InitialPoint
 
 
 class SolverMixin:
     @abstractmethod
-    def solve(self, info: SolverArgs) -> SolverData: ...
+    def solve(self, info: SolverArgs, initial_point: InitialPoint | None = None) -> SolverData: ...
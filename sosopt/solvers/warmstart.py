@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class WarmStart:
+    """
+    Primal and dual solution of a previous solve, stored independently of the solver arguments
+    such that it can be mapped onto a problem with different variables or constraints.
+    """
+
+    # variable indices (as registered in the state) and their primal values
+    indices: np.ndarray
+    primal: np.ndarray
+
+    # dual values of each cone or equality constraint by constraint name
+    dual: dict[str, np.ndarray]
+
+    def to_index_positions(self) -> np.ndarray:
+        """
+        Returns an array mapping each variable index to its position in the primal vector,
+        or -1 if the variable is not part of the warm start.
+        """
+
+        positions = np.full(self.indices.max(initial=-1) + 1, -1, dtype=np.int64)
+        positions[self.indices] = np.arange(len(self.indices))
+
+        return positions
+
+
+class InitialPoint(NamedTuple):
+    """
+    Warm start mapped onto the variables and constraints of the solver arguments.
+    """
+
+    # primal values ordered as the indices of the solver arguments
+    x: np.ndarray
+
+    # dual values of the cone constraints stacked in the order nonneg_orthant, second_order_cone,
+    # semidef_cone, or None if no dual is available
+    z: np.ndarray | None
+
+    # dual values of the equality constraints, or None if no dual is available
+    y: np.ndarray | None
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor
+import contextvars
 from dataclasses import dataclass, replace
 from functools import cached_property
+from typing import Iterable
+
+import numpy as np
 
 from sosopt.coneconstraints.coneconstraint import ConeConstraint
 import statemonad
 
+import polymat
 from polymat.typing import ScalarPolynomialExpression, VectorExpression, State
 
-from sosopt.conicproblem import ConicProblem
+from sosopt.conicproblem import ConicProblem, ConicProblemResult
 from sosopt.polynomialconstraints.polynomialconstraint import PolynomialConstraint
 from sosopt.polymat.symbols.decisionvariablesymbol import DecisionVariableSymbol
+from sosopt.profiling import instrument, solve_scope, stage
 from sosopt.solvers.solvermixin import SolverMixin
+from sosopt.utils.totuplesubstitutions import to_tuple_substitutions
 
 
 @dataclass(frozen=True)
@@ -39,6 +48,9 @@ class SOSProblem:
     
 
     def eval(self, substitutions: dict[DecisionVariableSymbol, tuple[float, ...]]):
+        # convert the substitutions only once for all constraints
+        substitutions = to_tuple_substitutions(substitutions)
+
         def gen_evaluated_constraints():
             for constraint in self.constraints:
                 evaluated_constraint = constraint.eval(substitutions)
@@ -54,7 +66,31 @@ class SOSProblem:
             constraints=evaluated_constraints,
         )
 
+    def to_cost(self, symbol_values: dict[DecisionVariableSymbol, Iterable[float]]):
+        """
+        Evaluates the linear cost plus the quadratic cost q^T q of the SOS problem, including
+        their constant terms, for the given values of the decision variables.
+        """
+
+        substitutions = to_tuple_substitutions(symbol_values)
+
+        def _to_cost(state: State):
+            cost = 0.0
+
+            if self.lin_cost is not None:
+                state, data = polymat.to_tuple(self.lin_cost.eval(substitutions)).apply(state)
+                cost += float(np.sum(data))
+
+            if self.quad_cost is not None:
+                state, data = polymat.to_tuple(self.quad_cost.eval(substitutions)).apply(state)
+                cost += float(np.sum(np.square(data)))
+
+            return state, cost
+
+        return statemonad.get_map_put(_to_cost)
+
     def to_conic_problem(self):
+        @instrument('to_conic_problem')
         def _to_conic_problem(state: State):
 
             cone_constraints = []
@@ -62,8 +98,9 @@ class SOSProblem:
                 match constraint:
                     case PolynomialConstraint():
                         for primitive in constraint.primitives:
-                            state, cone_constraint = primitive.to_cone_constraint().apply(state)
-                            cone_constraints.append(cone_constraint)
+                            with stage('to_cone_constraints', constraint=primitive.name):
+                                state, primitive_cone_constraints = primitive.to_cone_constraints().apply(state)
+                            cone_constraints.extend(primitive_cone_constraints)
 
                     case ConeConstraint():
                         cone_constraints.append(constraint)
@@ -82,8 +119,60 @@ class SOSProblem:
     def to_solver_args(self):
         return self.to_conic_problem().flat_map(lambda p: p.to_solver_args())
 
-    def solve(self):
-        return self.to_conic_problem().flat_map(lambda p: p.solve())
+    def solve(
+        self,
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+    ):
+        """
+        Solves the SOS problem, optionally warm started from the result of a previous solve.
+        """
+
+        # the profile of the result includes the compile stages
+        @solve_scope()
+        def solve_with_state(state: State):
+            return self.to_conic_problem().flat_map(
+                lambda p: p.solve(tuple_symbol_values=tuple_symbol_values, warm_start=warm_start)
+            ).apply(state)
+
+        return statemonad.get_map_put(solve_with_state)
+
+    async def solve_async(
+        self,
+        state: State,
+        tuple_symbol_values: bool = False,
+        warm_start: ConicProblemResult | None = None,
+        executor: Executor | None = None,
+        timeout: float | None = None,
+    ) -> tuple[State, ConicProblemResult]:
+        """
+        Asynchronous counterpart of `solve`, running the compile and solver stages in an executor
+        (see `ConicProblem.solve_async`).
+
+        Example:
+            ``` python
+            state, result = await problem.solve_async(state, timeout=60.0)
+            ```
+        """
+
+        async def run_stages():
+            loop = asyncio.get_running_loop()
+
+            # propagate the context (e.g. an active profiler) to the executor
+            next_state, conic_problem = await loop.run_in_executor(
+                executor, contextvars.copy_context().run, self.to_conic_problem().apply, state,
+            )
+
+            return await conic_problem.solve_async(
+                next_state,
+                tuple_symbol_values=tuple_symbol_values,
+                warm_start=warm_start,
+                executor=executor,
+            )
+
+        # the scope is propagated to the executor together with the context
+        with solve_scope():
+            return await asyncio.wait_for(run_stages(), timeout)
 
 
 def init_sos_problem(
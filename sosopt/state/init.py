@@ -27,6 +27,8 @@ class StateImpl(State):
 
     sparse_smr: bool
 
+    newton_polytope: str | None
+
     @override
     def copy(self, /, **changes):
         return replace(self, **changes)
@@ -34,6 +36,7 @@ class StateImpl(State):
 
 def init_state(
         sparse_smr: bool | None = None,
+        newton_polytope: str | None = 'hull',
 ):
     if sparse_smr is None:
         sparse_smr = True
@@ -44,4 +47,5 @@ def init_state(
         cache={},
         auxilliary_equations=tuple(),
         sparse_smr=sparse_smr,
+        newton_polytope=newton_polytope,
     )
\ No newline at end of file
@@ -14,3 +14,8 @@ class State(PolyMatState):
     @abstractmethod
     def sparse_smr(self) -> bool:
         ...
+
+    @property
+    @abstractmethod
+    def newton_polytope(self) -> str | None:
+        ...
@@ -0,0 +1,99 @@
+import numpy as np
+import scipy.optimize
+import scipy.spatial
+
+
+def _in_convex_hull_qhull(points: np.ndarray, support: np.ndarray, tol: float) -> np.ndarray:
+    # restrict the problem to the affine hull of the support, as Qhull requires
+    # a full-dimensional point set (e.g. the support of a homogeneous polynomial
+    # lies on a hyperplane)
+    origin = support[0]
+    support_centered = support - origin
+    points_centered = points - origin
+
+    _, singular_values, vt = np.linalg.svd(support_centered, full_matrices=False)
+    scale = max(1.0, singular_values.max(initial=0.0))
+    rank = int(np.sum(singular_values > tol * scale))
+    basis = vt[:rank]
+
+    points_proj = points_centered @ basis.T
+    residual = points_centered - points_proj @ basis
+    in_affine_hull = np.all(np.abs(residual) <= tol, axis=1)
+
+    match rank:
+        case 0:
+            return in_affine_hull
+
+        case 1:
+            support_proj = support_centered @ basis.T
+            in_interval = (
+                (support_proj.min() - tol <= points_proj[:, 0])
+                & (points_proj[:, 0] <= support_proj.max() + tol)
+            )
+            return in_affine_hull & in_interval
+
+        case _:
+            hull = scipy.spatial.ConvexHull(support_centered @ basis.T)
+
+            # each row of `equations` defines a facet a^T x + b <= 0
+            normals, offsets = hull.equations[:, :-1], hull.equations[:, -1]
+            in_hull = np.all(points_proj @ normals.T + offsets <= tol, axis=1)
+            return in_affine_hull & in_hull
+
+
+def _in_convex_hull_lp(points: np.ndarray, support: np.ndarray) -> np.ndarray:
+    # a point p lies in the convex hull if p = S^T l for some l >= 0 with sum(l) = 1
+    n_support = support.shape[0]
+    A_eq = np.vstack((support.T, np.ones((1, n_support))))
+    c = np.zeros(n_support)
+
+    def gen_in_hull():
+        for point in points:
+            result = scipy.optimize.linprog(
+                c=c,
+                A_eq=A_eq,
+                b_eq=np.append(point, 1.0),
+                bounds=(0, None),
+                method='highs',
+            )
+            yield result.status == 0
+
+    return np.fromiter(gen_in_hull(), dtype=bool, count=points.shape[0])
+
+
+def in_half_newton_polytope(
+    exponents: np.ndarray,
+    support: np.ndarray,
+    method: str = 'hull',
+    tol: float = 1e-9,
+) -> np.ndarray:
+    """
+    Returns a boolean mask selecting the exponent vectors (rows of `exponents`) that lie
+    in half the Newton polytope, i.e. half the convex hull of the exponent vectors in `support`.
+
+    Two methods are available:
+    - 'hull': computes the facets of the convex hull once with Qhull and tests all exponents
+        at once. Falls back to 'lp' if Qhull fails.
+    - 'lp': solves a feasibility LP for each exponent vector. This is slower, but does not
+        depend on the number of facets of the convex hull, which can grow quickly with the
+        number of variables.
+    """
+
+    points = 2 * np.asarray(exponents, dtype=np.double)
+    support = np.asarray(support, dtype=np.double)
+
+    if points.shape[0] == 0:
+        return np.zeros(0, dtype=bool)
+
+    match method:
+        case 'hull':
+            try:
+                return _in_convex_hull_qhull(points, support, tol=tol)
+            except scipy.spatial.QhullError:
+                return _in_convex_hull_lp(points, support)
+
+        case 'lp':
+            return _in_convex_hull_lp(points, support)
+
+        case _:
+            raise ValueError(f'Unknown Newton polytope method "{method}".')
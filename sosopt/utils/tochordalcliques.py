@@ -0,0 +1,47 @@
+from typing import Iterable
+
+
+def to_chordal_cliques(
+    nodes: Iterable[int],
+    edges: Iterable[tuple[int, int]],
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Computes a chordal extension of an undirected graph using a greedy minimum degree
+    elimination ordering and returns the maximal cliques of the chordal extension.
+
+    The cliques are returned in elimination order and the nodes of each clique are sorted.
+    """
+
+    adjacency: dict[int, set[int]] = {node: set() for node in nodes}
+
+    for left, right in edges:
+        if left != right:
+            adjacency[left].add(right)
+            adjacency[right].add(left)
+
+    candidates: list[frozenset[int]] = []
+
+    while adjacency:
+        # eliminate the node with the fewest neighbors, ties are broken by node index
+        node = min(adjacency, key=lambda n: (len(adjacency[n]), n))
+        neighbors = adjacency.pop(node)
+
+        # fill-in edges turn the neighbors into a clique
+        for neighbor in neighbors:
+            adjacency[neighbor].discard(node)
+            adjacency[neighbor] |= neighbors - {neighbor}
+
+        candidates.append(frozenset(neighbors | {node}))
+
+    def gen_maximal_cliques():
+        for index, clique in enumerate(candidates):
+            is_maximal = not any(
+                clique < other or (clique == other and other_index < index)
+                for other_index, other in enumerate(candidates)
+                if other_index != index
+            )
+
+            if is_maximal:
+                yield tuple(sorted(clique))
+
+    return tuple(gen_maximal_cliques())
@@ -0,0 +1,28 @@
+from typing import Iterable
+
+
+def to_connected_components(n_nodes: int, edges: Iterable[tuple[int, int]]):
+    """
+    Returns the connected components of the graph with nodes 0, ..., n_nodes - 1, each sorted
+    and ordered by their smallest node.
+    """
+
+    parents = list(range(n_nodes))
+
+    def find(node: int):
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    for left, right in edges:
+        left_root, right_root = find(left), find(right)
+
+        if left_root != right_root:
+            parents[max(left_root, right_root)] = min(left_root, right_root)
+
+    components: dict[int, list[int]] = {}
+    for node in range(n_nodes):
+        components.setdefault(find(node), []).append(node)
+
+    return tuple(tuple(component) for component in components.values())
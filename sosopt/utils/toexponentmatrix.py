@@ -0,0 +1,173 @@
+import math
+
+import numpy as np
+
+
+Monomial = tuple[tuple[int, int], ...]
+
+
+def to_exponent_matrix(
+    monomials: tuple[Monomial, ...],
+    indices: tuple[int, ...],
+) -> np.ndarray:
+    """
+    Returns the exponents of the monomials as an integer matrix, where each row corresponds to
+    a monomial and each column to a variable index. Powers of variables not in `indices` are
+    dropped.
+    """
+
+    position = {index: pos for pos, index in enumerate(indices)}
+
+    terms = tuple(
+        (row, position[index], power)
+        for row, monomial in enumerate(monomials)
+        for index, power in monomial
+        if index in position
+    )
+
+    exponents = np.zeros((len(monomials), len(indices)), dtype=np.int64)
+
+    if terms:
+        rows, cols, powers = np.array(terms, dtype=np.int64).T
+
+        # the variable indices of a monomial are unique
+        exponents[rows, cols] = powers
+
+    return exponents
+
+
+def to_monomials(
+    exponents: np.ndarray,
+    indices: tuple[int, ...],
+) -> tuple[Monomial, ...]:
+    """
+    Converts the rows of an exponent matrix to monomials sorted by variable index.
+    """
+
+    order = np.argsort(np.asarray(indices, dtype=np.int64), kind='stable')
+    sorted_indices = np.asarray(indices, dtype=np.int64)[order]
+    exponents = exponents[:, order]
+
+    # row-major order, hence the variable indices of each monomial are sorted
+    rows, cols = np.nonzero(exponents)
+
+    terms = tuple(zip(sorted_indices[cols].tolist(), exponents[rows, cols].tolist()))
+    stops = np.cumsum(np.bincount(rows, minlength=exponents.shape[0])).tolist()
+    starts = [0] + stops[:-1]
+
+    return tuple(terms[start:stop] for start, stop in zip(starts, stops))
+
+
+def to_row_labels(exponents: np.ndarray) -> np.ndarray:
+    """
+    Returns an integer label for each row of the exponent matrix, such that two rows have the
+    same label if and only if they are equal.
+    """
+
+    n_rows, n_cols = exponents.shape
+
+    if n_rows == 0 or n_cols == 0:
+        return np.zeros(n_rows, dtype=np.int64)
+
+    # encode each row as a number using the maximum exponent plus one of each column as radix
+    radix = [int(value) + 1 for value in exponents.max(axis=0)]
+
+    if math.prod(radix) <= np.iinfo(np.int64).max:
+        weights = np.cumprod([1] + radix[:-1], dtype=np.int64)
+        return exponents @ weights
+
+    # fall back to sorting the rows if the encoding overflows
+    _, labels = np.unique(exponents, axis=0, return_inverse=True)
+    return labels.reshape(-1)
+
+
+def to_pair_product_groups(
+    exponents: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+) -> tuple[np.ndarray, tuple[np.ndarray, ...]]:
+    """
+    Groups the pairs of monomials (rows[k], cols[k]) by the product of the two monomials.
+
+    Returns the exponents of the products ordered by their first occurrence, and for each
+    product the positions k of the corresponding pairs in their original order.
+    """
+
+    if len(rows) == 0:
+        return exponents[:0], tuple()
+
+    products = exponents[rows] + exponents[cols]
+
+    _, first, inverse = np.unique(
+        to_row_labels(products),
+        return_index=True,
+        return_inverse=True,
+    )
+
+    # relabel the groups by their first occurrence
+    occurrence = np.argsort(first, kind='stable')
+    rank = np.empty_like(occurrence)
+    rank[occurrence] = np.arange(len(occurrence))
+    labels = rank[inverse.reshape(-1)]
+
+    positions = np.argsort(labels, kind='stable')
+    stops = np.cumsum(np.bincount(labels, minlength=len(occurrence)))
+
+    return products[first[occurrence]], tuple(np.split(positions, stops[:-1]))
+
+
+def is_row_in(exponents: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Returns a boolean mask selecting the rows of `exponents` that are equal to a row of `others`.
+    """
+
+    labels = to_row_labels(np.vstack((exponents, others)))
+
+    return np.isin(labels[:exponents.shape[0]], labels[exponents.shape[0]:])
+
+
+def to_bounded_exponents(
+    lower: np.ndarray,
+    upper: np.ndarray,
+    min_degree: int,
+    max_degree: int,
+) -> np.ndarray:
+    """
+    Returns all exponent vectors e with lower <= e <= upper (elementwise) and
+    min_degree <= sum(e) <= max_degree in lexicographic order.
+
+    The vectors are built one variable at a time, where a partial vector is only kept if it can
+    be completed within the degree bounds. Hence, the work is linear in the number of returned
+    vectors (times the number of variables and the range of the bounds), rather than in the
+    number of all monomials up to the maximum degree.
+    """
+
+    lower = np.asarray(lower, dtype=np.int64)
+    upper = np.asarray(upper, dtype=np.int64)
+
+    # minimum and maximum degree of the variables from each position onward
+    suffix_lower = np.append(np.cumsum(lower[::-1])[::-1], 0)
+    suffix_upper = np.append(np.cumsum(upper[::-1])[::-1], 0)
+
+    exponents = np.zeros((1, 0), dtype=np.int64)
+    degrees = np.zeros(1, dtype=np.int64)
+
+    for col in range(len(lower)):
+        powers = np.arange(lower[col], upper[col] + 1, dtype=np.int64)
+
+        # degree of each partial vector extended by each power
+        extended_degrees = degrees[:, None] + powers[None, :]
+
+        can_complete = (
+            (extended_degrees + suffix_lower[col + 1] <= max_degree)
+            & (min_degree <= extended_degrees + suffix_upper[col + 1])
+        )
+
+        rows, choices = np.nonzero(can_complete)
+        exponents = np.column_stack((exponents[rows], powers[choices]))
+        degrees = extended_degrees[rows, choices]
+
+    # only required if there are no variables
+    in_range = (min_degree <= degrees) & (degrees <= max_degree)
+
+    return exponents[in_range]
@@ -0,0 +1,66 @@
+from typing import Iterable
+
+from sosopt.utils.toconnectedcomponents import to_connected_components
+from sosopt.utils.tosignsymmetryblocks import to_sign_symmetry_blocks
+from sosopt.utils.totermsparsityblocks import to_term_sparsity_blocks
+
+
+Monomial = tuple[tuple[int, int], ...]
+
+
+def to_gram_matrix_blocks(
+    monomials: tuple[Monomial, ...],
+    support: Iterable[Monomial],
+    term_sparsity_order: int | None = None,
+    sign_symmetry: bool = False,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Partitions a monomial basis into the blocks of a block-diagonal Gram matrix by
+    intersecting the term sparsity blocks and the sign symmetry blocks.
+
+    The blocks are returned as sorted tuples of positions in the monomial basis, ordered
+    by their first position.
+    """
+
+    support = tuple(support)
+    partitions = []
+
+    if term_sparsity_order is not None:
+        partitions.append(to_term_sparsity_blocks(
+            monomials=monomials,
+            support=support,
+            order=term_sparsity_order,
+        ))
+
+    if sign_symmetry:
+        partitions.append(to_sign_symmetry_blocks(
+            monomials=monomials,
+            support=support,
+        ))
+
+    def to_block_labels(partition: tuple[tuple[int, ...], ...]):
+        return {position: index for index, block in enumerate(partition) for position in block}
+
+    block_labels = tuple(to_block_labels(partition) for partition in partitions)
+
+    blocks: dict[tuple[int, ...], list[int]] = {}
+    for position in range(len(monomials)):
+        key = tuple(labels[position] for labels in block_labels)
+        blocks.setdefault(key, []).append(position)
+
+    return tuple(tuple(block) for block in blocks.values())
+
+
+def to_gram_matrix_pattern_blocks(
+    size: int,
+    entries: Iterable[tuple[int, int]],
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Partitions the rows of a Gram matrix into the connected components of its sparsity
+    pattern given by the (row, col) positions of its structurally non-zero entries.
+
+    The Gram matrix is zero outside of the returned blocks. The blocks are returned as
+    sorted tuples of positions, ordered by their first position.
+    """
+
+    return to_connected_components(size, entries)
@@ -0,0 +1,90 @@
+from typing import Iterable
+
+import numpy as np
+
+
+Monomial = tuple[tuple[int, int], ...]
+
+
+def _to_parity_matrix(monomials: Iterable[Monomial], columns: dict[int, int]) -> np.ndarray:
+    monomials = tuple(monomials)
+    parity = np.zeros((len(monomials), len(columns)), dtype=np.uint8)
+
+    for row, monomial in enumerate(monomials):
+        for index, power in monomial:
+            parity[row, columns[index]] = power % 2
+
+    return parity
+
+
+def _to_row_echelon_form(matrix: np.ndarray):
+    """
+    Computes the reduced row echelon form of a matrix over GF(2) and returns the
+    nonzero rows together with their pivot columns.
+    """
+
+    matrix = matrix.copy()
+    pivots = []
+    n_pivot = 0
+
+    for col in range(matrix.shape[1]):
+        candidates = np.flatnonzero(matrix[n_pivot:, col]) + n_pivot
+
+        if candidates.size == 0:
+            continue
+
+        pivot = candidates[0]
+        matrix[[n_pivot, pivot]] = matrix[[pivot, n_pivot]]
+
+        others = np.flatnonzero(matrix[:, col])
+        others = others[others != n_pivot]
+        matrix[others] ^= matrix[n_pivot]
+
+        pivots.append(col)
+        n_pivot += 1
+
+        if n_pivot == matrix.shape[0]:
+            break
+
+    return matrix[:n_pivot], pivots
+
+
+def to_sign_symmetry_blocks(
+    monomials: tuple[Monomial, ...],
+    support: Iterable[Monomial],
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Partitions a monomial basis according to the sign symmetries of a polynomial
+    with the given support.
+
+    A sign symmetry is a set of variables whose simultaneous sign change x_i -> -x_i
+    leaves the polynomial invariant. Two basis monomials are in the same block if they
+    behave identically under all sign symmetries, which is the case if and only if
+    the parity vector of their product lies in the row space (over GF(2)) of the parity
+    vectors of the support. Monomials in different blocks lead to zero entries in the
+    Gram matrix.
+
+    The blocks are returned as sorted tuples of positions in the monomial basis, ordered
+    by their first position.
+    """
+
+    support = tuple(support)
+
+    variable_indices = sorted(
+        set(index for monomial in support + monomials for index, _ in monomial)
+    )
+    columns = {index: col for col, index in enumerate(variable_indices)}
+
+    basis, pivots = _to_row_echelon_form(_to_parity_matrix(support, columns))
+    parity = _to_parity_matrix(monomials, columns)
+
+    # reduce the parity vectors of the monomials modulo the row space of the support,
+    # the remainder identifies the block of the monomial
+    for row, col in zip(basis, pivots):
+        parity[parity[:, col] == 1] ^= row
+
+    blocks: dict[bytes, list[int]] = {}
+    for position, remainder in enumerate(parity):
+        blocks.setdefault(remainder.tobytes(), []).append(position)
+
+    return tuple(tuple(block) for block in blocks.values())
@@ -0,0 +1,68 @@
+import itertools
+from typing import Iterable
+
+from sosopt.utils.toconnectedcomponents import to_connected_components
+
+
+Monomial = tuple[tuple[int, int], ...]
+
+
+def _multiply_monomials(left: Monomial, right: Monomial) -> Monomial:
+    powers = dict(left)
+
+    for index, power in right:
+        powers[index] = powers.get(index, 0) + power
+
+    return tuple(sorted(powers.items()))
+
+
+def to_term_sparsity_blocks(
+    monomials: tuple[Monomial, ...],
+    support: Iterable[Monomial],
+    order: int,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Computes the blocks of the term sparsity pattern of a polynomial with the given support
+    and monomial basis, following the block closure iteration of the TSSOS hierarchy.
+
+    Two basis monomials are connected if their product is contained in the support
+    extended by the squares of the basis monomials. The support is then extended by
+    all products of monomials within the same connected component, and the procedure
+    is repeated `order` times.
+
+    The blocks are returned as sorted tuples of positions in the monomial basis, ordered
+    by their first position.
+    """
+
+    if order < 1:
+        raise ValueError(f'The term sparsity order must be at least 1, but is {order}.')
+
+    n_monomials = len(monomials)
+
+    # the products are computed once and shared by all iterations
+    products = {
+        (row, col): _multiply_monomials(monomials[row], monomials[col])
+        for row, col in itertools.combinations(range(n_monomials), 2)
+    }
+
+    extended_support = set(support) | set(
+        _multiply_monomials(monomial, monomial) for monomial in monomials
+    )
+
+    blocks = tuple((index,) for index in range(n_monomials))
+
+    for _ in range(order):
+        edges = tuple(pair for pair, product in products.items() if product in extended_support)
+        next_blocks = to_connected_components(n_monomials, edges)
+
+        if next_blocks == blocks:
+            break
+
+        blocks = next_blocks
+        extended_support |= set(
+            products[pair]
+            for block in blocks
+            for pair in itertools.combinations(block, 2)
+        )
+
+    return blocks
@@ -0,0 +1,21 @@
+from typing import Iterable
+
+from polymat.typing import Symbol
+
+
+def to_tuple_substitutions[S: Symbol](
+    substitutions: dict[S, Iterable[float]],
+) -> dict[S, tuple[float, ...]]:
+    """
+    Converts the substitution values (e.g. numpy arrays returned by the solver) to tuples of
+    floats, such that the evaluated expressions are hashable and can be cached by the state.
+    """
+
+    def to_tuple(values: Iterable[float]):
+        match values:
+            case tuple():
+                return values
+            case _:
+                return tuple(float(value) for value in values)
+
+    return {symbol: to_tuple(values) for symbol, values in substitutions.items()}
@@ -0,0 +1,65 @@
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_bilinear_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    b = sosopt.define_variable('b')
+
+    # (a b - 1) x^2 is SOS if and only if a b >= 1
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=(a * b - 1) * x**2,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a + b,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem, a, b
+
+
+@pytest.mark.parametrize('warm_start', (False, True))
+def test_alternation_reports_cost_of_original_problem(warm_start):
+    state, problem, a, b = define_bilinear_problem()
+
+    state, result = sosopt.solve_with_alternation(
+        problem=problem,
+        groups=((a,), (b,)),
+        symbol_values={b.symbol: (2.0,)},
+        warm_start=warm_start,
+    ).apply(state)
+
+    # a = 1 / b = 0.5 is optimal for b = 2, which in turn is optimal for a = 0.5
+    assert result.termination == 'converged'
+    assert result.converged
+    assert result.failed_result is None
+    assert result.symbol_values[a.symbol][0] == pytest.approx(0.5, abs=1e-5)
+    assert result.symbol_values[b.symbol][0] == pytest.approx(2.0, abs=1e-5)
+
+    # the cost includes the fixed group, which the subproblem costs omit
+    assert result.costs[0] == pytest.approx(2.5, abs=1e-5)
+    assert all(r.solver_data.is_optimal for r in result.results)
+
+
+def test_alternation_rejects_unbounded_subproblem():
+    state, problem, a, b = define_bilinear_problem()
+
+    # for b = -1 the subproblem of a is unbounded below
+    # the state monad chains the original exception
+    with pytest.raises(Exception) as exc_info:
+        sosopt.solve_with_alternation(
+            problem=problem,
+            groups=((a,), (b,)),
+            symbol_values={b.symbol: (-1.0,)},
+        ).apply(state)
+
+    assert 'first sweep' in str(exc_info.value.__context__)
@@ -0,0 +1,91 @@
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_lower_bound_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    c = sosopt.define_variable('c')
+
+    # (a - c) x^2 is SOS if and only if a >= c
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=(a - c) * x**2,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem, a, c
+
+
+def test_solve_batch_solves_each_substitution():
+    state, problem, a, c = define_lower_bound_problem()
+
+    c_values = (1.0, 2.0, 3.0, 4.0, 5.0)
+
+    # the substitutions are given by the variable instead of its symbol
+    state, results = sosopt.solve_batch(
+        problem=problem,
+        substitutions=({c: (c_value,)} for c_value in c_values),
+        max_workers=2,
+        max_pending=2,
+    ).apply(state)
+
+    results = dict(results)
+
+    assert sorted(results) == list(range(len(c_values)))
+
+    for index, c_value in enumerate(c_values):
+        result = results[index]
+
+        assert result.solver_data.is_successful
+        assert result.solver_data.cost == pytest.approx(c_value, abs=1e-5)
+        assert result.symbol_values[a.symbol][0] == pytest.approx(c_value, abs=1e-5)
+
+
+def test_solve_batch_stops_when_closed():
+    state, problem, _, c = define_lower_bound_problem()
+
+    consumed = []
+
+    def gen_substitutions():
+        for c_value in range(100):
+            consumed.append(c_value)
+            yield {c.symbol: (float(c_value),)}
+
+    state, results = sosopt.solve_batch(
+        problem=problem,
+        substitutions=gen_substitutions(),
+        max_workers=1,
+        max_pending=2,
+    ).apply(state)
+
+    next(results)
+    results.close()
+
+    # only the submission window is consumed from the substitutions
+    assert len(consumed) < 100
+
+
+def test_solve_batch_can_be_applied_twice():
+    state, problem, _, c = define_lower_bound_problem()
+
+    solve_batch = sosopt.solve_batch(
+        problem=problem,
+        substitutions=tuple({c: (c_value,)} for c_value in (1.0, 2.0)),
+        max_workers=1,
+    )
+
+    for _ in range(2):
+        _, results = solve_batch.apply(state)
+
+        assert sorted(index for index, _ in results) == [0, 1]
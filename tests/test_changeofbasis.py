@@ -0,0 +1,50 @@
+import polymat
+
+import sosopt
+
+
+def define_scaling_problem(relaxation: str):
+    state = sosopt.init_state(sparse_smr=False)
+
+    x = polymat.define_variable('x')
+    y = polymat.define_variable('y')
+    c = sosopt.define_variable('c')
+
+    # positive definite for c > (sqrt(13) - 4) / 2, but diagonally dominant only for c >= 0.5
+    p = (1 + c) * x**2 - 3 * x * y + (3 + c) * y**2
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=p,
+        relaxation=relaxation,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=c,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def test_change_of_basis_improves_dsos_relaxation():
+    state, problem = define_scaling_problem('dsos')
+
+    with sosopt.profile() as profiler:
+        state, result = sosopt.solve_with_change_of_basis(
+            problem,
+            max_iterations=5,
+        ).apply(state)
+
+    sos_cost = (13 ** 0.5 - 4) / 2
+
+    assert result.termination in ('converged', 'max_iterations')
+    assert result.failed_result is None
+    assert all(next <= previous + 1e-6 for previous, next in zip(result.costs, result.costs[1:]))
+    assert result.costs[-1] < result.costs[0] - 0.1
+    assert sos_cost - 1e-4 <= result.costs[-1]
+
+    # the problem is compiled once, afterwards only the relaxed constraints are converted
+    stages = profiler.to_profile().to_stage_summary()
+    assert stages['to_conic_problem']['count'] == 1
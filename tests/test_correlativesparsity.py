@@ -0,0 +1,65 @@
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_chain_polynomial(n_var: int = 5):
+    variables = tuple(polymat.define_variable(f'x{index}') for index in range(n_var))
+
+    # each monomial couples at most two neighbouring variables
+    p = polymat.from_polynomial(1)
+    for left, right in zip(variables[:-1], variables[1:]):
+        p = p + left**2 * right**2 + left**2 + (left - right) ** 2
+
+    return p
+
+
+def test_correlative_sparsity_solves_chain():
+    state = sosopt.init_state(sparse_smr=False)
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=define_chain_polynomial(),
+        correlative_sparsity=True,
+    ).apply(state)
+
+    # one SOS polynomial per clique and a zero polynomial condition
+    assert 2 < len(constraint.primitives)
+
+    problem = sosopt.sos_problem(
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    state, result = problem.solve().apply(state)
+
+    assert result.solver_data.is_successful
+
+
+def test_gram_matrix_of_decomposed_constraint_raises():
+    state = sosopt.init_state(sparse_smr=False)
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=define_chain_polynomial(),
+        correlative_sparsity=True,
+    ).apply(state)
+
+    with pytest.raises(Exception, match='primitives'):
+        constraint.gram_matrix
+
+
+def test_correlative_sparsity_rejects_sparse_smr():
+    state = sosopt.init_state(sparse_smr=True)
+
+    # the state monad chains the original exception
+    with pytest.raises(Exception) as exc_info:
+        sosopt.sos_constraint(
+            name='p',
+            greater_than_zero=define_chain_polynomial(),
+            correlative_sparsity=True,
+        ).apply(state)
+
+    assert 'sparse_smr=False' in str(exc_info.value.__context__)
@@ -0,0 +1,60 @@
+import pytest
+
+import polymat
+
+import sosopt
+from sosopt.coneconstraints.secondorderconeconstraint import SecondOrderConeConstraint
+
+
+def define_lower_bound_problem(relaxation: str):
+    state = sosopt.init_state(sparse_smr=False)
+
+    x = polymat.define_variable('x')
+    y = polymat.define_variable('y')
+    g = sosopt.define_variable('g')
+
+    # the minimum of the polynomial is 1 at the origin
+    p = x**4 + y**4 + x**2 * y**2 + x**2 + y**2 + 1
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=p - g,
+        relaxation=relaxation,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=-g,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, constraint, problem
+
+
+@pytest.mark.parametrize('relaxation', ('sos', 'sdsos', 'dsos'))
+def test_relaxation_finds_lower_bound(relaxation):
+    state, _, problem = define_lower_bound_problem(relaxation)
+
+    state, result = problem.solve().apply(state)
+
+    assert result.solver_data.is_successful
+    assert result.solver_data.cost == pytest.approx(-1.0, abs=1e-4)
+
+
+def test_sdsos_stacks_second_order_cones():
+    state, constraint, _ = define_lower_bound_problem('sdsos')
+
+    (primitive,) = constraint.primitives
+    state, cone_constraints = primitive.to_cone_constraints().apply(state)
+
+    state, blocks = primitive.to_gram_matrix_blocks().apply(state)
+
+    second_order_cone_constraints = tuple(
+        c for c in cone_constraints if isinstance(c, SecondOrderConeConstraint)
+    )
+
+    # one constraint per block stacking a cone of dimension 3 per off-diagonal entry
+    assert sorted(len(c.dims) for c in second_order_cone_constraints) == sorted(
+        len(block) * (len(block) - 1) // 2 for block in blocks if 1 < len(block)
+    )
+    assert all(set(c.dims) == {3} for c in second_order_cone_constraints)
@@ -0,0 +1,83 @@
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_bilinear_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    b = sosopt.define_variable('b')
+
+    # (a b - 1) x^2 is SOS if and only if a b >= 1
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=(a * b - 1) * x**2,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a + b,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem, a, b
+
+
+def test_linearization_converges_to_optimum():
+    state, problem, a, b = define_bilinear_problem()
+
+    state, result = sosopt.solve_with_linearization(
+        problem=problem,
+        groups=((a,), (b,)),
+        symbol_values={a.symbol: (2.0,), b.symbol: (0.5,)},
+    ).apply(state)
+
+    # a = b = 1 minimizes a + b subject to a b >= 1
+    assert result.termination == 'converged'
+    assert result.converged
+    assert result.failed_result is None
+    assert result.symbol_values[a.symbol][0] == pytest.approx(1.0, abs=1e-2)
+    assert result.symbol_values[b.symbol][0] == pytest.approx(1.0, abs=1e-2)
+
+    # the costs exclude the proximal term and do not increase
+    assert result.costs[-1] == pytest.approx(2.0, abs=1e-3)
+    assert all(next_cost <= cost + 1e-4 for cost, next_cost in zip(result.costs, result.costs[1:]))
+
+    # each accepted iterate is feasible for the original problem
+    a_value = result.symbol_values[a.symbol][0]
+    b_value = result.symbol_values[b.symbol][0]
+    assert 1.0 - 1e-5 <= a_value * b_value
+
+
+def test_linearization_rejects_bilinear_cone_constraint():
+    state = sosopt.init_state()
+
+    a = sosopt.define_variable('a')
+    b = sosopt.define_variable('b')
+
+    state, constraint = sosopt.second_order_cone_constraint(
+        name='c',
+        vector=a * b,
+        upper_bound=a + 1,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a + b,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    # the state monad chains the original exception
+    with pytest.raises(Exception) as exc_info:
+        sosopt.solve_with_linearization(
+            problem=problem,
+            groups=((a,), (b,)),
+            symbol_values={a.symbol: (1.0,), b.symbol: (1.0,)},
+        ).apply(state)
+
+    assert isinstance(exc_info.value.__context__, ValueError)
+    assert 'cannot be linearized' in str(exc_info.value.__context__)
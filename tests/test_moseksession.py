@@ -0,0 +1,57 @@
+import mosek
+import pytest
+
+import polymat
+
+import sosopt
+from sosopt.solvers.moseksolver import load_mosek_task, to_mosek_task_data, update_mosek_task
+
+
+def define_task_data(k: float):
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    g = sosopt.define_variable('g')
+
+    # the problems only differ in the coefficient k of the decision variable a
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=x**2 + k * a * x + g,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=g + a,
+        constraints=(constraint,),
+        solver=sosopt.mosek_solver,
+    )
+
+    state, solver_args = problem.to_solver_args().apply(state)
+
+    return to_mosek_task_data(solver_args)
+
+
+def to_task_file(path, *data):
+    # building and writing a task requires no license
+    with mosek.Task() as task:
+        load_mosek_task(task, data[0])
+
+        for previous, current in zip(data, data[1:]):
+            update_mosek_task(task, previous, current)
+
+        task.writedata(str(path))
+
+    return path.read_text()
+
+
+@pytest.mark.parametrize('k', (1.0, 2.0))
+def test_updated_task_equals_loaded_task(tmp_path, k):
+    previous = define_task_data(1.0)
+    data = define_task_data(k)
+
+    assert previous.structure == data.structure
+
+    updated = to_task_file(tmp_path / 'updated.ptf', previous, data)
+    loaded = to_task_file(tmp_path / 'loaded.ptf', data)
+
+    assert updated == loaded
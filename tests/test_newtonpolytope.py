@@ -0,0 +1,66 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import polymat
+
+import sosopt
+from sosopt.utils.inhalfnewtonpolytope import in_half_newton_polytope
+
+
+def to_motzkin_basis(newton_polytope):
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    y = polymat.define_variable('y')
+    gamma = sosopt.define_variable('gamma')
+
+    motzkin = x**4 * y**2 + x**2 * y**4 - 3 * x**2 * y**2 + 1
+
+    basis = sosopt.sos_monomial_basis(
+        (1 + x**2 + y**2) ** 2 * (motzkin - gamma),
+        polymat.v_stack((x, y)),
+        sparse_smr=False,
+        newton_polytope=newton_polytope,
+    )
+
+    state, basis = polymat.to_sympy(basis).apply(state)
+
+    return tuple(str(monomial) for monomial in basis)
+
+
+@pytest.mark.parametrize('newton_polytope', ('hull', 'lp'))
+def test_motzkin_basis_is_pruned(newton_polytope):
+    # x^3, y^3, x^4 and y^4 lie outside half the Newton polytope
+    assert to_motzkin_basis(newton_polytope) == (
+        '1', 'x', 'y', 'x**2', 'x*y', 'y**2', 'x**2*y', 'x*y**2',
+        'x**3*y', 'x**2*y**2', 'x*y**3', 'x**4*y', 'x**3*y**2', 'x**2*y**3', 'x*y**4',
+    )
+
+
+def test_motzkin_basis_without_pruning():
+    assert len(to_motzkin_basis(None)) == 19
+
+
+@pytest.mark.parametrize('support', (
+    # full-dimensional
+    ((0, 0, 0), (4, 0, 0), (0, 4, 0), (0, 0, 4), (2, 2, 2), (6, 2, 0)),
+    # homogeneous, i.e. on a hyperplane
+    ((4, 0, 0), (0, 4, 0), (0, 0, 4), (2, 1, 1)),
+    # on a line
+    ((0, 0, 0), (2, 2, 0), (6, 6, 0)),
+    # a single point
+    ((2, 2, 4),),
+))
+def test_hull_and_lp_agree(support):
+    support = np.array(support)
+    exponents = np.array(tuple(itertools.product(range(4), repeat=3)))
+
+    in_hull = in_half_newton_polytope(exponents, support, method='hull')
+    in_lp = in_half_newton_polytope(exponents, support, method='lp')
+
+    np.testing.assert_array_equal(in_hull, in_lp)
+
+    # half of each support point lies in half the Newton polytope
+    assert in_half_newton_polytope(support // 2, support)[np.all(support % 2 == 0, axis=1)].all()
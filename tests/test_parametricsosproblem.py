@@ -0,0 +1,57 @@
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_shifted_quadratic_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    g = sosopt.define_variable('g')
+
+    # x^2 + a x + g is SOS if and only if g >= a^2 / 4
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=x**2 + a * x + g,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=g,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem, a
+
+
+@pytest.mark.parametrize('as_symbol', (False, True))
+def test_parametric_problem_matches_substitution(as_symbol):
+    state, problem, a = define_shifted_quadratic_problem()
+
+    state, parametric_problem = sosopt.parametric_sos_problem(
+        problem=problem,
+        parameters=(a.symbol if as_symbol else a,),
+    ).apply(state)
+
+    assert parametric_problem.parameter_symbols == (a.symbol,)
+
+    for a_value in (0.0, 1.0, -2.0):
+        result = parametric_problem.solve({a.symbol: (a_value,)})
+
+        assert result.solver_data.is_successful
+        assert result.solver_data.cost == pytest.approx(a_value**2 / 4, abs=1e-5)
+
+
+def test_parametric_problem_requires_all_parameters():
+    state, problem, a = define_shifted_quadratic_problem()
+
+    state, parametric_problem = sosopt.parametric_sos_problem(
+        problem=problem,
+        parameters=(a,),
+    ).apply(state)
+
+    with pytest.raises(Exception, match='No value provided'):
+        parametric_problem.solve({})
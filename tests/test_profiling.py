@@ -0,0 +1,123 @@
+import asyncio
+import tracemalloc
+
+import polymat
+
+import sosopt
+
+
+def define_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=(a - 1) * x**2,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a,
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+def test_result_profile_contains_only_its_own_solve():
+    state, problem = define_problem()
+
+    with sosopt.profile() as profiler:
+        state, first = problem.solve().apply(state)
+        state, second = problem.solve().apply(state)
+
+    for result in (first, second):
+        summary = result.profile.to_stage_summary()
+
+        assert summary['to_conic_problem']['count'] == 1
+        assert summary['solve']['count'] == 1
+
+    # the events of the second solve start after the first solve
+    assert first.profile.events[-1].start <= second.profile.events[0].start
+
+    # the profiler records the stages of all solves
+    assert profiler.to_profile().events == first.profile.events + second.profile.events
+
+
+def test_result_profile_of_concurrent_solves():
+    state, problem = define_problem()
+
+    async def solve_concurrently():
+        return await asyncio.gather(*(problem.solve_async(state) for _ in range(3)))
+
+    with sosopt.profile():
+        results = asyncio.run(solve_concurrently())
+
+    for _, result in results:
+        assert result.profile.to_stage_summary()['solve']['count'] == 1
+
+
+def test_result_profile_outside_profiler():
+    state, problem = define_problem()
+
+    state, result = problem.solve().apply(state)
+
+    assert result.profile is None
+
+
+def test_profile_records_memory_per_stage_and_constraint():
+    state, problem = define_problem()
+
+    assert not tracemalloc.is_tracing()
+
+    with sosopt.profile(memory=True) as profiler:
+        assert tracemalloc.is_tracing()
+
+        state, _ = problem.solve().apply(state)
+
+    # the profiler stops the tracing it started
+    assert not tracemalloc.is_tracing()
+
+    profile = profiler.to_profile()
+
+    for summary in profile.to_stage_summary().values():
+        assert 0 <= summary['peak_bytes']
+        assert 'retained_bytes' in summary
+
+    constraint_summary = profile.to_constraint_summary()
+
+    assert 'p' in constraint_summary
+    for summary in constraint_summary['p'].values():
+        assert 0 <= summary['peak_bytes']
+        assert 'retained_bytes' in summary
+
+
+def test_profile_keeps_tracing_started_outside():
+    state, problem = define_problem()
+
+    tracemalloc.start()
+
+    try:
+        with sosopt.profile(memory=True) as profiler:
+            state, _ = problem.solve().apply(state)
+
+        assert tracemalloc.is_tracing()
+
+    finally:
+        tracemalloc.stop()
+
+    assert all(event.peak_bytes is not None for event in profiler.to_profile().events)
+
+
+def test_profile_without_memory():
+    state, problem = define_problem()
+
+    with sosopt.profile() as profiler:
+        state, _ = problem.solve().apply(state)
+
+    assert not tracemalloc.is_tracing()
+
+    for summary in profiler.to_profile().to_stage_summary().values():
+        assert 'peak_bytes' not in summary
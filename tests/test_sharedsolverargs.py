@@ -0,0 +1,93 @@
+import numpy as np
+
+import polymat
+
+import sosopt
+from sosopt.solvers.sharedsolverargs import share_parametric_solver_args
+
+
+def define_problem():
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+    c = sosopt.define_variable('c')
+
+    state, r = sosopt.define_polynomial(
+        name='r',
+        monomials=x.combinations(degrees=range(3)),
+    ).apply(state)
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=r + (a - c) * x**2,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=a,
+        quad_cost=r.to_coefficient_vector(),
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem, c
+
+
+def assert_array_repr_equal(array, shared_array):
+    assert (array.n_eq, array.n_param) == (shared_array.n_eq, shared_array.n_param)
+    np.testing.assert_array_equal(np.asarray(array[0]).reshape(-1), np.asarray(shared_array[0]).reshape(-1))
+    np.testing.assert_array_equal(array[1].toarray(), shared_array[1].toarray())
+
+
+def test_shared_solver_args_equal_solver_args():
+    state, problem, _ = define_problem()
+
+    state, solver_args = problem.to_solver_args().apply(state)
+
+    with sosopt.share_solver_args(solver_args) as shared:
+        shared_solver_args = shared.to_solver_args()
+
+        assert shared_solver_args.indices == solver_args.indices
+        assert shared_solver_args.constraint_names == solver_args.constraint_names
+
+        for name in ('nonneg_orthant', 'second_order_cone', 'semidef_cone', 'equality'):
+            arrays = getattr(solver_args, name)
+            shared_arrays = getattr(shared_solver_args, name)
+
+            assert len(arrays) == len(shared_arrays)
+            for array, shared_array in zip(arrays, shared_arrays):
+                assert_array_repr_equal(array, shared_array)
+
+        assert_array_repr_equal(solver_args.lin_cost, shared_solver_args.lin_cost)
+        assert_array_repr_equal(solver_args.quad_cost, shared_solver_args.quad_cost)
+
+        shared.detach()
+
+
+def test_shared_parametric_solver_args_equal_parametric_solver_args():
+    state, problem, c = define_problem()
+
+    state, parametric_problem = sosopt.parametric_sos_problem(
+        problem=problem,
+        parameters=(c,),
+    ).apply(state)
+
+    parameter_values = np.array((2.0,))
+    solver_args = parametric_problem.solver_args.to_solver_args(parameter_values)
+
+    with share_parametric_solver_args(parametric_problem.solver_args) as shared:
+        shared_parametric_solver_args = shared.to_parametric_solver_args()
+
+        assert shared_parametric_solver_args.parameter_indices == parametric_problem.solver_args.parameter_indices
+
+        shared_solver_args = shared_parametric_solver_args.to_solver_args(parameter_values)
+
+        for arrays, shared_arrays in zip(
+            (solver_args.semidef_cone, solver_args.equality),
+            (shared_solver_args.semidef_cone, shared_solver_args.equality),
+        ):
+            assert len(arrays) == len(shared_arrays)
+            for array, shared_array in zip(arrays, shared_arrays):
+                assert_array_repr_equal(array, shared_array)
+
+        shared.detach()
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+import polymat
+
+import sosopt
+from sosopt.solvers.solvermixin import SolverMixin
+
+
+class BlockingSolver(SolverMixin):
+    """
+    Solves with CVXOPT once released, such that the solve can be cancelled while it is running.
+    """
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def solve(self, info, initial_point=None):
+        self.started.set()
+        self.released.wait()
+        return sosopt.cvxopt_solver.solve(info, initial_point=initial_point)
+
+
+def define_problem(solver=sosopt.cvxopt_solver):
+    state = sosopt.init_state()
+
+    x = polymat.define_variable('x')
+    a = sosopt.define_variable('a')
+
+    # x^4 - a x^2 + 1 is SOS if and only if a <= 2
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=x**4 - a * x**2 + 1,
+    ).apply(state)
+
+    problem = sosopt.sos_problem(
+        lin_cost=-a,
+        constraints=(constraint,),
+        solver=solver,
+    )
+
+    return state, problem, a
+
+
+def test_solve_async_matches_solve():
+    state, problem, a = define_problem()
+
+    next_state, result = problem.solve().apply(state)
+    async_state, async_result = asyncio.run(problem.solve_async(state))
+
+    assert result.solver_data.is_optimal
+    assert async_state == next_state
+    assert async_result.solver_data.status == result.solver_data.status
+    assert async_result.solver_data.cost == pytest.approx(result.solver_data.cost)
+    assert async_result.symbol_values[a.symbol] == pytest.approx(result.symbol_values[a.symbol])
+
+
+def test_solve_async_raises_on_timeout():
+    solver = BlockingSolver()
+    state, problem, _ = define_problem(solver)
+
+    async def solve_with_timeout():
+        try:
+            return await problem.solve_async(state, timeout=0.1)
+
+        finally:
+            # the stage that already started runs to completion in the executor, which is
+            # joined when the event loop closes
+            solver.released.set()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(solve_with_timeout())
+
+    assert solver.started.is_set()
+
+
+def test_solve_async_raises_when_cancelled():
+    solver = BlockingSolver()
+    state, problem, _ = define_problem(solver)
+
+    async def solve_and_cancel():
+        task = asyncio.create_task(problem.solve_async(state))
+
+        await asyncio.to_thread(solver.started.wait)
+        task.cancel()
+
+        try:
+            return await task
+
+        finally:
+            solver.released.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(solve_and_cancel())
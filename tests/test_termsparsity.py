@@ -0,0 +1,46 @@
+import polymat
+
+import sosopt
+
+
+def define_symmetric_polynomial():
+    x = polymat.define_variable('x')
+    y = polymat.define_variable('y')
+
+    # invariant under x -> -x and y -> -y
+    return x**4 + y**4 + x**2 * y**2 + 1
+
+
+def test_sign_symmetry_block_diagonalizes_gram_matrix():
+    state = sosopt.init_state(sparse_smr=False)
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=define_symmetric_polynomial(),
+        term_sparsity_order=1,
+        sign_symmetry=True,
+    ).apply(state)
+
+    (primitive,) = constraint.primitives
+
+    assert primitive.options.sign_symmetry
+
+    state, blocks = primitive.to_gram_matrix_blocks().apply(state)
+    state, basis = polymat.to_shape(primitive.sos_monomial_basis).apply(state)
+
+    # the blocks partition the monomial basis
+    assert 1 < len(blocks)
+    assert sorted(position for block in blocks for position in block) == list(range(basis[0]))
+
+    state, cone_constraints = primitive.to_cone_constraints().apply(state)
+
+    assert len(cone_constraints) == len(blocks)
+
+    problem = sosopt.sos_problem(
+        constraints=(constraint,),
+        solver=sosopt.cvxopt_solver,
+    )
+
+    state, result = problem.solve().apply(state)
+
+    assert result.solver_data.is_successful
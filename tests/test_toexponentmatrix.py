@@ -0,0 +1,119 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from sosopt.utils.toexponentmatrix import (
+    is_row_in,
+    to_bounded_exponents,
+    to_exponent_matrix,
+    to_monomials,
+    to_pair_product_groups,
+    to_row_labels,
+)
+
+
+def to_random_exponents(seed: int, n_rows: int, n_cols: int, max_power: int):
+    return np.random.default_rng(seed).integers(0, max_power + 1, size=(n_rows, n_cols))
+
+
+# the rows of the exponents with large powers can not be encoded as int64 labels
+CASES = tuple(
+    (seed, n_cols, max_power)
+    for seed in range(3)
+    for n_cols, max_power in ((1, 3), (3, 2), (4, 5), (12, 100))
+)
+
+
+@pytest.mark.parametrize('seed, n_cols, max_power', CASES)
+def test_monomials_round_trip(seed, n_cols, max_power):
+    exponents = to_random_exponents(seed, 20, n_cols, max_power)
+    indices = tuple(np.random.default_rng(seed).permutation(n_cols).tolist())
+
+    monomials = to_monomials(exponents, indices)
+
+    # tuple-based conversion
+    for row, monomial in zip(exponents, monomials):
+        assert monomial == tuple(sorted(
+            (index, int(power)) for index, power in zip(indices, row) if power
+        ))
+
+    np.testing.assert_array_equal(to_exponent_matrix(monomials, indices), exponents)
+
+
+@pytest.mark.parametrize('seed, n_cols, max_power', CASES)
+def test_row_labels_identify_rows(seed, n_cols, max_power):
+    exponents = to_random_exponents(seed, 30, n_cols, max_power)
+
+    # repeat some rows
+    exponents = np.vstack((exponents, exponents[::3]))
+    labels = to_row_labels(exponents)
+
+    for i, j in itertools.combinations(range(len(exponents)), 2):
+        assert (labels[i] == labels[j]) == np.array_equal(exponents[i], exponents[j])
+
+
+@pytest.mark.parametrize('seed, n_cols, max_power', CASES)
+def test_is_row_in(seed, n_cols, max_power):
+    exponents = to_random_exponents(seed, 20, n_cols, max_power)
+    others = np.vstack((exponents[::2], to_random_exponents(seed + 100, 10, n_cols, max_power)))
+
+    other_rows = set(map(tuple, others.tolist()))
+
+    np.testing.assert_array_equal(
+        is_row_in(exponents, others),
+        [tuple(row) in other_rows for row in exponents.tolist()],
+    )
+
+
+@pytest.mark.parametrize('seed, n_cols, max_power', CASES)
+def test_pair_product_groups(seed, n_cols, max_power):
+    exponents = to_random_exponents(seed, 8, n_cols, max_power)
+    rows, cols = np.triu_indices(len(exponents))
+
+    products, groups = to_pair_product_groups(exponents, rows, cols)
+
+    # tuple-based grouping in the order of first occurrence
+    expected: dict[tuple[int, ...], list[int]] = {}
+    for k, (row, col) in enumerate(zip(rows, cols)):
+        product = tuple((exponents[row] + exponents[col]).tolist())
+        expected.setdefault(product, []).append(k)
+
+    assert [tuple(product) for product in products.tolist()] == list(expected)
+    assert [group.tolist() for group in groups] == list(expected.values())
+
+
+def test_pair_product_groups_without_pairs():
+    exponents = np.ones((2, 3), dtype=np.int64)
+    empty = np.zeros(0, dtype=np.int64)
+
+    products, groups = to_pair_product_groups(exponents, empty, empty)
+
+    assert products.shape == (0, 3)
+    assert groups == ()
+
+
+@pytest.mark.parametrize('lower, upper, min_degree, max_degree', (
+    ((0, 0), (2, 2), 0, 2),
+    ((0, 1, 0), (3, 2, 2), 2, 4),
+    ((1, 0, 0, 0), (2, 3, 1, 2), 3, 3),
+    ((0, 0, 0), (4, 4, 4), 5, 12),
+    ((0, 0), (1, 1), 3, 4),
+    ((), (), 0, 0),
+))
+def test_bounded_exponents(lower, upper, min_degree, max_degree):
+    exponents = to_bounded_exponents(
+        lower=np.array(lower, dtype=np.int64),
+        upper=np.array(upper, dtype=np.int64),
+        min_degree=min_degree,
+        max_degree=max_degree,
+    )
+
+    # enumerates all exponents within the bounds in lexicographic order
+    expected = [
+        exponent
+        for exponent in itertools.product(*(range(l, u + 1) for l, u in zip(lower, upper)))
+        if min_degree <= sum(exponent) <= max_degree
+    ]
+
+    assert [tuple(row) for row in exponents.tolist()] == expected
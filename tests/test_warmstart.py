@@ -0,0 +1,118 @@
+import mosek
+import numpy as np
+import pytest
+
+import polymat
+
+import sosopt
+
+
+def define_lower_bound_problem(quad_cost: bool = False, extended: bool = False):
+    state = sosopt.init_state(sparse_smr=False)
+
+    x = polymat.define_variable('x')
+    y = polymat.define_variable('y')
+    gamma = sosopt.define_variable('gamma')
+
+    p = x**4 + y**4 + x**2 * y**2 - 2 * x * y + x - y + 1
+
+    state, constraint = sosopt.sos_constraint(
+        name='p',
+        greater_than_zero=p - gamma,
+    ).apply(state)
+
+    constraints = (constraint,)
+    lin_cost = -gamma
+
+    if extended:
+        # adds a variable and a constraint not part of the problem without extension
+        delta = sosopt.define_variable('delta')
+
+        state, constraint = sosopt.sos_constraint(
+            name='q',
+            greater_than_zero=p - gamma - delta * x**2,
+        ).apply(state)
+
+        constraints += (constraint,)
+        lin_cost = lin_cost - delta
+
+    problem = sosopt.sos_problem(
+        lin_cost=lin_cost,
+        # solved by coneqp instead of conelp
+        quad_cost=polymat.v_stack((gamma,)) if quad_cost else None,
+        constraints=constraints,
+        solver=sosopt.cvxopt_solver,
+    )
+
+    return state, problem
+
+
+@pytest.mark.parametrize('quad_cost', (False, True))
+def test_warm_start_reduces_iterations(quad_cost):
+    state, problem = define_lower_bound_problem(quad_cost=quad_cost)
+
+    state, result = problem.solve().apply(state)
+    state, warm_result = problem.solve(warm_start=result).apply(state)
+
+    assert result.solver_data.is_optimal
+    assert warm_result.solver_data.is_optimal
+    assert warm_result.solver_data.iterations < result.solver_data.iterations
+    assert warm_result.solver_data.cost == pytest.approx(result.solver_data.cost, abs=1e-6)
+
+
+def test_warm_start_maps_variables_and_constraints():
+    state, problem = define_lower_bound_problem()
+    state, result = problem.solve().apply(state)
+
+    # the extended problem is defined on a new state with the same variable indices
+    state, extended_problem = define_lower_bound_problem(extended=True)
+    state, conic_problem = extended_problem.to_conic_problem().apply(state)
+    state, solver_args = conic_problem.to_solver_args().apply(state)
+
+    initial_point = solver_args.to_initial_point(result.warm_start)
+
+    positions = result.warm_start.to_index_positions()
+    for position, index in enumerate(solver_args.indices):
+        if index < len(positions) and positions[index] != -1:
+            assert initial_point.x[position] == result.warm_start.primal[positions[index]]
+        else:
+            # the added variable starts at zero
+            assert initial_point.x[position] == 0.0
+
+    start = 0
+    for name, array in zip(solver_args.constraint_names, solver_args.semidef_cone):
+        block = initial_point.z[start:start + array.n_eq]
+        start += array.n_eq
+
+        if name in result.warm_start.dual:
+            np.testing.assert_array_equal(block, result.warm_start.dual[name])
+        else:
+            # the dual of the added constraint starts at the identity
+            size = int(np.sqrt(array.n_eq))
+            np.testing.assert_array_equal(block, np.eye(size).reshape(-1))
+
+    # warm start from the problem without extension and back
+    state, extended_result = extended_problem.solve(warm_start=result).apply(state)
+    assert extended_result.solver_data.is_optimal
+
+    state, problem = define_lower_bound_problem()
+    state, reduced_result = problem.solve(warm_start=extended_result).apply(state)
+    assert reduced_result.solver_data.is_optimal
+    assert reduced_result.solver_data.cost == pytest.approx(result.solver_data.cost, abs=1e-5)
+
+
+def test_mosek_ignores_warm_start_with_warning():
+    state, problem = define_lower_bound_problem()
+    state, result = problem.solve().apply(state)
+
+    state, conic_problem = problem.copy(solver=sosopt.mosek_solver).to_conic_problem().apply(state)
+    state, solver_args = conic_problem.to_solver_args().apply(state)
+
+    initial_point = solver_args.to_initial_point(result.warm_start)
+
+    with pytest.warns(UserWarning, match='does not support warm starts'):
+        try:
+            sosopt.mosek_solver.solve(solver_args, initial_point=initial_point)
+        except mosek.Error:
+            # the warning is emitted before the optimizer, which requires a license
+            pass